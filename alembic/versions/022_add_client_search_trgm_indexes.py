@@ -0,0 +1,39 @@
+"""Add trigram indexes for client search.
+
+The client list search uses ILIKE '%term%' on name, client_number and
+contact_name, which B-tree indexes cannot serve. GIN trigram indexes on
+each column let PostgreSQL answer the OR'ed ILIKEs with a bitmap scan.
+
+The indexes depend on the pg_trgm extension and are therefore only
+created here, not declared on the model.
+
+Revision ID: 022
+Revises: 021
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic
+revision = "022"
+down_revision = "021"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for column in ("name", "client_number", "contact_name"):
+        op.create_index(
+            f"ix_client_{column}_trgm",
+            "clients",
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    for column in ("contact_name", "client_number", "name"):
+        op.drop_index(f"ix_client_{column}_trgm", "clients")
@@ -0,0 +1,34 @@
+"""Add compound indexes on clients for list and stats queries.
+
+Revision ID: 023
+Revises: 022
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic
+revision = "023"
+down_revision = "022"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves list_clients ordering by name within a user
+    op.create_index(
+        "ix_client_user_name",
+        "clients",
+        ["user_id", "name"],
+    )
+    # Serves the active-client filter in get_client_stats
+    op.create_index(
+        "ix_client_user_active",
+        "clients",
+        ["user_id", "is_active"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_client_user_active", "clients")
+    op.drop_index("ix_client_user_name", "clients")
@@ -0,0 +1,44 @@
+"""Store invitation tokens as SHA-256 hashes.
+
+Existing tokens are hashed in place, so pending invitation links keep working.
+The downgrade cannot restore the plain tokens; pending invitations have to be
+sent again afterwards.
+
+Revision ID: 024
+Revises: 023
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic
+revision = "024"
+down_revision = "023"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_organization_invitations_token", table_name="organization_invitations")
+    op.alter_column("organization_invitations", "token", new_column_name="token_hash")
+    op.execute(
+        "UPDATE organization_invitations "
+        "SET token_hash = encode(sha256(convert_to(token_hash, 'UTF8')), 'hex')"
+    )
+    op.create_index(
+        "ix_organization_invitations_token_hash",
+        "organization_invitations",
+        ["token_hash"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_organization_invitations_token_hash", table_name="organization_invitations")
+    op.alter_column("organization_invitations", "token_hash", new_column_name="token")
+    op.create_index(
+        "ix_organization_invitations_token",
+        "organization_invitations",
+        ["token"],
+        unique=True,
+    )
@@ -252,9 +252,32 @@ async def get_current_admin(
     return current_user
 
 
+async def get_client_manager(
+    current_user: Annotated[User, Depends(get_current_user)],
+) -> User:
+    """Get the current user and verify client management access.
+
+    Args:
+        current_user: The authenticated user
+
+    Returns:
+        The User allowed to manage clients
+
+    Raises:
+        HTTPException: If the user's plan does not include client management
+    """
+    if not current_user.can_manage_clients():
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Mandantenverwaltung erfordert den Steuerberater-Plan.",
+        )
+    return current_user
+
+
 # Type aliases for cleaner dependency injection
 CurrentUser = Annotated[User, Depends(get_current_user)]
 OptionalUser = Annotated[User | None, Depends(get_current_user_optional)]
 VerifiedUser = Annotated[User, Depends(get_verified_user)]
 CurrentAdmin = Annotated[User, Depends(get_current_admin)]
+ClientManager = Annotated[User, Depends(get_client_manager)]
 DbSession = Annotated[AsyncSession, Depends(get_db)]
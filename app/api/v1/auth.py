@@ -9,6 +9,7 @@ from sqlalchemy import select
 
 from app.api.deps import CurrentUser, DbSession
 from app.config import get_settings
+from app.core.conversion_cache import delete_user_conversions
 from app.core.security import (
     create_access_token,
     create_password_reset_token,
@@ -652,11 +653,15 @@ async def delete_account(
 ) -> dict[str, str]:
     """Delete current user account (DSGVO right to erasure)."""
     email = current_user.email
+    user_id = str(current_user.id)
 
     # Delete user (cascade will handle related records)
     await db.delete(current_user)
     await db.flush()
 
+    # Converted files are kept outside the database until they expire
+    await delete_user_conversions(user_id)
+
     logger.info(f"Account deleted: {email}")
 
     return {"message": "Konto erfolgreich gelöscht"}
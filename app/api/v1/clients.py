@@ -1,14 +1,33 @@
 """Client management API endpoints (Mandantenverwaltung)."""
 
+import asyncio
+import base64
+import binascii
+import hashlib
+import json
 import logging
+import time
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Request, status
-from sqlalchemy import func, select
-
-from app.api.deps import CurrentUser, DbSession
+from sqlalchemy import delete, func, insert, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
+
+from app.api.deps import ClientManager, DbSession
+from app.core.database import async_session_maker
+from app.core.redis_cache import (
+    cache_delete,
+    cache_delete_pattern,
+    cache_get,
+    cache_set,
+    client_count_cache_key,
+    client_list_cache_key,
+    client_stats_cache_key,
+)
 from app.models.audit import AuditAction
 from app.models.client import Client
+from app.models.validation import ValidationLog
 from app.schemas.client import (
     ClientCreate,
     ClientList,
@@ -23,13 +42,36 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Cache TTL for client statistics (1 minute)
+CLIENT_STATS_CACHE_TTL = 60
+
+# Cache TTL for the per-user client count used by the plan limit check (5 minutes)
+CLIENT_COUNT_CACHE_TTL = 300
+
+# First page of the client list is served stale-while-revalidate: fresh for
+# 15 seconds, then served stale (and refreshed in the background) up to 2 minutes
+CLIENT_LIST_FRESH_SECONDS = 15
+CLIENT_LIST_STALE_SECONDS = 120
+
+# Background refresh tasks for stale client listings, one per cache key
+_refresh_tasks: dict[str, asyncio.Task[None]] = {}
 
-def _check_client_access(user) -> None:
-    """Check if user can manage clients."""
-    if not user.can_manage_clients():
+
+def _encode_cursor(name: str, client_id: UUID) -> str:
+    """Encode the sort key of the last list item as an opaque cursor."""
+    raw = json.dumps([name, str(client_id)]).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[str, UUID]:
+    """Decode a list cursor into its (name, id) sort key or raise 400."""
+    try:
+        name, client_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return str(name), UUID(client_id)
+    except (binascii.Error, TypeError, ValueError):
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Mandantenverwaltung erfordert den Steuerberater-Plan.",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Ungültiger Cursor.",
         )
 
 
@@ -40,18 +82,72 @@ def _check_client_access(user) -> None:
     description="Get all clients for the current user.",
 )
 async def list_clients(
-    current_user: CurrentUser,
+    current_user: ClientManager,
     db: DbSession,
     page: int = 1,
     page_size: int = 20,
     active_only: bool = False,
     search: str | None = None,
+    cursor: str | None = None,
 ) -> ClientList:
-    """List all clients for the current user."""
-    _check_client_access(current_user)
+    """List all clients for the current user.
+
+    Pages can be fetched by ``page`` (offset based) or, for deep pages, by
+    passing the ``next_cursor`` of the previous response as ``cursor``.
+    """
+    # Only the first page of a listing is served from the SWR cache
+    cache_key = None
+    if page == 1 and not cursor:
+        cache_key = client_list_cache_key(str(current_user.id), _client_list_variant(page_size, active_only, search))
+        cached = await cache_get(cache_key)
+        if cached:
+            age = time.time() - cached.pop("cached_at")
+            if age > CLIENT_LIST_FRESH_SECONDS:
+                _schedule_client_list_refresh(current_user.id, cache_key, page_size, active_only, search)
+            return ClientList(
+                **cached,
+                page=page,
+                page_size=page_size,
+                max_clients=current_user.get_max_clients(),
+            )
+
+    items, total, next_cursor = await _fetch_client_page(
+        db, current_user.id, page, page_size, active_only, search, cursor
+    )
+
+    if cache_key:
+        await _cache_client_list(cache_key, items, total, next_cursor)
+
+    return ClientList(
+        items=items,
+        total=total,
+        page=page,
+        page_size=page_size,
+        max_clients=current_user.get_max_clients(),
+        next_cursor=next_cursor,
+    )
 
-    # Build query
-    query = select(Client).where(Client.user_id == current_user.id)
+
+async def _fetch_client_page(
+    db: AsyncSession,
+    user_id: UUID,
+    page: int,
+    page_size: int,
+    active_only: bool,
+    search: str | None,
+    cursor: str | None,
+) -> tuple[list[ClientListItem], int, str | None]:
+    """Query one page of clients, the total match count and the next cursor."""
+    # Build query, selecting only the columns needed for list items
+    query = select(
+        Client.id,
+        Client.name,
+        Client.client_number,
+        Client.is_active,
+        Client.validation_count,
+        Client.last_validation_at,
+        Client.created_at,
+    ).where(Client.user_id == user_id)
 
     if active_only:
         query = query.where(Client.is_active)
@@ -69,32 +165,86 @@ async def list_clients(
     total_result = await db.execute(count_query)
     total = total_result.scalar() or 0
 
-    # Paginate
-    query = query.order_by(Client.name).offset((page - 1) * page_size).limit(page_size)
+    # Paginate: seek past the cursor if given, otherwise fall back to OFFSET
+    query = query.order_by(Client.name, Client.id).limit(page_size)
+    if cursor:
+        last_name, last_id = _decode_cursor(cursor)
+        query = query.where(tuple_(Client.name, Client.id) > tuple_(last_name, last_id))
+    else:
+        query = query.offset((page - 1) * page_size)
 
     result = await db.execute(query)
-    clients = result.scalars().all()
+    items = [ClientListItem.model_validate(row) for row in result]
 
-    return ClientList(
-        items=[
-            ClientListItem(
-                id=client.id,
-                name=client.name,
-                client_number=client.client_number,
-                is_active=client.is_active,
-                validation_count=client.validation_count,
-                last_validation_at=client.last_validation_at,
-                created_at=client.created_at,
-            )
-            for client in clients
-        ],
-        total=total,
-        page=page,
-        page_size=page_size,
-        max_clients=current_user.get_max_clients(),
+    next_cursor = None
+    if len(items) == page_size:
+        next_cursor = _encode_cursor(items[-1].name, items[-1].id)
+
+    return items, total, next_cursor
+
+
+def _client_list_variant(page_size: int, active_only: bool, search: str | None) -> str:
+    """Build the cache key suffix identifying a first-page listing."""
+    search_hash = hashlib.sha256(search.encode()).hexdigest()[:16] if search else ""
+    return f"{page_size}:{int(active_only)}:{search_hash}"
+
+
+async def _cache_client_list(
+    cache_key: str,
+    items: list[ClientListItem],
+    total: int,
+    next_cursor: str | None,
+) -> None:
+    """Store a first-page listing; plan-derived fields are never cached."""
+    await cache_set(
+        cache_key,
+        {
+            "items": [item.model_dump(mode="json") for item in items],
+            "total": total,
+            "next_cursor": next_cursor,
+            "cached_at": time.time(),
+        },
+        ttl_seconds=CLIENT_LIST_STALE_SECONDS,
     )
 
 
+def _schedule_client_list_refresh(
+    user_id: UUID,
+    cache_key: str,
+    page_size: int,
+    active_only: bool,
+    search: str | None,
+) -> None:
+    """Revalidate a stale first-page listing in the background.
+
+    Stale hits on a key that is already being refreshed do not start another
+    query, so a burst of requests does not stampede the database.
+    """
+    if cache_key in _refresh_tasks:
+        return
+
+    async def refresh() -> None:
+        try:
+            async with async_session_maker() as db:
+                items, total, next_cursor = await _fetch_client_page(
+                    db, user_id, 1, page_size, active_only, search, None
+                )
+            await _cache_client_list(cache_key, items, total, next_cursor)
+        except Exception as e:
+            logger.warning("Client list refresh failed for %s: %s", cache_key, e)
+
+    task = asyncio.create_task(refresh())
+    # Keep a reference so the task is not garbage collected mid-flight
+    _refresh_tasks[cache_key] = task
+    task.add_done_callback(lambda _: _refresh_tasks.pop(cache_key, None))
+
+
+async def _invalidate_client_caches(user_id: UUID) -> None:
+    """Drop cached statistics and listings after a client mutation."""
+    await cache_delete(client_stats_cache_key(str(user_id)))
+    await cache_delete_pattern(client_list_cache_key(str(user_id), "*"))
+
+
 @router.get(
     "/stats",
     response_model=ClientStats,
@@ -102,32 +252,35 @@ async def list_clients(
     description="Get statistics about clients.",
 )
 async def get_client_stats(
-    current_user: CurrentUser,
+    current_user: ClientManager,
     db: DbSession,
 ) -> ClientStats:
     """Get client statistics for the current user."""
-    _check_client_access(current_user)
+    cache_key = client_stats_cache_key(str(current_user.id))
+    cached = await cache_get(cache_key)
+    if cached:
+        # max_clients depends on the plan, so it is never cached
+        return ClientStats(**cached, max_clients=current_user.get_max_clients())
 
-    # Total clients
-    total_result = await db.execute(
-        select(func.count(Client.id)).where(Client.user_id == current_user.id)
-    )
-    total_clients = total_result.scalar() or 0
-
-    # Active clients
-    active_result = await db.execute(
-        select(func.count(Client.id)).where(
-            Client.user_id == current_user.id,
-            Client.is_active,
-        )
+    # Total, active and validation count in a single round-trip
+    result = await db.execute(
+        select(
+            func.count(Client.id),
+            func.count(Client.id).filter(Client.is_active.is_(True)),
+            func.coalesce(func.sum(Client.validation_count), 0),
+        ).where(Client.user_id == current_user.id)
     )
-    active_clients = active_result.scalar() or 0
-
-    # Total validations across all clients
-    validations_result = await db.execute(
-        select(func.sum(Client.validation_count)).where(Client.user_id == current_user.id)
+    total_clients, active_clients, total_validations = result.one()
+
+    await cache_set(
+        cache_key,
+        {
+            "total_clients": total_clients,
+            "active_clients": active_clients,
+            "total_validations": total_validations,
+        },
+        ttl_seconds=CLIENT_STATS_CACHE_TTL,
     )
-    total_validations = validations_result.scalar() or 0
 
     return ClientStats(
         total_clients=total_clients,
@@ -146,20 +299,24 @@ async def get_client_stats(
 )
 async def create_client(
     data: ClientCreate,
-    current_user: CurrentUser,
+    current_user: ClientManager,
     db: DbSession,
     request: Request,
 ) -> ClientResponse:
     """Create a new client."""
-    _check_client_access(current_user)
     audit_service = AuditService(db)
 
-    # Check if user has reached max clients
-    count_result = await db.execute(
-        select(func.count(Client.id)).where(Client.user_id == current_user.id)
-    )
-    current_count = count_result.scalar() or 0
+    # Check if user has reached max clients. A cached count is only trusted
+    # while it is below the limit; rejections are always confirmed by the DB.
+    count_cache_key = client_count_cache_key(str(current_user.id))
     max_clients = current_user.get_max_clients()
+    current_count = await cache_get(count_cache_key)
+
+    if current_count is None or current_count >= max_clients:
+        count_result = await db.execute(
+            select(func.count(Client.id)).where(Client.user_id == current_user.id)
+        )
+        current_count = count_result.scalar() or 0
 
     if current_count >= max_clients:
         raise HTTPException(
@@ -167,26 +324,16 @@ async def create_client(
             detail=f"Maximale Anzahl von {max_clients} Mandanten erreicht.",
         )
 
-    # Create client
-    client = Client(
-        user_id=current_user.id,
-        name=data.name,
-        client_number=data.client_number,
-        tax_number=data.tax_number,
-        vat_id=data.vat_id,
-        contact_name=data.contact_name,
-        contact_email=data.contact_email,
-        contact_phone=data.contact_phone,
-        street=data.street,
-        postal_code=data.postal_code,
-        city=data.city,
-        country=data.country,
-        notes=data.notes,
+    # Create client and fetch server-generated columns in a single round-trip
+    result = await db.execute(
+        insert(Client)
+        .values(user_id=current_user.id, **data.model_dump())
+        .returning(Client)
     )
-
-    db.add(client)
+    client = result.scalar_one()
     await db.commit()
-    await db.refresh(client)
+    await _invalidate_client_caches(current_user.id)
+    await cache_set(count_cache_key, current_count + 1, ttl_seconds=CLIENT_COUNT_CACHE_TTL)
 
     # Log audit event
     await audit_service.log(
@@ -198,7 +345,7 @@ async def create_client(
         details={"name": client.name, "client_number": client.client_number},
     )
 
-    logger.info(f"Client created: user={current_user.email}, client={client.name}")
+    logger.info("Client created: user=%s, client=%s", current_user.email, client.name)
 
     return _client_to_response(client)
 
@@ -211,12 +358,10 @@ async def create_client(
 )
 async def get_client(
     client_id: UUID,
-    current_user: CurrentUser,
+    current_user: ClientManager,
     db: DbSession,
 ) -> ClientResponse:
     """Get details for a specific client."""
-    _check_client_access(current_user)
-
     client = await _get_client_or_404(client_id, current_user.id, db)
     return _client_to_response(client)
 
@@ -230,23 +375,34 @@ async def get_client(
 async def update_client(
     client_id: UUID,
     data: ClientUpdate,
-    current_user: CurrentUser,
+    current_user: ClientManager,
     db: DbSession,
     request: Request,
 ) -> ClientResponse:
     """Update a client."""
-    _check_client_access(current_user)
     audit_service = AuditService(db)
 
-    client = await _get_client_or_404(client_id, current_user.id, db)
-
-    # Update fields
     update_data = data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(client, field, value)
+    if not update_data:
+        return _client_to_response(await _get_client_or_404(client_id, current_user.id, db))
+
+    # Update fields and fetch the new row in a single round-trip
+    result = await db.execute(
+        update(Client)
+        .where(Client.id == client_id, Client.user_id == current_user.id)
+        .values(**update_data)
+        .returning(Client)
+    )
+    client = result.scalar_one_or_none()
+
+    if not client:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Mandant nicht gefunden.",
+        )
 
     await db.commit()
-    await db.refresh(client)
+    await _invalidate_client_caches(current_user.id)
 
     # Log audit event
     await audit_service.log(
@@ -258,7 +414,7 @@ async def update_client(
         details={"name": client.name, "updated_fields": list(update_data.keys())},
     )
 
-    logger.info(f"Client updated: user={current_user.email}, client={client.name}")
+    logger.info("Client updated: user=%s, client=%s", current_user.email, client.name)
 
     return _client_to_response(client)
 
@@ -271,19 +427,37 @@ async def update_client(
 )
 async def delete_client(
     client_id: UUID,
-    current_user: CurrentUser,
+    current_user: ClientManager,
     db: DbSession,
     request: Request,
 ) -> None:
     """Delete a client."""
-    _check_client_access(current_user)
     audit_service = AuditService(db)
 
-    client = await _get_client_or_404(client_id, current_user.id, db)
-    client_name = client.name
+    # Validation logs are owned by the client (ORM cascade "delete-orphan"),
+    # but a bulk DELETE bypasses ORM cascades, so remove them explicitly.
+    owned_client = select(Client.id).where(
+        Client.id == client_id,
+        Client.user_id == current_user.id,
+    )
+    await db.execute(delete(ValidationLog).where(ValidationLog.client_id.in_(owned_client)))
+
+    result = await db.execute(
+        delete(Client)
+        .where(Client.id == client_id, Client.user_id == current_user.id)
+        .returning(Client.name)
+    )
+    client_name = result.scalar_one_or_none()
+
+    if client_name is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Mandant nicht gefunden.",
+        )
 
-    await db.delete(client)
     await db.commit()
+    await _invalidate_client_caches(current_user.id)
+    await cache_delete(client_count_cache_key(str(current_user.id)))
 
     # Log audit event
     await audit_service.log(
@@ -295,13 +469,20 @@ async def delete_client(
         details={"name": client_name},
     )
 
-    logger.info(f"Client deleted: user={current_user.email}, client_id={client_id}")
+    logger.info("Client deleted: user=%s, client_id=%s", current_user.email, client_id)
 
 
 async def _get_client_or_404(client_id: UUID, user_id: UUID, db: DbSession) -> Client:
-    """Get a client by ID or raise 404."""
+    """Get a client by ID or raise 404.
+
+    ClientResponse only reads denormalized columns, so relationships are
+    set to raise instead of lazy loading; an accidental access fails loudly
+    rather than issuing extra queries per response.
+    """
     result = await db.execute(
-        select(Client).where(
+        select(Client)
+        .options(raiseload("*"))
+        .where(
             Client.id == client_id,
             Client.user_id == user_id,
         )
@@ -319,23 +500,4 @@ async def _get_client_or_404(client_id: UUID, user_id: UUID, db: DbSession) -> C
 
 def _client_to_response(client: Client) -> ClientResponse:
     """Convert Client model to response schema."""
-    return ClientResponse(
-        id=client.id,
-        name=client.name,
-        client_number=client.client_number,
-        tax_number=client.tax_number,
-        vat_id=client.vat_id,
-        contact_name=client.contact_name,
-        contact_email=client.contact_email,
-        contact_phone=client.contact_phone,
-        street=client.street,
-        postal_code=client.postal_code,
-        city=client.city,
-        country=client.country,
-        notes=client.notes,
-        is_active=client.is_active,
-        validation_count=client.validation_count,
-        last_validation_at=client.last_validation_at,
-        created_at=client.created_at,
-        updated_at=client.updated_at,
-    )
+    return ClientResponse.model_validate(client)
@@ -1,15 +1,29 @@
 """API endpoints for PDF to e-invoice conversion."""
 
+import asyncio
+import hashlib
 import logging
-import uuid
+import secrets
+from collections.abc import Callable, Coroutine
+from operator import attrgetter
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile, status
 from fastapi.responses import Response
+from fastapi.routing import APIRoute
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user
+from app.api.deps import DbSession, get_current_user
 from app.api.deps import get_current_user_optional as get_optional_user
+from app.config import get_settings
+from app.core.conversion_cache import (
+    CachedConversion,
+    conversion_exists,
+    get_conversion,
+    store_conversion,
+)
 from app.core.exceptions import UsageLimitError
-from app.core.limits import check_user_conversion_limit
+from app.core.limits import release_user_conversions, reserve_user_conversion
+from app.core.redis_cache import cache_get, cache_set, conversion_dedup_cache_key
 from app.models.user import User
 from app.schemas.conversion import (
     ConversionRequest,
@@ -20,124 +34,241 @@ from app.schemas.conversion import (
     PreviewResponse,
     SendInvoiceEmailRequest,
     SendInvoiceEmailResponse,
-    ValidationErrorSchema,
     ValidationResultSchema,
     ZUGFeRDProfile,
 )
 from app.services.ai.openai_service import AIRateLimitError
 from app.services.converter.extractor import Address, InvoiceData
-from app.services.converter.service import ConversionService
+from app.services.converter.service import (
+    ConversionResult,
+    ConversionService,
+    convert_in_worker,
+    get_conversion_service,
+    get_process_pool,
+)
 from app.services.converter.service import OutputFormat as ServiceOutputFormat
 from app.services.converter.service import ZUGFeRDProfile as ServiceZUGFeRDProfile
+from app.services.validator.xrechnung import XRechnungValidator
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class _UploadSizeRoute(APIRoute):
+    """Route that rejects oversized uploads by Content-Length before the body is read.
+
+    FastAPI parses multipart bodies before any dependency runs, so a dependency
+    can only reject an upload after it has been received and spooled.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[object, object, Response]]:
+        handler = super().get_route_handler()
+        limit = _REQUEST_SIZE_LIMITS.get(self.name, MAX_UPLOAD_SIZE) + MULTIPART_OVERHEAD
+
+        async def route_handler(request: Request) -> Response:
+            content_length = request.headers.get("content-length", "")
+            if content_length.isdigit() and int(content_length) > limit:
+                raise _upload_too_large()
+            return await handler(request)
+
+        return route_handler
+
+
+router = APIRouter(tags=["conversion"], route_class=_UploadSizeRoute)
+
+# Validator for generated XML
+xrechnung_validator = XRechnungValidator()
+
+# API enums mapped to their converter service counterparts
+_SERVICE_FORMATS = {fmt: ServiceOutputFormat(fmt.value) for fmt in OutputFormat}
+_SERVICE_PROFILES = {profile: ServiceZUGFeRDProfile(profile.value) for profile in ZUGFeRDProfile}
+
+# Download content type by (output format, embed_in_pdf); everything else is XML
+_CONTENT_TYPES = {(OutputFormat.ZUGFERD, True): "application/pdf"}
+
+INVALID_PDF_DETAIL = "Datei ist kein gueltiges PDF"
+
+MAX_UPLOAD_SIZE = 10 * 1024 * 1024  # 10MB limit
+UPLOAD_CHUNK_SIZE = 256 * 1024
+MAX_BATCH_FILES = 10
+
+# Allowance for multipart boundaries, part headers and form fields
+MULTIPART_OVERHEAD = 64 * 1024
+
+# Request body limits by endpoint name; all other routes allow one upload
+_REQUEST_SIZE_LIMITS = {"convert_batch": MAX_BATCH_FILES * MAX_UPLOAD_SIZE}
+
+
+def _is_pdf(filename: str | None) -> bool:
+    """Check for a .pdf extension, case-insensitively, without lowercasing the whole name."""
+    return filename is not None and filename[-4:].lower() == ".pdf"
+
+
+def _has_pdf_signature(content: bytes) -> bool:
+    """Check for the %PDF- header, which readers accept within the first 1 KB."""
+    return b"%PDF-" in content[:1024]
+
+
+def _dedup_key(user: User, scope: str, content: bytes, request: ConversionRequest) -> str:
+    """Build the cache key identifying a conversion of identical input by this user.
+
+    The key covers the PDF bytes and every conversion option and override,
+    since each of them changes the generated output.
+    """
+    digest = hashlib.blake2b(content, digest_size=16)
+    digest.update(f"|{scope}|".encode())
+    digest.update(request.model_dump_json().encode())
+    return conversion_dedup_cache_key(str(user.id), digest.hexdigest())
+
+
+async def _get_deduplicated(key: str) -> ConversionResponse | None:
+    """Return an earlier response for identical input while its file is still stored."""
+    cached = await cache_get(key)
+    if cached is None:
+        return None
+    response = ConversionResponse.model_validate(cached)
+    if not await conversion_exists(response.conversion_id):
+        return None
+    return response
+
 
-router = APIRouter(tags=["conversion"])
+async def _remember_conversion(key: str, response: ConversionResponse) -> None:
+    """Cache a successful response for as long as its converted file is kept."""
+    await cache_set(key, response.model_dump(mode="json"), ttl_seconds=settings.temp_file_ttl_seconds)
 
-# Initialize conversion service
-conversion_service = ConversionService()
 
-# In-memory storage for converted files (would use Redis/S3 in production)
-_conversion_cache: dict[str, tuple[bytes, str, str]] = {}
+async def _release_reserved_conversions(db: AsyncSession, user: User, count: int = 1) -> None:
+    """Give back reserved conversions that did not produce a result."""
+    if count > 0:
+        await release_user_conversions(db, user, count)
+        await db.commit()
+
+
+async def _read_capped(upload: UploadFile, limit: int = MAX_UPLOAD_SIZE) -> bytes:
+    """Read an upload, rejecting it as soon as it is known to exceed the limit.
+
+    The multipart parser has already spooled the upload to a temporary file
+    and recorded its size, so oversized files are rejected without reading
+    them and accepted ones are read in a single copy. Uploads without a
+    recorded size are read in chunks.
+    """
+    if upload.size is not None:
+        if upload.size > limit:
+            raise _upload_too_large()
+        return await upload.read()
+
+    buffer = bytearray()
+    while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+        buffer.extend(chunk)
+        if len(buffer) > limit:
+            raise _upload_too_large()
+    return bytes(buffer)
+
+
+def _upload_too_large() -> HTTPException:
+    """Build the error for uploads over the size limit."""
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail="Datei zu gross. Maximum: 10 MB",
+    )
+
+
+def _address_getter(party: str, field: str) -> Callable[[InvoiceData], object]:
+    """Read one field of the seller/buyer address, None if the address is missing."""
+
+    def get(data: InvoiceData) -> object:
+        address = getattr(data, party)
+        return getattr(address, field) if address else None
+
+    return get
+
+
+def _schema_getter(name: str) -> Callable[[InvoiceData], object]:
+    """Map an ExtractedDataSchema field to the InvoiceData attribute it is read from."""
+    party, _, field = name.partition("_")
+    if party in ("seller", "buyer") and field in Address.__dataclass_fields__:
+        return _address_getter(party, field)
+    return attrgetter(name)
+
+
+# Resolved once at import; the extractor output is already typed, so building the
+# schema with model_construct skips a redundant validation pass per invoice.
+_SCHEMA_GETTERS = tuple((name, _schema_getter(name)) for name in ExtractedDataSchema.model_fields)
 
 
 def _invoice_data_to_schema(data: InvoiceData) -> ExtractedDataSchema:
     """Convert InvoiceData to ExtractedDataSchema."""
-    return ExtractedDataSchema(
+    return ExtractedDataSchema.model_construct(**{name: get(data) for name, get in _SCHEMA_GETTERS})
+
+
+def _to_cached_conversion(result: ConversionResult, content_type: str, user: User) -> CachedConversion:
+    """Build the stored conversion, including the invoice summary used for emails."""
+    data = result.extracted_data
+    return CachedConversion(
+        content=result.content,
+        filename=result.filename,
+        content_type=content_type,
+        xml_content=result.xml_content,
         invoice_number=data.invoice_number,
-        invoice_date=data.invoice_date,
-        due_date=data.due_date,
-        delivery_date=data.delivery_date,
-        seller_name=data.seller.name if data.seller else None,
-        seller_street=data.seller.street if data.seller else None,
-        seller_postal_code=data.seller.postal_code if data.seller else None,
-        seller_city=data.seller.city if data.seller else None,
-        seller_vat_id=data.seller_vat_id,
-        seller_tax_id=data.seller_tax_id,
-        buyer_name=data.buyer.name if data.buyer else None,
-        buyer_street=data.buyer.street if data.buyer else None,
-        buyer_postal_code=data.buyer.postal_code if data.buyer else None,
-        buyer_city=data.buyer.city if data.buyer else None,
-        buyer_reference=data.buyer_reference,
-        net_amount=data.net_amount,
-        vat_amount=data.vat_amount,
-        gross_amount=data.gross_amount,
+        invoice_date=data.invoice_date.isoformat() if data.invoice_date else None,
+        gross_amount=f"{data.gross_amount:.2f}" if data.gross_amount is not None else None,
         currency=data.currency,
-        iban=data.iban,
-        bic=data.bic,
-        bank_name=data.bank_name,
-        payment_reference=data.payment_reference,
-        leitweg_id=data.leitweg_id,
-        order_reference=data.order_reference,
-        confidence=data.confidence,
-        warnings=data.warnings,
+        user_id=str(user.id),
     )
 
 
+# ConversionRequest fields copied onto InvoiceData by _apply_overrides when set
+_OVERRIDE_FIELDS = (
+    "invoice_number",
+    "invoice_date",
+    "due_date",
+    "delivery_date",
+    "seller_vat_id",
+    "buyer_reference",
+    "iban",
+    "bic",
+    "leitweg_id",
+)
+_OVERRIDE_AMOUNT_FIELDS = ("net_amount", "vat_amount", "gross_amount")
+_OVERRIDE_ADDRESS_FIELDS = {
+    party: tuple((f"{party}_{field}", field) for field in ("name", "street", "postal_code", "city"))
+    for party in ("seller", "buyer")
+}
+
+
 def _apply_overrides(data: InvoiceData, request: ConversionRequest) -> InvoiceData:
     """Apply user overrides to extracted data."""
-    if request.invoice_number:
-        data.invoice_number = request.invoice_number
-    if request.invoice_date:
-        data.invoice_date = request.invoice_date
-    if request.due_date:
-        data.due_date = request.due_date
-    if request.delivery_date:
-        data.delivery_date = request.delivery_date
-
-    # Seller overrides
-    if request.seller_name or request.seller_street or request.seller_postal_code or request.seller_city:
-        if not data.seller:
-            data.seller = Address(name="")
-        if request.seller_name:
-            data.seller.name = request.seller_name
-        if request.seller_street:
-            data.seller.street = request.seller_street
-        if request.seller_postal_code:
-            data.seller.postal_code = request.seller_postal_code
-        if request.seller_city:
-            data.seller.city = request.seller_city
-
-    if request.seller_vat_id:
-        data.seller_vat_id = request.seller_vat_id
-
-    # Buyer overrides
-    if request.buyer_name or request.buyer_street or request.buyer_postal_code or request.buyer_city:
-        if not data.buyer:
-            data.buyer = Address(name="")
-        if request.buyer_name:
-            data.buyer.name = request.buyer_name
-        if request.buyer_street:
-            data.buyer.street = request.buyer_street
-        if request.buyer_postal_code:
-            data.buyer.postal_code = request.buyer_postal_code
-        if request.buyer_city:
-            data.buyer.city = request.buyer_city
-
-    if request.buyer_reference:
-        data.buyer_reference = request.buyer_reference
-
-    # Amount overrides
-    if request.net_amount is not None:
-        data.net_amount = request.net_amount
-    if request.vat_amount is not None:
-        data.vat_amount = request.vat_amount
-    if request.gross_amount is not None:
-        data.gross_amount = request.gross_amount
-
-    # Bank details
-    if request.iban:
-        data.iban = request.iban
-    if request.bic:
-        data.bic = request.bic
-    if request.leitweg_id:
-        data.leitweg_id = request.leitweg_id
+    for field in _OVERRIDE_FIELDS:
+        value = getattr(request, field)
+        if value:
+            setattr(data, field, value)
+
+    # Amounts may legitimately be overridden with zero
+    for field in _OVERRIDE_AMOUNT_FIELDS:
+        value = getattr(request, field)
+        if value is not None:
+            setattr(data, field, value)
+
+    # Seller/buyer address overrides
+    for party, fields in _OVERRIDE_ADDRESS_FIELDS.items():
+        values = [(attr, getattr(request, source)) for source, attr in fields]
+        if not any(value for _, value in values):
+            continue
+        address = getattr(data, party)
+        if not address:
+            address = Address(name="")
+            setattr(data, party, address)
+        for attr, value in values:
+            if value:
+                setattr(address, attr, value)
 
     return data
 
 
 @router.get("/status", response_model=ConversionStatusResponse)
-async def get_conversion_status() -> ConversionStatusResponse:
+async def get_conversion_status(
+    conversion_service: ConversionService = Depends(get_conversion_service),
+) -> ConversionStatusResponse:
     """
     Get conversion service status and capabilities.
 
@@ -155,6 +286,7 @@ async def get_conversion_status() -> ConversionStatusResponse:
 async def preview_extraction(
     file: UploadFile = File(...),
     current_user: User | None = Depends(get_optional_user),
+    conversion_service: ConversionService = Depends(get_conversion_service),
 ) -> PreviewResponse:
     """
     Preview extracted data from a PDF without converting.
@@ -162,26 +294,23 @@ async def preview_extraction(
     Allows users to see what data was extracted before conversion.
     """
     # Validate file type
-    if not file.filename or not file.filename.lower().endswith(".pdf"):
+    if not _is_pdf(file.filename):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Nur PDF-Dateien werden unterstuetzt",
         )
 
     # Read file
-    content = await file.read()
-    if len(content) > 10 * 1024 * 1024:  # 10MB limit
+    content = await _read_capped(file)
+    if not _has_pdf_signature(content):
         raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail="Datei zu gross. Maximum: 10 MB",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=INVALID_PDF_DETAIL,
         )
 
-    # Check if scanned
-    is_scanned = conversion_service.ocr_service.is_scanned_pdf(content)
-
-    # Extract data (using AI if available)
+    # Extract data (using AI if available); scan detection happens in the same pass
     try:
-        data = await conversion_service.preview_extraction_async(content)
+        data, is_scanned = await conversion_service.preview_extraction_async(content)
     except AIRateLimitError as e:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -203,6 +332,7 @@ async def preview_extraction(
 
 @router.post("/", response_model=ConversionResponse)
 async def convert_pdf(
+    db: DbSession,
     file: UploadFile = File(...),
     output_format: OutputFormat = Form(OutputFormat.XRECHNUNG),
     zugferd_profile: ZUGFeRDProfile = Form(ZUGFeRDProfile.EN16931),
@@ -213,38 +343,30 @@ async def convert_pdf(
     buyer_reference: str | None = Form(None),
     leitweg_id: str | None = Form(None),
     current_user: User = Depends(get_current_user),
+    conversion_service: ConversionService = Depends(get_conversion_service),
 ) -> ConversionResponse:
     """
     Convert a PDF invoice to XRechnung or ZUGFeRD format.
 
     Requires authentication. Usage is counted against plan limits.
     """
-    # Check conversion limits
-    try:
-        await check_user_conversion_limit(current_user)
-    except UsageLimitError as e:
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail=str(e),
-        )
-
     # Validate file type
-    if not file.filename or not file.filename.lower().endswith(".pdf"):
+    if not _is_pdf(file.filename):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Nur PDF-Dateien werden unterstuetzt",
         )
 
     # Read file
-    content = await file.read()
-    if len(content) > 10 * 1024 * 1024:  # 10MB limit
+    content = await _read_capped(file)
+    if not _has_pdf_signature(content):
         raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail="Datei zu gross. Maximum: 10 MB",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=INVALID_PDF_DETAIL,
         )
 
     # Build conversion request
-    ConversionRequest(
+    conversion_request = ConversionRequest(
         output_format=output_format,
         zugferd_profile=zugferd_profile,
         embed_in_pdf=embed_in_pdf,
@@ -254,95 +376,69 @@ async def convert_pdf(
         leitweg_id=leitweg_id,
     )
 
+    # Identical uploads are answered from the earlier conversion
+    dedup_key = _dedup_key(current_user, "single", content, conversion_request)
+    cached_response = await _get_deduplicated(dedup_key)
+    if cached_response is not None:
+        return cached_response
+
+    # Reserve the conversion against plan limits; given back if it fails
+    try:
+        await reserve_user_conversion(db, current_user)
+    except UsageLimitError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e),
+        )
+    await db.commit()
+
     # Perform conversion (using AI-enhanced extraction if available)
     try:
         result = await conversion_service.convert_async(
             pdf_content=content,
-            output_format=ServiceOutputFormat(output_format.value),
-            zugferd_profile=ServiceZUGFeRDProfile(zugferd_profile.value),
+            output_format=_SERVICE_FORMATS[output_format],
+            zugferd_profile=_SERVICE_PROFILES[zugferd_profile],
             embed_in_pdf=embed_in_pdf,
         )
     except AIRateLimitError as e:
+        await _release_reserved_conversions(db, current_user)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=e.message,
         )
+    except Exception:
+        await _release_reserved_conversions(db, current_user)
+        raise
 
     if not result.success:
+        await _release_reserved_conversions(db, current_user)
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail=result.error or "Konvertierung fehlgeschlagen",
         )
 
     # Store result for download
-    conversion_id = str(uuid.uuid4())
-    content_type = (
-        "application/pdf"
-        if output_format == OutputFormat.ZUGFERD and embed_in_pdf
-        else "application/xml"
-    )
-    _conversion_cache[conversion_id] = (result.content, result.filename, content_type, result.xml_content)
+    conversion_id = secrets.token_urlsafe(16)
+    content_type = _CONTENT_TYPES.get((output_format, embed_in_pdf), "application/xml")
+    await store_conversion(conversion_id, _to_cached_conversion(result, content_type, current_user))
 
     # Auto-validate the generated XML
     validation_result = None
     if result.xml_content:
         try:
-            from app.services.validator.xrechnung import XRechnungValidator
-
-            validator = XRechnungValidator()
-            val_response = await validator.validate(
+            val_response = await xrechnung_validator.validate(
                 content=result.xml_content,
                 filename=result.filename,
                 user_id=current_user.id if current_user else None,
             )
 
             # Convert ValidationResponse to ValidationResultSchema
-            validation_result = ValidationResultSchema(
-                is_valid=val_response.is_valid,
-                error_count=val_response.error_count,
-                warning_count=val_response.warning_count,
-                info_count=val_response.info_count,
-                errors=[
-                    ValidationErrorSchema(
-                        severity=e.severity.value,
-                        code=e.code,
-                        message_de=e.message_de,
-                        message_en=e.message_en,
-                        location=e.location,
-                        suggestion=e.suggestion,
-                    )
-                    for e in val_response.errors
-                ],
-                warnings=[
-                    ValidationErrorSchema(
-                        severity=w.severity.value,
-                        code=w.code,
-                        message_de=w.message_de,
-                        message_en=w.message_en,
-                        location=w.location,
-                        suggestion=w.suggestion,
-                    )
-                    for w in val_response.warnings
-                ],
-                infos=[
-                    ValidationErrorSchema(
-                        severity=i.severity.value,
-                        code=i.code,
-                        message_de=i.message_de,
-                        message_en=i.message_en,
-                        location=i.location,
-                        suggestion=i.suggestion,
-                    )
-                    for i in val_response.infos
-                ],
-                validator_version=val_response.validator_version,
-                processing_time_ms=val_response.processing_time_ms,
-            )
+            validation_result = ValidationResultSchema.model_validate(val_response)
         except Exception as e:
             logger.warning(f"Auto-validation failed: {e}")
             # Don't fail conversion if validation fails
 
-    return ConversionResponse(
+    response = ConversionResponse(
         success=True,
         conversion_id=conversion_id,
         filename=result.filename,
@@ -351,6 +447,8 @@ async def convert_pdf(
         warnings=result.warnings,
         validation_result=validation_result,
     )
+    await _remember_conversion(dedup_key, response)
+    return response
 
 
 @router.get("/{conversion_id}/download")
@@ -363,19 +461,18 @@ async def download_converted_file(
 
     The conversion_id is returned from the convert endpoint.
     """
-    if conversion_id not in _conversion_cache:
+    conversion = await get_conversion(conversion_id)
+    if conversion is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Konvertierung nicht gefunden oder abgelaufen",
         )
 
-    content, filename, content_type, _ = _conversion_cache[conversion_id]
-
     return Response(
-        content=content,
-        media_type=content_type,
+        content=conversion.content,
+        media_type=conversion.content_type,
         headers={
-            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Content-Disposition": f'attachment; filename="{conversion.filename}"',
         },
     )
 
@@ -390,14 +487,14 @@ async def preview_xml(
 
     Returns the raw XML for XRechnung, or the XML that was embedded for ZUGFeRD.
     """
-    if conversion_id not in _conversion_cache:
+    conversion = await get_conversion(conversion_id)
+    if conversion is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Konvertierung nicht gefunden oder abgelaufen",
         )
 
-    _, _, _, xml_content = _conversion_cache[conversion_id]
-
+    xml_content = conversion.xml_content
     if not xml_content:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -415,6 +512,7 @@ async def preview_xml(
 
 @router.post("/batch", response_model=list[ConversionResponse])
 async def convert_batch(
+    db: DbSession,
     files: list[UploadFile] = File(...),
     output_format: OutputFormat = Form(OutputFormat.XRECHNUNG),
     zugferd_profile: ZUGFeRDProfile = Form(ZUGFeRDProfile.EN16931),
@@ -426,7 +524,7 @@ async def convert_batch(
     Requires Starter plan or higher.
     """
     # Check batch limit (max 10 files)
-    if len(files) > 10:
+    if len(files) > MAX_BATCH_FILES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Maximal 10 Dateien pro Batch",
@@ -439,69 +537,26 @@ async def convert_batch(
             detail="Batch-Upload erfordert Starter-Plan oder hoeher",
         )
 
-    results = []
+    # Check file types and reserve one conversion per file up front; files
+    # are converted afterwards in parallel, with results kept in upload order.
+    results: list[ConversionResponse | None] = []
+    pending: list[tuple[int, UploadFile]] = []
     for file in files:
-        try:
-            # Check limits for each file
-            await check_user_conversion_limit(current_user)
-
-            if not file.filename or not file.filename.lower().endswith(".pdf"):
-                results.append(
-                    ConversionResponse(
-                        success=False,
-                        conversion_id="",
-                        filename=file.filename or "unknown",
-                        output_format=output_format,
-                        extracted_data=ExtractedDataSchema(),
-                        error="Nur PDF-Dateien werden unterstuetzt",
-                    )
+        if not _is_pdf(file.filename):
+            results.append(
+                ConversionResponse(
+                    success=False,
+                    conversion_id="",
+                    filename=file.filename or "unknown",
+                    output_format=output_format,
+                    extracted_data=ExtractedDataSchema(),
+                    error="Nur PDF-Dateien werden unterstuetzt",
                 )
-                continue
-
-            content = await file.read()
-            result = conversion_service.convert(
-                pdf_content=content,
-                output_format=ServiceOutputFormat(output_format.value),
-                zugferd_profile=ServiceZUGFeRDProfile(zugferd_profile.value),
             )
+            continue
 
-            if result.success:
-                conversion_id = str(uuid.uuid4())
-                content_type = (
-                    "application/pdf"
-                    if output_format == OutputFormat.ZUGFERD
-                    else "application/xml"
-                )
-                _conversion_cache[conversion_id] = (
-                    result.content,
-                    result.filename,
-                    content_type,
-                    result.xml_content,
-                )
-
-                results.append(
-                    ConversionResponse(
-                        success=True,
-                        conversion_id=conversion_id,
-                        filename=result.filename,
-                        output_format=output_format,
-                        extracted_data=_invoice_data_to_schema(result.extracted_data),
-                        warnings=result.warnings,
-                    )
-                )
-            else:
-                results.append(
-                    ConversionResponse(
-                        success=False,
-                        conversion_id="",
-                        filename=file.filename or "unknown",
-                        output_format=output_format,
-                        extracted_data=_invoice_data_to_schema(result.extracted_data),
-                        warnings=result.warnings,
-                        error=result.error,
-                    )
-                )
-
+        try:
+            await reserve_user_conversion(db, current_user)
         except UsageLimitError as e:
             results.append(
                 ConversionResponse(
@@ -515,7 +570,98 @@ async def convert_batch(
             )
             break  # Stop processing if limit reached
 
-    return results
+        pending.append((len(results), file))
+        results.append(None)
+    await db.commit()
+
+    try:
+        contents = await asyncio.gather(*[_read_capped(file) for _, file in pending])
+
+        # Reject mislabeled uploads before they reach the converter
+        batch_request = ConversionRequest(output_format=output_format, zugferd_profile=zugferd_profile)
+        candidates: list[tuple[int, UploadFile, bytes, str]] = []
+        for (index, file), content in zip(pending, contents, strict=True):
+            if _has_pdf_signature(content):
+                dedup_key = _dedup_key(current_user, "batch", content, batch_request)
+                candidates.append((index, file, content, dedup_key))
+            else:
+                results[index] = ConversionResponse(
+                    success=False,
+                    conversion_id="",
+                    filename=file.filename or "unknown",
+                    output_format=output_format,
+                    extracted_data=ExtractedDataSchema(),
+                    error=INVALID_PDF_DETAIL,
+                )
+
+        # Identical uploads are answered from earlier conversions
+        cached_responses = await asyncio.gather(
+            *[_get_deduplicated(dedup_key) for *_, dedup_key in candidates]
+        )
+        to_convert: list[tuple[int, UploadFile, str]] = []
+        to_convert_contents: list[bytes] = []
+        for (index, file, content, dedup_key), cached_response in zip(
+            candidates, cached_responses, strict=True
+        ):
+            if cached_response is not None:
+                results[index] = cached_response
+            else:
+                to_convert.append((index, file, dedup_key))
+                to_convert_contents.append(content)
+
+        loop = asyncio.get_running_loop()
+        pool = get_process_pool()
+        service_format = _SERVICE_FORMATS[output_format]
+        service_profile = _SERVICE_PROFILES[zugferd_profile]
+        conversions = await asyncio.gather(
+            *[
+                loop.run_in_executor(
+                    pool,
+                    convert_in_worker,
+                    content,
+                    service_format,
+                    service_profile,
+                )
+                for content in to_convert_contents
+            ]
+        )
+    except Exception:
+        await _release_reserved_conversions(db, current_user, len(pending))
+        raise
+
+    # Give back reservations for rejected, deduplicated and failed files
+    failed = len(pending) - sum(1 for result in conversions if result.success)
+    await _release_reserved_conversions(db, current_user, failed)
+
+    for (index, file, dedup_key), result in zip(to_convert, conversions, strict=True):
+        if result.success:
+            conversion_id = secrets.token_urlsafe(16)
+            # Batch conversions always embed ZUGFeRD XML in the PDF
+            content_type = _CONTENT_TYPES.get((output_format, True), "application/xml")
+            await store_conversion(conversion_id, _to_cached_conversion(result, content_type, current_user))
+
+            response = ConversionResponse(
+                success=True,
+                conversion_id=conversion_id,
+                filename=result.filename,
+                output_format=output_format,
+                extracted_data=_invoice_data_to_schema(result.extracted_data),
+                warnings=result.warnings,
+            )
+            await _remember_conversion(dedup_key, response)
+            results[index] = response
+        else:
+            results[index] = ConversionResponse(
+                success=False,
+                conversion_id="",
+                filename=file.filename or "unknown",
+                output_format=output_format,
+                extracted_data=_invoice_data_to_schema(result.extracted_data),
+                warnings=result.warnings,
+                error=result.error,
+            )
+
+    return [result for result in results if result is not None]
 
 
 @router.post("/{conversion_id}/send-email", response_model=SendInvoiceEmailResponse)
@@ -531,15 +677,15 @@ async def send_invoice_email(
     """
     from app.services.email.service import email_service
 
-    # Check if conversion exists
-    if conversion_id not in _conversion_cache:
+    # Get cached conversion data
+    conversion = await get_conversion(conversion_id)
+    if conversion is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Konvertierung nicht gefunden oder abgelaufen",
         )
 
-    # Get cached conversion data
-    content, filename, content_type, xml_content = _conversion_cache[conversion_id]
+    content, filename = conversion.content, conversion.filename
 
     # Need at least one recipient
     if not request.recipient_email and not request.send_copy_to_self:
@@ -548,47 +694,13 @@ async def send_invoice_email(
             detail="Bitte geben Sie eine Empfaenger-E-Mail an oder waehlen Sie 'Kopie an mich senden'",
         )
 
-    # Extract invoice details from XML for email
-    invoice_number = "Unbekannt"
-    invoice_date = "Unbekannt"
-    gross_amount = "0.00"
-    currency = "EUR"
+    # Invoice details were stored alongside the converted file
+    invoice_number = conversion.invoice_number or "Unbekannt"
+    invoice_date = conversion.invoice_date or "Unbekannt"
+    gross_amount = conversion.gross_amount or "0.00"
+    currency = conversion.currency
     output_format = "XRechnung" if filename.endswith(".xml") else "ZUGFeRD"
 
-    # Try to parse invoice data from XML
-    if xml_content:
-        try:
-            import xml.etree.ElementTree as ET
-            root = ET.fromstring(xml_content)
-            ns = {
-                'cbc': 'urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2',
-                'ram': 'urn:un:unece:uncefact:data:standard:ReusableAggregateBusinessInformationEntity:100',
-            }
-
-            # Try UBL (XRechnung)
-            inv_id = root.find('.//cbc:ID', ns)
-            if inv_id is not None and inv_id.text:
-                invoice_number = inv_id.text
-
-            issue_date = root.find('.//cbc:IssueDate', ns)
-            if issue_date is not None and issue_date.text:
-                invoice_date = issue_date.text
-
-            payable = root.find('.//cbc:PayableAmount', ns)
-            if payable is not None and payable.text:
-                gross_amount = payable.text
-                if payable.get('currencyID'):
-                    currency = payable.get('currencyID')
-
-            # Try CII (ZUGFeRD) if UBL didn't work
-            if invoice_number == "Unbekannt":
-                inv_id = root.find('.//ram:ID', ns)
-                if inv_id is not None and inv_id.text:
-                    invoice_number = inv_id.text
-
-        except Exception as e:
-            logger.warning(f"Could not parse invoice XML for email: {e}")
-
     # Prepare recipients list
     recipients = []
     if request.recipient_email:
@@ -597,24 +709,30 @@ async def send_invoice_email(
         if current_user.email not in recipients:
             recipients.append(current_user.email)
 
-    # Send emails
-    emails_sent = 0
+    # Send emails to all recipients concurrently
     sender_name = current_user.full_name or current_user.company_name or "RechnungsChecker Benutzer"
 
-    for recipient in recipients:
-        success = await email_service.send_invoice_email(
-            to=recipient,
-            sender_name=sender_name,
-            invoice_number=invoice_number,
-            invoice_date=invoice_date,
-            gross_amount=gross_amount,
-            currency=currency,
-            output_format=output_format,
-            file_content=content,
-            filename=filename,
-        )
-        if success:
-            emails_sent += 1
+    send_results = await asyncio.gather(
+        *[
+            email_service.send_invoice_email(
+                to=recipient,
+                sender_name=sender_name,
+                invoice_number=invoice_number,
+                invoice_date=invoice_date,
+                gross_amount=gross_amount,
+                currency=currency,
+                output_format=output_format,
+                file_content=content,
+                filename=filename,
+            )
+            for recipient in recipients
+        ],
+        return_exceptions=True,
+    )
+    for recipient, send_result in zip(recipients, send_results, strict=True):
+        if isinstance(send_result, BaseException):
+            logger.error(f"Failed to send invoice email to {recipient}: {send_result}")
+    emails_sent = sum(1 for send_result in send_results if send_result is True)
 
     if emails_sent == 0:
         raise HTTPException(
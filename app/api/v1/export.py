@@ -1,11 +1,14 @@
 """CSV export endpoints for DATEV and Excel compatibility."""
 
+import gzip
 import logging
+import zlib
+from collections.abc import AsyncIterator
 from datetime import date
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query, status
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import Response, StreamingResponse
 
 from app.api.deps import CurrentUser, DbSession
 from app.models.user import PlanType
@@ -17,6 +20,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# CSV compresses well even at the fastest level; higher levels cost far more CPU
+EXPORT_GZIP_LEVEL = 1
+
 
 def _check_export_access(user) -> None:
     """Check if user can access export features."""
@@ -27,6 +33,54 @@ def _check_export_access(user) -> None:
         )
 
 
+def _accepts_gzip(request: Request) -> bool:
+    """Check whether the client accepts a gzip-encoded response."""
+    return "gzip" in request.headers.get("accept-encoding", "")
+
+
+async def _gzip_chunks(chunks: AsyncIterator[str]) -> AsyncIterator[bytes]:
+    """Compress streamed CSV chunks into a single gzip stream."""
+    compressor = zlib.compressobj(EXPORT_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _csv_response(request: Request, content: str | AsyncIterator[str], filename: str) -> Response:
+    """Build the CSV download response, gzip-compressed if the client accepts it.
+
+    Args:
+        request: Incoming request, used for Accept-Encoding negotiation
+        content: Complete CSV text or a stream of CSV chunks
+        filename: Download filename
+
+    Returns:
+        Response for complete content (with Content-Length), StreamingResponse otherwise
+    """
+    headers = {
+        "Content-Disposition": f'attachment; filename="{filename}"',
+        "Content-Type": "text/csv; charset=utf-8",
+        "Vary": "Accept-Encoding",
+    }
+    compress = _accepts_gzip(request)
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+
+    if isinstance(content, str):
+        body = content.encode("utf-8")
+        if compress:
+            body = gzip.compress(body, compresslevel=EXPORT_GZIP_LEVEL)
+        return Response(body, media_type="text/csv; charset=utf-8", headers=headers)
+
+    return StreamingResponse(
+        _gzip_chunks(content) if compress else content,
+        media_type="text/csv; charset=utf-8",
+        headers=headers,
+    )
+
+
 @router.get(
     "/validations",
     summary="Export validations as CSV",
@@ -39,6 +93,7 @@ def _check_export_access(user) -> None:
     },
 )
 async def export_validations(
+    request: Request,
     current_user: CurrentUser,
     db: DbSession,
     client_id: UUID | None = Query(default=None, description="Filter by client ID"),
@@ -46,7 +101,7 @@ async def export_validations(
     date_to: date | None = Query(default=None, description="End date (inclusive)"),
     status: ValidationStatus = Query(default=ValidationStatus.ALL, description="Filter by status"),
     format: ExportFormat = Query(default=ExportFormat.CSV_DATEV, description="Export format"),
-) -> StreamingResponse:
+) -> Response:
     """Export validation history as CSV file.
 
     Args:
@@ -62,7 +117,7 @@ async def export_validations(
     _check_export_access(current_user)
 
     service = ExportService(db)
-    csv_content = await service.export_validations(
+    csv_chunks = service.export_validations(
         user_id=current_user.id,
         client_id=client_id,
         date_from=date_from,
@@ -80,14 +135,7 @@ async def export_validations(
         f"format={format.value}, client_id={client_id}"
     )
 
-    return StreamingResponse(
-        iter([csv_content]),
-        media_type="text/csv; charset=utf-8",
-        headers={
-            "Content-Disposition": f'attachment; filename="{filename}"',
-            "Content-Type": "text/csv; charset=utf-8",
-        },
-    )
+    return _csv_response(request, csv_chunks, filename)
 
 
 @router.get(
@@ -102,13 +150,14 @@ async def export_validations(
     },
 )
 async def export_clients(
+    request: Request,
     current_user: CurrentUser,
     db: DbSession,
     include_inactive: bool = Query(default=False, description="Include inactive clients"),
     date_from: date | None = Query(default=None, description="Filter validation stats from date"),
     date_to: date | None = Query(default=None, description="Filter validation stats to date"),
     format: ExportFormat = Query(default=ExportFormat.CSV_DATEV, description="Export format"),
-) -> StreamingResponse:
+) -> Response:
     """Export client list with validation statistics as CSV file.
 
     Args:
@@ -123,7 +172,7 @@ async def export_clients(
     _check_export_access(current_user)
 
     service = ExportService(db)
-    csv_content = await service.export_clients(
+    csv_chunks = service.export_clients(
         user_id=current_user.id,
         include_inactive=include_inactive,
         date_from=date_from,
@@ -140,14 +189,7 @@ async def export_clients(
         f"format={format.value}, include_inactive={include_inactive}"
     )
 
-    return StreamingResponse(
-        iter([csv_content]),
-        media_type="text/csv; charset=utf-8",
-        headers={
-            "Content-Disposition": f'attachment; filename="{filename}"',
-            "Content-Type": "text/csv; charset=utf-8",
-        },
-    )
+    return _csv_response(request, csv_chunks, filename)
 
 
 @router.get(
@@ -162,6 +204,7 @@ async def export_clients(
     },
 )
 async def export_datev_buchungsstapel(
+    request: Request,
     current_user: CurrentUser,
     db: DbSession,
     validation_ids: list[UUID] = Query(..., description="List of validation IDs to export"),
@@ -171,7 +214,7 @@ async def export_datev_buchungsstapel(
     debitor_konto: str = Query(default="1400", description="Debtor account number"),
     berater_nummer: str = Query(default="", description="DATEV consultant number"),
     mandanten_nummer: str = Query(default="", description="DATEV client number"),
-) -> StreamingResponse:
+) -> Response:
     """Export validated invoices as DATEV Buchungsstapel CSV file.
 
     This endpoint generates a DATEV-compatible CSV file in EXTF format
@@ -220,11 +263,4 @@ async def export_datev_buchungsstapel(
         f"buchungen={buchungen_count}, total={total_umsatz}"
     )
 
-    return StreamingResponse(
-        iter([csv_content]),
-        media_type="text/csv; charset=utf-8",
-        headers={
-            "Content-Disposition": f'attachment; filename="{filename}"',
-            "Content-Type": "text/csv; charset=utf-8",
-        },
-    )
+    return _csv_response(request, csv_content, filename)
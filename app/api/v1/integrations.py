@@ -6,7 +6,7 @@ from uuid import UUID
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, status
 
 from app.api.deps import CurrentUser, DbSession
-from app.models.integration import IntegrationType
+from app.models.integration import IntegrationSettings, IntegrationType
 from app.schemas.integration import (
     IntegrationCreate,
     IntegrationList,
@@ -17,6 +17,7 @@ from app.schemas.integration import (
     LexofficeFetchResult,
     LexofficeInvoiceList,
 )
+from app.schemas.integration import IntegrationType as SchemaIntegrationType
 from app.services.integrations.lexoffice import lexoffice_service
 from app.services.integrations.notifications import notification_service
 from app.services.integrations.service import IntegrationService
@@ -35,6 +36,30 @@ def _check_integration_access(user) -> None:
         )
 
 
+def _integration_to_response(integration: IntegrationSettings) -> IntegrationResponse:
+    """Build the response for a loaded integration row.
+
+    The values come straight from typed model columns, so the response is
+    constructed without running field validation again. Only the integration
+    type needs converting, since the schema declares its own enum.
+    """
+    return IntegrationResponse.model_construct(
+        id=integration.id,
+        integration_type=SchemaIntegrationType(integration.integration_type.value),
+        is_enabled=integration.is_enabled,
+        notify_on_valid=integration.notify_on_valid,
+        notify_on_invalid=integration.notify_on_invalid,
+        notify_on_warning=integration.notify_on_warning,
+        last_used_at=integration.last_used_at,
+        total_requests=integration.total_requests,
+        successful_requests=integration.successful_requests,
+        failed_requests=integration.failed_requests,
+        created_at=integration.created_at,
+        updated_at=integration.updated_at,
+        config_hint=IntegrationService.get_config_hint(integration),
+    )
+
+
 # --- General Integration CRUD ---
 
 
@@ -55,24 +80,7 @@ async def list_integrations(
     integrations = await service.list_integrations(current_user.id)
 
     return IntegrationList(
-        items=[
-            IntegrationResponse(
-                id=i.id,
-                integration_type=i.integration_type,
-                is_enabled=i.is_enabled,
-                notify_on_valid=i.notify_on_valid,
-                notify_on_invalid=i.notify_on_invalid,
-                notify_on_warning=i.notify_on_warning,
-                last_used_at=i.last_used_at,
-                total_requests=i.total_requests,
-                successful_requests=i.successful_requests,
-                failed_requests=i.failed_requests,
-                created_at=i.created_at,
-                updated_at=i.updated_at,
-                config_hint=service.get_config_hint(i),
-            )
-            for i in integrations
-        ]
+        items=[_integration_to_response(i) for i in integrations]
     )
 
 
@@ -133,28 +141,13 @@ async def create_integration(
         notify_on_warning=data.notify_on_warning,
     )
     await db.commit()
-    await db.refresh(integration)
 
     logger.info(
         f"Integration configured: user={current_user.email}, "
         f"type={integration_type.value}"
     )
 
-    return IntegrationResponse(
-        id=integration.id,
-        integration_type=integration.integration_type,
-        is_enabled=integration.is_enabled,
-        notify_on_valid=integration.notify_on_valid,
-        notify_on_invalid=integration.notify_on_invalid,
-        notify_on_warning=integration.notify_on_warning,
-        last_used_at=integration.last_used_at,
-        total_requests=integration.total_requests,
-        successful_requests=integration.successful_requests,
-        failed_requests=integration.failed_requests,
-        created_at=integration.created_at,
-        updated_at=integration.updated_at,
-        config_hint=service.get_config_hint(integration),
-    )
+    return _integration_to_response(integration)
 
 
 @router.patch(
@@ -191,28 +184,13 @@ async def update_integration(
         integration.notify_on_warning = data.notify_on_warning
 
     await db.commit()
-    await db.refresh(integration)
 
     logger.info(
         f"Integration updated: user={current_user.email}, "
         f"type={integration_type.value}"
     )
 
-    return IntegrationResponse(
-        id=integration.id,
-        integration_type=integration.integration_type,
-        is_enabled=integration.is_enabled,
-        notify_on_valid=integration.notify_on_valid,
-        notify_on_invalid=integration.notify_on_invalid,
-        notify_on_warning=integration.notify_on_warning,
-        last_used_at=integration.last_used_at,
-        total_requests=integration.total_requests,
-        successful_requests=integration.successful_requests,
-        failed_requests=integration.failed_requests,
-        created_at=integration.created_at,
-        updated_at=integration.updated_at,
-        config_hint=service.get_config_hint(integration),
-    )
+    return _integration_to_response(integration)
 
 
 @router.delete(
@@ -269,11 +247,7 @@ async def test_integration(
             detail="Integration nicht gefunden.",
         )
 
-    import json
-
-    from app.core.encryption import encryption_service
-
-    config = json.loads(encryption_service.decrypt(integration.encrypted_config))
+    config = IntegrationService.get_config(integration)
 
     if integration_type == IntegrationType.LEXOFFICE:
         success = await lexoffice_service.test_connection(config["api_key"])
@@ -359,40 +333,41 @@ async def validate_lexoffice_invoices(
     _check_integration_access(current_user)
 
     service = lexoffice_service.with_db(db)
-    results = []
-
-    for invoice_id in data.invoice_ids:
-        try:
-            # Get invoice metadata
-            invoice_data = await service.get_invoice(current_user.id, invoice_id)
-            voucher_number = invoice_data.get("voucherNumber")
-
-            # For now, just record that we fetched the invoice
-            # Full validation would require XRechnung XML export from Lexoffice
-            results.append(
-                LexofficeFetchResult(
-                    invoice_id=invoice_id,
-                    voucher_number=voucher_number,
-                    validation_id=None,
-                    is_valid=None,
-                    error_count=0,
-                    warning_count=0,
-                    error_message="Lexoffice-Validierung erfordert XRechnung-Export. "
-                    "Bitte laden Sie die Rechnung als XML hoch.",
-                )
-            )
+    try:
+        fetched = await service.get_invoices(current_user.id, data.invoice_ids)
+    except Exception as e:
+        # Missing or unreadable configuration fails every requested invoice
+        fetched = [e] * len(data.invoice_ids)
 
-        except Exception as e:
-            logger.error(f"Failed to fetch Lexoffice invoice {invoice_id}: {e}")
+    results = []
+    for invoice_id, invoice_data in zip(data.invoice_ids, fetched, strict=True):
+        if isinstance(invoice_data, BaseException):
+            logger.error(f"Failed to fetch Lexoffice invoice {invoice_id}: {invoice_data}")
             results.append(
                 LexofficeFetchResult(
                     invoice_id=invoice_id,
                     voucher_number=None,
                     validation_id=None,
                     is_valid=None,
-                    error_message=str(e),
+                    error_message=str(invoice_data),
                 )
             )
+            continue
+
+        # For now, just record that we fetched the invoice
+        # Full validation would require XRechnung XML export from Lexoffice
+        results.append(
+            LexofficeFetchResult(
+                invoice_id=invoice_id,
+                voucher_number=invoice_data.get("voucherNumber"),
+                validation_id=None,
+                is_valid=None,
+                error_count=0,
+                warning_count=0,
+                error_message="Lexoffice-Validierung erfordert XRechnung-Export. "
+                "Bitte laden Sie die Rechnung als XML hoch.",
+            )
+        )
 
     return results
 
@@ -425,7 +400,7 @@ async def send_notifications_background(
     async with async_session_maker() as db:
         try:
             service = notification_service.with_db(db)
-            await service.send_validation_notification(
+            targets = await service.get_validation_targets(
                 user_id=user_id,
                 validation_id=validation_id,
                 file_name=file_name,
@@ -434,6 +409,13 @@ async def send_notifications_background(
                 warning_count=warning_count,
                 info_count=info_count,
             )
+            if not targets:
+                return
+
+            # End the read transaction so no pooled DB connection is held
+            # while waiting on the webhooks
+            await db.commit()
+            await service.post_notifications(user_id, targets)
             await db.commit()
         except Exception as e:
             logger.exception(f"Notification error: {e}")
@@ -3,9 +3,10 @@
 import logging
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, Request, status
 from fastapi.responses import Response
-from sqlalchemy import select
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import raiseload
 
 from app.api.deps import CurrentUser, DbSession
 from app.models.invoice_draft import InvoiceDraft
@@ -18,6 +19,7 @@ from app.schemas.invoice import (
     InvoiceDraftResponse,
     InvoiceDraftUpdate,
 )
+from app.services.converter.concurrency import run_cpu_bound
 from app.services.invoice_creator import xrechnung_generator
 from app.services.validator.xrechnung import XRechnungValidator
 
@@ -25,6 +27,59 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Validator for generated XML; it keeps no per-request state
+xrechnung_validator = XRechnungValidator()
+
+# Drafts are per user and change while the wizard is open: clients may keep
+# a copy but must revalidate it with the ETag
+DRAFT_CACHE_CONTROL = "private, no-cache"
+
+# Columns of InvoiceDraftListItem, selected directly for the draft list
+_DRAFT_LIST_COLUMNS = tuple(
+    getattr(InvoiceDraft, field) for field in InvoiceDraftListItem.model_fields
+)
+
+
+async def _get_draft_or_404(draft_id: UUID, user_id: UUID, db: DbSession) -> InvoiceDraft:
+    """Get a draft by ID or raise 404.
+
+    Draft responses only read the draft's own columns, so relationships are
+    set to raise instead of lazy loading; an accidental access fails loudly
+    rather than issuing another query.
+    """
+    result = await db.execute(
+        select(InvoiceDraft)
+        .options(raiseload("*"))
+        .where(
+            InvoiceDraft.id == draft_id,
+            InvoiceDraft.user_id == user_id,
+        )
+    )
+    draft = result.scalar_one_or_none()
+
+    if not draft:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Entwurf nicht gefunden",
+        )
+
+    return draft
+
+
+def _draft_cache_headers(draft: InvoiceDraft) -> dict[str, str]:
+    """ETag and Cache-Control headers; the ETag changes with every draft update."""
+    etag = f'W/"{draft.id}-{draft.updated_at.timestamp():.6f}"'
+    return {"ETag": etag, "Cache-Control": DRAFT_CACHE_CONTROL}
+
+
+def _is_not_modified(request: Request, headers: dict[str, str]) -> bool:
+    """Check whether the client's If-None-Match already names the current ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    tags = {tag.strip() for tag in if_none_match.split(",")}
+    return "*" in tags or headers["ETag"] in tags
+
 
 @router.post(
     "/drafts/",
@@ -49,59 +104,51 @@ async def create_draft(
 
     db.add(draft)
     await db.flush()
-    await db.refresh(draft)
 
     logger.info(f"Invoice draft created: {draft.id} by {current_user.email}")
 
-    return InvoiceDraftResponse(
-        id=draft.id,
-        user_id=draft.user_id,
-        client_id=draft.client_id,
-        name=draft.name,
-        output_format=draft.output_format,
-        invoice_data=InvoiceData(**draft.invoice_data) if draft.invoice_data else InvoiceData(),
-        current_step=draft.current_step,
-        is_complete=draft.is_complete,
-        generated_xml=draft.generated_xml,
-        validation_result_id=draft.validation_result_id,
-        created_at=draft.created_at,
-        updated_at=draft.updated_at,
-    )
+    return InvoiceDraftResponse.model_validate(draft)
 
 
 @router.get(
     "/drafts/",
     response_model=InvoiceDraftList,
     summary="List invoice drafts",
-    description="List all invoice drafts for the current user.",
+    description="List the current user's invoice drafts, paginated.",
 )
 async def list_drafts(
     current_user: CurrentUser,
     db: DbSession,
+    page: int = Query(default=1, ge=1, description="Page number (1-based)"),
+    page_size: int = Query(default=50, ge=1, le=100, description="Drafts per page"),
 ) -> InvoiceDraftList:
-    """List user's invoice drafts."""
+    """List user's invoice drafts, most recently updated first."""
+    total = await db.scalar(
+        select(func.count()).select_from(InvoiceDraft).where(InvoiceDraft.user_id == current_user.id)
+    ) or 0
+    offset = (page - 1) * page_size
+
+    # No drafts on this page (or none at all): skip the page query
+    if offset >= total:
+        return InvoiceDraftList(drafts=[], total=total, page=page, page_size=page_size)
+
+    # Select only the list item columns as plain rows: no stored invoice JSON
+    # or generated XML, and no ORM identity map bookkeeping
     result = await db.execute(
-        select(InvoiceDraft)
+        select(*_DRAFT_LIST_COLUMNS)
         .where(InvoiceDraft.user_id == current_user.id)
-        .order_by(InvoiceDraft.updated_at.desc())
+        .order_by(InvoiceDraft.updated_at.desc(), InvoiceDraft.id)
+        .limit(page_size)
+        .offset(offset)
     )
 
-    drafts = result.scalars().all()
+    drafts = result.all()
 
     return InvoiceDraftList(
-        drafts=[
-            InvoiceDraftListItem(
-                id=d.id,
-                name=d.name,
-                output_format=d.output_format,
-                current_step=d.current_step,
-                is_complete=d.is_complete,
-                created_at=d.created_at,
-                updated_at=d.updated_at,
-            )
-            for d in drafts
-        ],
-        total=len(drafts),
+        drafts=[InvoiceDraftListItem.model_validate(d) for d in drafts],
+        total=total,
+        page=page,
+        page_size=page_size,
     )
 
 
@@ -113,38 +160,20 @@ async def list_drafts(
 )
 async def get_draft(
     draft_id: UUID,
+    request: Request,
+    response: Response,
     current_user: CurrentUser,
     db: DbSession,
-) -> InvoiceDraftResponse:
+) -> InvoiceDraftResponse | Response:
     """Get invoice draft by ID."""
-    result = await db.execute(
-        select(InvoiceDraft).where(
-            InvoiceDraft.id == draft_id,
-            InvoiceDraft.user_id == current_user.id,
-        )
-    )
-    draft = result.scalar_one_or_none()
+    draft = await _get_draft_or_404(draft_id, current_user.id, db)
 
-    if not draft:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Entwurf nicht gefunden",
-        )
+    headers = _draft_cache_headers(draft)
+    if _is_not_modified(request, headers):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
 
-    return InvoiceDraftResponse(
-        id=draft.id,
-        user_id=draft.user_id,
-        client_id=draft.client_id,
-        name=draft.name,
-        output_format=draft.output_format,
-        invoice_data=InvoiceData(**draft.invoice_data) if draft.invoice_data else InvoiceData(),
-        current_step=draft.current_step,
-        is_complete=draft.is_complete,
-        generated_xml=draft.generated_xml,
-        validation_result_id=draft.validation_result_id,
-        created_at=draft.created_at,
-        updated_at=draft.updated_at,
-    )
+    return InvoiceDraftResponse.model_validate(draft)
 
 
 @router.patch(
@@ -160,19 +189,7 @@ async def update_draft(
     db: DbSession,
 ) -> InvoiceDraftResponse:
     """Update invoice draft."""
-    result = await db.execute(
-        select(InvoiceDraft).where(
-            InvoiceDraft.id == draft_id,
-            InvoiceDraft.user_id == current_user.id,
-        )
-    )
-    draft = result.scalar_one_or_none()
-
-    if not draft:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Entwurf nicht gefunden",
-        )
+    draft = await _get_draft_or_404(draft_id, current_user.id, db)
 
     if data.name is not None:
         draft.name = data.name
@@ -184,24 +201,10 @@ async def update_draft(
         draft.invoice_data = data.invoice_data.model_dump(exclude_none=True)
 
     await db.flush()
-    await db.refresh(draft)
 
     logger.info(f"Invoice draft updated: {draft.id}")
 
-    return InvoiceDraftResponse(
-        id=draft.id,
-        user_id=draft.user_id,
-        client_id=draft.client_id,
-        name=draft.name,
-        output_format=draft.output_format,
-        invoice_data=InvoiceData(**draft.invoice_data) if draft.invoice_data else InvoiceData(),
-        current_step=draft.current_step,
-        is_complete=draft.is_complete,
-        generated_xml=draft.generated_xml,
-        validation_result_id=draft.validation_result_id,
-        created_at=draft.created_at,
-        updated_at=draft.updated_at,
-    )
+    return InvoiceDraftResponse.model_validate(draft)
 
 
 @router.delete(
@@ -217,22 +220,20 @@ async def delete_draft(
 ) -> dict[str, str]:
     """Delete invoice draft."""
     result = await db.execute(
-        select(InvoiceDraft).where(
+        delete(InvoiceDraft)
+        .where(
             InvoiceDraft.id == draft_id,
             InvoiceDraft.user_id == current_user.id,
         )
+        .returning(InvoiceDraft.id)
     )
-    draft = result.scalar_one_or_none()
 
-    if not draft:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Entwurf nicht gefunden",
         )
 
-    await db.delete(draft)
-    await db.flush()
-
     logger.info(f"Invoice draft deleted: {draft_id}")
 
     return {"message": "Entwurf erfolgreich geloescht"}
@@ -250,19 +251,7 @@ async def generate_invoice(
     db: DbSession,
 ) -> GenerateInvoiceResponse:
     """Generate invoice XML from draft."""
-    result = await db.execute(
-        select(InvoiceDraft).where(
-            InvoiceDraft.id == draft_id,
-            InvoiceDraft.user_id == current_user.id,
-        )
-    )
-    draft = result.scalar_one_or_none()
-
-    if not draft:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Entwurf nicht gefunden",
-        )
+    draft = await _get_draft_or_404(draft_id, current_user.id, db)
 
     # Parse invoice data
     try:
@@ -292,7 +281,7 @@ async def generate_invoice(
 
     # Generate XML
     try:
-        xml = xrechnung_generator.generate(invoice_data)
+        xml = await run_cpu_bound(xrechnung_generator.generate, invoice_data)
     except Exception as e:
         logger.error(f"Failed to generate invoice: {e}")
         raise HTTPException(
@@ -308,9 +297,8 @@ async def generate_invoice(
     logger.info(f"Invoice generated from draft: {draft_id}")
 
     # Validate the generated XML with KoSIT validator
-    validator = XRechnungValidator()
     try:
-        validation_result = await validator.validate(
+        validation_result = await xrechnung_validator.validate(
             content=xml.encode("utf-8"),
             filename=f"{draft.name}.xml",
             user_id=current_user.id,
@@ -342,29 +330,23 @@ async def generate_invoice(
 )
 async def preview_invoice(
     draft_id: UUID,
+    request: Request,
     current_user: CurrentUser,
     db: DbSession,
 ) -> Response:
     """Preview the generated invoice XML."""
-    result = await db.execute(
-        select(InvoiceDraft).where(
-            InvoiceDraft.id == draft_id,
-            InvoiceDraft.user_id == current_user.id,
-        )
-    )
-    draft = result.scalar_one_or_none()
+    draft = await _get_draft_or_404(draft_id, current_user.id, db)
 
-    if not draft:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Entwurf nicht gefunden",
-        )
+    # The preview only depends on the draft, so an unchanged draft needs no new XML
+    headers = _draft_cache_headers(draft)
+    if _is_not_modified(request, headers):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
 
     # Generate preview (even if not complete)
     invoice_data = InvoiceData(**draft.invoice_data) if draft.invoice_data else InvoiceData()
 
     try:
-        xml = xrechnung_generator.generate(invoice_data)
+        xml = await run_cpu_bound(xrechnung_generator.generate, invoice_data)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -374,5 +356,8 @@ async def preview_invoice(
     return Response(
         content=xml,
         media_type="application/xml",
-        headers={"Content-Disposition": f'inline; filename="{draft.name}.xml"'},
+        headers={
+            "Content-Disposition": f'inline; filename="{draft.name}.xml"',
+            **headers,
+        },
     )
@@ -6,8 +6,9 @@ import secrets
 from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Request, status
-from sqlalchemy import func, select
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Request, status
+from sqlalchemy import ScalarSelect, and_, func, select
+from sqlalchemy.orm import aliased
 
 from app.api.deps import CurrentUser, DbSession
 from app.models.organization import (
@@ -15,6 +16,8 @@ from app.models.organization import (
     OrganizationInvitation,
     OrganizationMember,
     OrganizationRole,
+    generate_invitation_token,
+    hash_invitation_token,
 )
 from app.models.user import User
 from app.schemas.organization import (
@@ -34,11 +37,14 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Runs of characters that are not allowed in an organization slug
+SLUG_INVALID_CHARS = re.compile(r"[^a-z0-9]+")
+
 
 def generate_slug(name: str) -> str:
     """Generate a URL-safe slug from organization name."""
     # Convert to lowercase and replace spaces/special chars with hyphens
-    slug = re.sub(r"[^a-z0-9]+", "-", name.lower())
+    slug = SLUG_INVALID_CHARS.sub("-", name.lower())
     # Remove leading/trailing hyphens
     slug = slug.strip("-")
     # Add random suffix for uniqueness
@@ -46,31 +52,97 @@ def generate_slug(name: str) -> str:
     return f"{slug}-{suffix}"
 
 
+def _organization_to_response(org: Organization, member_count: int) -> OrganizationResponse:
+    """Build the response for a loaded organization row.
+
+    The values come straight from typed model columns, so the response is
+    constructed without running field validation again.
+    """
+    return OrganizationResponse.model_construct(
+        id=org.id,
+        name=org.name,
+        slug=org.slug,
+        description=org.description,
+        owner_id=org.owner_id,
+        plan=org.plan.value,
+        max_members=org.max_members,
+        is_active=org.is_active,
+        validations_this_month=org.validations_this_month,
+        conversions_this_month=org.conversions_this_month,
+        member_count=member_count,
+        created_at=org.created_at,
+    )
+
+
+def _member_to_response(member: OrganizationMember, user: User) -> MemberResponse:
+    """Build the response for a membership and its user."""
+    return MemberResponse.model_construct(
+        id=member.id,
+        user_id=member.user_id,
+        email=user.email,
+        full_name=user.full_name,
+        role=member.role.value,
+        invited_at=member.invited_at,
+        joined_at=member.joined_at,
+    )
+
+
+def _invitation_to_response(
+    invitation: OrganizationInvitation, org: Organization
+) -> InvitationResponse:
+    """Build the response for an invitation to an organization."""
+    return InvitationResponse.model_construct(
+        id=invitation.id,
+        email=invitation.email,
+        role=invitation.role.value,
+        organization_name=org.name,
+        expires_at=invitation.expires_at,
+        is_valid=invitation.is_valid(),
+    )
+
+
+def _member_count() -> ScalarSelect[int]:
+    """Correlated subquery counting the members of the selected organization."""
+    counted = aliased(OrganizationMember)
+    return (
+        select(func.count(counted.id))
+        .where(counted.organization_id == Organization.id)
+        .correlate(Organization)
+        .scalar_subquery()
+    )
+
+
 async def get_org_with_permission(
     db: DbSession,
     org_id: UUID,
     user: User,
     require_admin: bool = False,
-) -> tuple[Organization, OrganizationMember]:
-    """Get organization and verify user has permission."""
-    # Get organization
-    result = await db.execute(select(Organization).where(Organization.id == org_id))
-    org = result.scalar_one_or_none()
+) -> tuple[Organization, OrganizationMember, int]:
+    """Get organization and verify user has permission.
 
-    if not org:
+    The organization, the user's membership and the member count are loaded
+    in one query.
+    """
+    result = await db.execute(
+        select(Organization, OrganizationMember, _member_count())
+        .outerjoin(
+            OrganizationMember,
+            and_(
+                OrganizationMember.organization_id == Organization.id,
+                OrganizationMember.user_id == user.id,
+            ),
+        )
+        .where(Organization.id == org_id)
+    )
+    row = result.one_or_none()
+
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Organisation nicht gefunden",
         )
 
-    # Get membership
-    result = await db.execute(
-        select(OrganizationMember).where(
-            OrganizationMember.organization_id == org_id,
-            OrganizationMember.user_id == user.id,
-        )
-    )
-    member = result.scalar_one_or_none()
+    org, member, count = row
 
     if not member:
         raise HTTPException(
@@ -84,7 +156,7 @@ async def get_org_with_permission(
             detail="Administratorrechte erforderlich",
         )
 
-    return org, member
+    return org, member, count
 
 
 @router.post(
@@ -104,8 +176,8 @@ async def create_organization(
     slug = generate_slug(data.name)
 
     # Check slug uniqueness (should be unique due to random suffix)
-    result = await db.execute(select(Organization).where(Organization.slug == slug))
-    if result.scalar_one_or_none():
+    slug_taken = select(Organization.id).where(Organization.slug == slug).exists()
+    if await db.scalar(select(slug_taken)):
         slug = generate_slug(data.name)  # Regenerate
 
     # Create organization
@@ -116,37 +188,20 @@ async def create_organization(
         owner_id=current_user.id,
     )
 
-    db.add(org)
-    await db.flush()
-
-    # Add owner as first member
+    # Add owner as first member, inserted in the same flush
     member = OrganizationMember(
-        organization_id=org.id,
+        organization=org,
         user_id=current_user.id,
         role=OrganizationRole.OWNER,
         joined_at=datetime.now(UTC).replace(tzinfo=None),
     )
 
-    db.add(member)
+    db.add_all([org, member])
     await db.flush()
-    await db.refresh(org)
 
     logger.info(f"Organization created: {org.name} by {current_user.email}")
 
-    return OrganizationResponse(
-        id=org.id,
-        name=org.name,
-        slug=org.slug,
-        description=org.description,
-        owner_id=org.owner_id,
-        plan=org.plan.value,
-        max_members=org.max_members,
-        is_active=org.is_active,
-        validations_this_month=org.validations_this_month,
-        conversions_this_month=org.conversions_this_month,
-        member_count=1,
-        created_at=org.created_at,
-    )
+    return _organization_to_response(org, 1)
 
 
 @router.get(
@@ -158,36 +213,47 @@ async def create_organization(
 async def list_organizations(
     current_user: CurrentUser,
     db: DbSession,
+    page: int = Query(default=1, ge=1, description="Page number (1-based)"),
+    page_size: int = Query(default=50, ge=1, le=100, description="Organizations per page"),
 ) -> OrganizationListResponse:
-    """List organizations the user belongs to."""
+    """List organizations the user belongs to, ordered by name."""
+    # The window count is taken before LIMIT, so every row carries the total
     result = await db.execute(
-        select(Organization, func.count(OrganizationMember.id).label("member_count"))
-        .join(OrganizationMember, Organization.id == OrganizationMember.organization_id)
-        .where(OrganizationMember.user_id == current_user.id)
-        .group_by(Organization.id)
+        select(Organization, _member_count(), func.count().over())
+        .join(
+            OrganizationMember,
+            and_(
+                OrganizationMember.organization_id == Organization.id,
+                OrganizationMember.user_id == current_user.id,
+            ),
+        )
+        .order_by(Organization.name, Organization.id)
+        .limit(page_size)
+        .offset((page - 1) * page_size)
     )
 
     orgs = result.all()
 
+    if orgs:
+        total = orgs[0][2]
+    elif page == 1:
+        total = 0
+    else:
+        # Past the last page: no row to read the window count from
+        total = await db.scalar(
+            select(func.count(OrganizationMember.id)).where(
+                OrganizationMember.user_id == current_user.id
+            )
+        )
+
     return OrganizationListResponse(
         organizations=[
-            OrganizationResponse(
-                id=org.id,
-                name=org.name,
-                slug=org.slug,
-                description=org.description,
-                owner_id=org.owner_id,
-                plan=org.plan.value,
-                max_members=org.max_members,
-                is_active=org.is_active,
-                validations_this_month=org.validations_this_month,
-                conversions_this_month=org.conversions_this_month,
-                member_count=member_count,
-                created_at=org.created_at,
-            )
-            for org, member_count in orgs
+            _organization_to_response(org, member_count)
+            for org, member_count, _ in orgs
         ],
-        total=len(orgs),
+        total=total,
+        page=page,
+        page_size=page_size,
     )
 
 
@@ -203,30 +269,9 @@ async def get_organization(
     db: DbSession,
 ) -> OrganizationResponse:
     """Get organization details."""
-    org, _ = await get_org_with_permission(db, org_id, current_user)
+    org, _, member_count = await get_org_with_permission(db, org_id, current_user)
 
-    # Get member count
-    result = await db.execute(
-        select(func.count(OrganizationMember.id)).where(
-            OrganizationMember.organization_id == org_id
-        )
-    )
-    member_count = result.scalar()
-
-    return OrganizationResponse(
-        id=org.id,
-        name=org.name,
-        slug=org.slug,
-        description=org.description,
-        owner_id=org.owner_id,
-        plan=org.plan.value,
-        max_members=org.max_members,
-        is_active=org.is_active,
-        validations_this_month=org.validations_this_month,
-        conversions_this_month=org.conversions_this_month,
-        member_count=member_count,
-        created_at=org.created_at,
-    )
+    return _organization_to_response(org, member_count)
 
 
 @router.patch(
@@ -242,7 +287,9 @@ async def update_organization(
     db: DbSession,
 ) -> OrganizationResponse:
     """Update organization details."""
-    org, _ = await get_org_with_permission(db, org_id, current_user, require_admin=True)
+    org, _, member_count = await get_org_with_permission(
+        db, org_id, current_user, require_admin=True
+    )
 
     if data.name is not None:
         org.name = data.name
@@ -250,32 +297,10 @@ async def update_organization(
         org.description = data.description
 
     await db.flush()
-    await db.refresh(org)
 
     logger.info(f"Organization updated: {org.name}")
 
-    # Get member count
-    result = await db.execute(
-        select(func.count(OrganizationMember.id)).where(
-            OrganizationMember.organization_id == org_id
-        )
-    )
-    member_count = result.scalar()
-
-    return OrganizationResponse(
-        id=org.id,
-        name=org.name,
-        slug=org.slug,
-        description=org.description,
-        owner_id=org.owner_id,
-        plan=org.plan.value,
-        max_members=org.max_members,
-        is_active=org.is_active,
-        validations_this_month=org.validations_this_month,
-        conversions_this_month=org.conversions_this_month,
-        member_count=member_count,
-        created_at=org.created_at,
-    )
+    return _organization_to_response(org, member_count)
 
 
 @router.delete(
@@ -290,7 +315,7 @@ async def delete_organization(
     db: DbSession,
 ) -> dict[str, str]:
     """Delete organization (owner only)."""
-    org, member = await get_org_with_permission(db, org_id, current_user)
+    org, member, _ = await get_org_with_permission(db, org_id, current_user)
 
     if member.role != OrganizationRole.OWNER:
         raise HTTPException(
@@ -333,15 +358,7 @@ async def list_members(
 
     return MemberListResponse(
         members=[
-            MemberResponse(
-                id=member.id,
-                user_id=member.user_id,
-                email=user.email,
-                full_name=user.full_name,
-                role=member.role.value,
-                invited_at=member.invited_at,
-                joined_at=member.joined_at,
-            )
+            _member_to_response(member, user)
             for member, user in members
         ],
         total=len(members),
@@ -361,54 +378,51 @@ async def invite_member(
     current_user: CurrentUser,
     db: DbSession,
     request: Request,
+    background_tasks: BackgroundTasks,
 ) -> InvitationResponse:
     """Invite a new member to the organization."""
-    org, _ = await get_org_with_permission(db, org_id, current_user, require_admin=True)
-
-    # Check member limit
-    result = await db.execute(
-        select(func.count(OrganizationMember.id)).where(
-            OrganizationMember.organization_id == org_id
-        )
+    org, _, member_count = await get_org_with_permission(
+        db, org_id, current_user, require_admin=True
     )
-    member_count = result.scalar()
 
+    # Check member limit
     if member_count >= org.max_members:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Maximale Mitgliederzahl erreicht ({org.max_members})",
         )
 
-    # Check if user is already a member
-    result = await db.execute(
-        select(User).where(User.email == data.email)
-    )
-    existing_user = result.scalar_one_or_none()
-
-    if existing_user:
-        result = await db.execute(
-            select(OrganizationMember).where(
-                OrganizationMember.organization_id == org_id,
-                OrganizationMember.user_id == existing_user.id,
-            )
+    # Check existing membership and pending invitations in one query
+    now = datetime.now(UTC).replace(tzinfo=None)
+    is_member = (
+        select(OrganizationMember.id)
+        .join(User, OrganizationMember.user_id == User.id)
+        .where(
+            OrganizationMember.organization_id == org_id,
+            User.email == data.email,
         )
-        if result.scalar_one_or_none():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Benutzer ist bereits Mitglied",
-            )
-
-    # Check for existing pending invitation
-    result = await db.execute(
-        select(OrganizationInvitation).where(
+        .exists()
+    )
+    has_pending_invite = (
+        select(OrganizationInvitation.id)
+        .where(
             OrganizationInvitation.organization_id == org_id,
             OrganizationInvitation.email == data.email,
             OrganizationInvitation.accepted_at.is_(None),
+            OrganizationInvitation.expires_at >= now,
         )
+        .exists()
     )
-    existing_invite = result.scalar_one_or_none()
+    result = await db.execute(select(is_member, has_pending_invite))
+    already_member, already_invited = result.one()
 
-    if existing_invite and existing_invite.is_valid():
+    if already_member:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Benutzer ist bereits Mitglied",
+        )
+
+    if already_invited:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Es existiert bereits eine Einladung fuer diese E-Mail",
@@ -416,50 +430,39 @@ async def invite_member(
 
     # Create invitation
     role = OrganizationRole(data.role)
+    invite_token = generate_invitation_token()
     invitation = OrganizationInvitation(
         organization_id=org_id,
         email=data.email,
         role=role,
+        token_hash=hash_invitation_token(invite_token),
         created_by_id=current_user.id,
-        expires_at=datetime.now(UTC).replace(tzinfo=None) + timedelta(days=7),
+        expires_at=now + timedelta(days=7),
     )
 
     db.add(invitation)
-    await db.flush()
-    await db.refresh(invitation)
+    # Commit before queuing the email, so the link never points at an
+    # invitation that was rolled back
+    await db.commit()
 
     # Send invitation email
     base_url = str(request.base_url).rstrip("/")
-    invite_url = f"{base_url}/einladung/{invitation.token}"
-
-    try:
-        await email_service.send_email(
-            to=data.email,
-            subject=f"Einladung zu {org.name} - RechnungsChecker",
-            html_content=f"""
-            <h2>Sie wurden eingeladen!</h2>
-            <p>{current_user.full_name or current_user.email} hat Sie eingeladen,
-            dem Team <strong>{org.name}</strong> bei RechnungsChecker beizutreten.</p>
-            <p>Ihre Rolle: <strong>{role.value.capitalize()}</strong></p>
-            <p><a href="{invite_url}" style="background-color: #2563eb; color: white; padding: 10px 20px;
-            text-decoration: none; border-radius: 5px;">Einladung annehmen</a></p>
-            <p>Dieser Link ist 7 Tage gueltig.</p>
-            """,
-        )
-    except Exception as e:
-        logger.error(f"Failed to send invitation email: {e}")
+    invite_url = f"{base_url}/einladung/{invite_token}"
 
-    logger.info(f"Member invited to {org.name}: {data.email}")
-
-    return InvitationResponse(
-        id=invitation.id,
-        email=invitation.email,
-        role=invitation.role.value,
+    # Sent after the response; send_email logs its own failures
+    background_tasks.add_task(
+        email_service.send_invitation_email,
+        to=data.email,
+        inviter=current_user.full_name or current_user.email,
         organization_name=org.name,
-        expires_at=invitation.expires_at,
-        is_valid=invitation.is_valid(),
+        role=role.value.capitalize(),
+        invite_url=invite_url,
     )
 
+    logger.info(f"Member invited to {org.name}: {data.email}")
+
+    return _invitation_to_response(invitation, org)
+
 
 @router.patch(
     "/{org_id}/members/{user_id}",
@@ -475,7 +478,7 @@ async def update_member_role(
     db: DbSession,
 ) -> MemberResponse:
     """Update member role."""
-    org, current_member = await get_org_with_permission(
+    org, current_member, _ = await get_org_with_permission(
         db, org_id, current_user, require_admin=True
     )
 
@@ -517,15 +520,7 @@ async def update_member_role(
 
     logger.info(f"Member role updated in {org.name}: {user.email} -> {data.role}")
 
-    return MemberResponse(
-        id=member.id,
-        user_id=member.user_id,
-        email=user.email,
-        full_name=user.full_name,
-        role=member.role.value,
-        invited_at=member.invited_at,
-        joined_at=member.joined_at,
-    )
+    return _member_to_response(member, user)
 
 
 @router.delete(
@@ -541,7 +536,7 @@ async def remove_member(
     db: DbSession,
 ) -> dict[str, str]:
     """Remove member from organization."""
-    org, current_member = await get_org_with_permission(
+    org, current_member, _ = await get_org_with_permission(
         db, org_id, current_user, require_admin=True
     )
 
@@ -592,7 +587,7 @@ async def get_invitation(
     result = await db.execute(
         select(OrganizationInvitation, Organization)
         .join(Organization, OrganizationInvitation.organization_id == Organization.id)
-        .where(OrganizationInvitation.token == token)
+        .where(OrganizationInvitation.token_hash == hash_invitation_token(token))
     )
     row = result.one_or_none()
 
@@ -604,14 +599,7 @@ async def get_invitation(
 
     invitation, org = row
 
-    return InvitationResponse(
-        id=invitation.id,
-        email=invitation.email,
-        role=invitation.role.value,
-        organization_name=org.name,
-        expires_at=invitation.expires_at,
-        is_valid=invitation.is_valid(),
-    )
+    return _invitation_to_response(invitation, org)
 
 
 @router.post(
@@ -626,10 +614,18 @@ async def accept_invitation(
     db: DbSession,
 ) -> dict[str, str]:
     """Accept invitation and join organization."""
+    is_member = (
+        select(OrganizationMember.id)
+        .where(
+            OrganizationMember.organization_id == Organization.id,
+            OrganizationMember.user_id == current_user.id,
+        )
+        .exists()
+    )
     result = await db.execute(
-        select(OrganizationInvitation, Organization)
+        select(OrganizationInvitation, Organization, is_member)
         .join(Organization, OrganizationInvitation.organization_id == Organization.id)
-        .where(OrganizationInvitation.token == token)
+        .where(OrganizationInvitation.token_hash == hash_invitation_token(token))
     )
     row = result.one_or_none()
 
@@ -639,7 +635,7 @@ async def accept_invitation(
             detail="Einladung nicht gefunden",
         )
 
-    invitation, org = row
+    invitation, org, already_member = row
 
     if not invitation.is_valid():
         raise HTTPException(
@@ -655,13 +651,7 @@ async def accept_invitation(
         )
 
     # Check if already a member
-    result = await db.execute(
-        select(OrganizationMember).where(
-            OrganizationMember.organization_id == org.id,
-            OrganizationMember.user_id == current_user.id,
-        )
-    )
-    if result.scalar_one_or_none():
+    if already_member:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Sie sind bereits Mitglied dieser Organisation",
@@ -8,6 +8,7 @@ from fastapi.responses import Response
 
 from app.api.deps import DbSession, OptionalUser
 from app.core.cache import get_cached_validation
+from app.services.converter.concurrency import run_cpu_bound
 from app.services.reports.pdf import ReportService
 
 logger = logging.getLogger(__name__)
@@ -75,15 +76,10 @@ async def download_report_pdf(
 
     try:
         report_service = ReportService()
-        pdf_bytes = report_service.generate_pdf(result)
-
-        return Response(
-            content=pdf_bytes,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f'attachment; filename="validierungsbericht-{report_id}.pdf"',
-            },
-        )
+        # ReportLab layout is CPU-bound; keep it off the event loop
+        pdf_bytes = await run_cpu_bound(report_service.generate_pdf, result)
+
+        return create_pdf_response(pdf_bytes, f"validierungsbericht-{report_id}.pdf")
     except Exception as e:
         logger.error(f"PDF generation failed: {e}")
         raise HTTPException(
@@ -0,0 +1,185 @@
+"""Shared storage for converted files awaiting download.
+
+Conversions are stored in Redis so every worker can serve the download,
+preview and email endpoints. If Redis is unreachable, results fall back
+to an in-process store so single-worker setups keep working.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+
+from app.config import get_settings
+from app.core.redis_cache import (
+    cache_delete_pattern,
+    conversion_cache_key,
+    conversion_dedup_cache_key,
+    get_binary_redis,
+    user_conversions_cache_key,
+)
+
+logger = logging.getLogger(__name__)
+
+# Fallback storage used while Redis is unavailable: id -> (conversion, expires_at).
+# Insertion order equals expiry order, so the first entry is always the oldest.
+_local_conversions: dict[str, tuple["CachedConversion", float]] = {}
+MAX_LOCAL_CONVERSIONS = 1000
+
+
+# Hash fields only written when set
+_OPTIONAL_FIELDS = ("xml_content", "invoice_number", "invoice_date", "gross_amount", "user_id")
+
+
+@dataclass
+class CachedConversion:
+    """A converted file and its metadata."""
+
+    content: bytes
+    filename: str
+    content_type: str
+    xml_content: bytes | None = None
+
+    # Invoice summary for the email endpoint, taken from the extracted data
+    invoice_number: str | None = None
+    invoice_date: str | None = None
+    gross_amount: str | None = None
+    currency: str = "EUR"
+
+    # Owner, so the user's conversions can be removed when the account is deleted
+    user_id: str | None = None
+
+
+async def store_conversion(conversion_id: str, conversion: CachedConversion) -> None:
+    """Store a conversion result until it expires.
+
+    Args:
+        conversion_id: ID returned to the client for later download
+        conversion: Converted file and metadata
+    """
+    ttl_seconds = get_settings().temp_file_ttl_seconds
+    key = conversion_cache_key(conversion_id)
+    mapping = {
+        "content": conversion.content,
+        "filename": conversion.filename,
+        "content_type": conversion.content_type,
+        "currency": conversion.currency,
+    }
+    for field in _OPTIONAL_FIELDS:
+        value = getattr(conversion, field)
+        if value is not None:
+            mapping[field] = value
+
+    try:
+        client = await get_binary_redis()
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping=mapping)
+            pipe.expire(key, ttl_seconds)
+            if conversion.user_id is not None:
+                user_key = user_conversions_cache_key(conversion.user_id)
+                pipe.sadd(user_key, conversion_id)
+                pipe.expire(user_key, ttl_seconds)
+            await pipe.execute()
+        return
+    except Exception as e:
+        logger.warning(f"Redis conversion store failed for {conversion_id}, using local store: {e}")
+
+    _cleanup_expired()
+    while len(_local_conversions) >= MAX_LOCAL_CONVERSIONS:
+        evicted_id = next(iter(_local_conversions))
+        del _local_conversions[evicted_id]
+        logger.warning(f"Local conversion store full, evicted conversion {evicted_id}")
+    _local_conversions[conversion_id] = (conversion, time.monotonic() + ttl_seconds)
+
+
+async def get_conversion(conversion_id: str) -> CachedConversion | None:
+    """Retrieve a stored conversion.
+
+    Args:
+        conversion_id: ID returned by the convert endpoint
+
+    Returns:
+        CachedConversion if found and not expired, None otherwise
+    """
+    try:
+        client = await get_binary_redis()
+        data = await client.hgetall(conversion_cache_key(conversion_id))
+        if data:
+            return CachedConversion(
+                content=data[b"content"],
+                filename=data[b"filename"].decode(),
+                content_type=data[b"content_type"].decode(),
+                xml_content=data.get(b"xml_content"),
+                invoice_number=_decode_optional(data.get(b"invoice_number")),
+                invoice_date=_decode_optional(data.get(b"invoice_date")),
+                gross_amount=_decode_optional(data.get(b"gross_amount")),
+                currency=data.get(b"currency", b"EUR").decode(),
+                user_id=_decode_optional(data.get(b"user_id")),
+            )
+    except Exception as e:
+        logger.warning(f"Redis conversion lookup failed for {conversion_id}: {e}")
+
+    entry = _local_conversions.get(conversion_id)
+    if entry is None:
+        return None
+
+    conversion, expires_at = entry
+    if time.monotonic() > expires_at:
+        del _local_conversions[conversion_id]
+        return None
+
+    return conversion
+
+
+async def delete_user_conversions(user_id: str) -> None:
+    """Remove all stored conversions of a user, e.g. when the account is deleted.
+
+    Args:
+        user_id: Owner of the conversions
+    """
+    try:
+        client = await get_binary_redis()
+        user_key = user_conversions_cache_key(user_id)
+        conversion_ids = await client.smembers(user_key)
+        keys = [conversion_cache_key(conversion_id.decode()) for conversion_id in conversion_ids]
+        await client.delete(user_key, *keys)
+    except Exception as e:
+        logger.warning(f"Redis conversion cleanup failed for user {user_id}: {e}")
+
+    await cache_delete_pattern(conversion_dedup_cache_key(user_id, "*"))
+
+    owned = [key for key, (conversion, _) in _local_conversions.items() if conversion.user_id == user_id]
+    for key in owned:
+        del _local_conversions[key]
+
+
+async def conversion_exists(conversion_id: str) -> bool:
+    """Check whether a conversion is still stored, without loading it.
+
+    Args:
+        conversion_id: ID returned by the convert endpoint
+
+    Returns:
+        True if the conversion can still be downloaded
+    """
+    try:
+        client = await get_binary_redis()
+        if await client.exists(conversion_cache_key(conversion_id)):
+            return True
+    except Exception as e:
+        logger.warning(f"Redis conversion lookup failed for {conversion_id}: {e}")
+
+    entry = _local_conversions.get(conversion_id)
+    return entry is not None and time.monotonic() <= entry[1]
+
+
+def _decode_optional(value: bytes | None) -> str | None:
+    """Decode an optional hash field."""
+    return value.decode() if value is not None else None
+
+
+def _cleanup_expired() -> None:
+    """Remove expired entries from the local fallback store."""
+    now = time.monotonic()
+    expired = [key for key, (_, expires_at) in _local_conversions.items() if now > expires_at]
+    for key in expired:
+        del _local_conversions[key]
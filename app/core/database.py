@@ -13,8 +13,9 @@ engine = create_async_engine(
     str(settings.database_url),
     echo=settings.debug,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_recycle=settings.db_pool_recycle_seconds,
 )
 
 async_session_maker = async_sessionmaker(
@@ -0,0 +1,44 @@
+"""Shared outbound HTTP client for third-party APIs and webhooks."""
+
+import logging
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Keep idle connections longer than Lexoffice's polling interval so repeated
+# calls reuse the TLS session instead of handshaking again
+HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=30.0,
+)
+HTTP_TIMEOUT = httpx.Timeout(connect=3.0, read=15.0, write=10.0, pool=5.0)
+
+# Global pooled client
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client.
+
+    Returns:
+        Async HTTP client with a persistent connection pool
+    """
+    global _http_client
+
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+        logger.info("HTTP client pool initialized")
+
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and its connections."""
+    global _http_client
+
+    if _http_client:
+        await _http_client.aclose()
+        _http_client = None
+        logger.info("HTTP client pool closed")
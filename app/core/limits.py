@@ -6,7 +6,7 @@ from datetime import UTC, date, datetime
 from uuid import uuid4
 
 from fastapi import Request
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
@@ -199,6 +199,63 @@ async def check_user_conversion_limit(user: User) -> None:
         )
 
 
+async def reserve_user_conversion(db: AsyncSession, user: User) -> None:
+    """Check the conversion limit and count one conversion in a single statement.
+
+    The conditional UPDATE makes check and increment atomic, so concurrent
+    requests cannot both pass the check for the last remaining conversion.
+
+    Args:
+        db: Database session
+        user: User performing the conversion
+
+    Raises:
+        UsageLimitError: If user limit exceeded
+    """
+    # Check if usage needs reset (new month)
+    today = date.today()
+    if user.usage_reset_date.month != today.month or user.usage_reset_date.year != today.year:
+        user.validations_this_month = 0
+        user.conversions_this_month = 0
+        user.usage_reset_date = today
+        await db.flush()
+
+    limit = user.get_conversion_limit()
+    result = await db.execute(
+        update(User)
+        .where(User.id == user.id, User.conversions_this_month < limit)
+        .values(conversions_this_month=User.conversions_this_month + 1)
+        .returning(User.conversions_this_month)
+    )
+    if result.scalar_one_or_none() is None:
+        raise UsageLimitError(
+            f"Monatliches Konvertierungslimit erreicht ({limit}). "
+            "Bitte upgraden Sie Ihren Plan.",
+            details={
+                "limit": limit,
+                "used": user.conversions_this_month,
+                "plan": user.plan.value,
+            },
+        )
+
+
+async def release_user_conversions(db: AsyncSession, user: User, count: int = 1) -> None:
+    """Give back conversions reserved for work that did not succeed.
+
+    Args:
+        db: Database session
+        user: User the conversions were reserved for
+        count: Number of conversions to give back
+    """
+    if count <= 0:
+        return
+    await db.execute(
+        update(User)
+        .where(User.id == user.id, User.conversions_this_month >= count)
+        .values(conversions_this_month=User.conversions_this_month - count)
+    )
+
+
 async def increment_user_validation(user: User) -> None:
     """Increment user validation counter.
 
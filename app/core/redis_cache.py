@@ -14,6 +14,10 @@ logger = logging.getLogger(__name__)
 _redis_pool: redis.ConnectionPool | None = None
 _redis_client: redis.Redis | None = None
 
+# Separate pool for raw bytes (file contents); responses are not decoded
+_redis_binary_pool: redis.ConnectionPool | None = None
+_redis_binary_client: redis.Redis | None = None
+
 
 async def get_redis() -> redis.Redis:
     """Get or create Redis client with connection pool.
@@ -35,9 +39,26 @@ async def get_redis() -> redis.Redis:
     return _redis_client
 
 
+async def get_binary_redis() -> redis.Redis:
+    """Get or create a Redis client that returns raw bytes.
+
+    Returns:
+        Async Redis client without response decoding
+    """
+    global _redis_binary_pool, _redis_binary_client
+
+    if _redis_binary_client is None:
+        settings = get_settings()
+        _redis_binary_pool = redis.ConnectionPool.from_url(str(settings.redis_url))
+        _redis_binary_client = redis.Redis(connection_pool=_redis_binary_pool)
+        logger.info("Redis binary connection pool initialized")
+
+    return _redis_binary_client
+
+
 async def close_redis() -> None:
-    """Close Redis connection pool."""
-    global _redis_pool, _redis_client
+    """Close Redis connection pools."""
+    global _redis_pool, _redis_client, _redis_binary_pool, _redis_binary_client
 
     if _redis_client:
         await _redis_client.close()
@@ -47,6 +68,14 @@ async def close_redis() -> None:
         _redis_pool = None
         logger.info("Redis connection pool closed")
 
+    if _redis_binary_client:
+        await _redis_binary_client.close()
+        _redis_binary_client = None
+    if _redis_binary_pool:
+        await _redis_binary_pool.disconnect()
+        _redis_binary_pool = None
+        logger.info("Redis binary connection pool closed")
+
 
 async def cache_get(key: str) -> Any | None:
     """Get value from cache.
@@ -147,3 +176,33 @@ def user_cache_key(user_id: str) -> str:
 def templates_cache_key(user_id: str) -> str:
     """Build cache key for user templates."""
     return f"templates:list:{user_id}"
+
+
+def client_stats_cache_key(user_id: str) -> str:
+    """Build cache key for client statistics."""
+    return f"clients:stats:{user_id}"
+
+
+def client_list_cache_key(user_id: str, variant: str) -> str:
+    """Build cache key for the first page of a user's client list."""
+    return f"clients:list:{user_id}:{variant}"
+
+
+def conversion_cache_key(conversion_id: str) -> str:
+    """Build cache key for a converted file."""
+    return f"conversion:{conversion_id}"
+
+
+def client_count_cache_key(user_id: str) -> str:
+    """Build cache key for a user's client count."""
+    return f"clients:count:{user_id}"
+
+
+def conversion_dedup_cache_key(user_id: str, content_hash: str) -> str:
+    """Build cache key for a user's earlier conversion of identical input."""
+    return f"conversions:dedup:{user_id}:{content_hash}"
+
+
+def user_conversions_cache_key(user_id: str) -> str:
+    """Build cache key for the set of a user's stored conversion IDs."""
+    return f"conversions:user:{user_id}"
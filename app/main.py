@@ -11,7 +11,10 @@ from sqlalchemy import select
 from app.api.v1.router import api_router
 from app.config import get_settings
 from app.core.database import async_session_maker, close_db, init_db
+from app.core.http_client import close_http_client
+from app.core.redis_cache import close_redis
 from app.models.scheduled_validation import ScheduledValidationJob
+from app.services.converter.service import shutdown_process_pool
 from app.services.scheduled_validation.service import run_scheduled_validation_job
 from app.services.scheduler.service import SchedulerService
 
@@ -72,6 +75,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     await close_db()
     logger.info("Database connections closed")
 
+    await close_redis()
+
+    await close_http_client()
+
+    shutdown_process_pool()
+
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
@@ -27,6 +27,9 @@ class IntegrationSettings(Base):
     """
 
     __tablename__ = "integration_settings"
+    # Fetch server-generated timestamps via RETURNING on flush instead of a
+    # separate refresh SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid4
@@ -14,6 +14,9 @@ class InvoiceDraft(Base):
     """Draft invoice for the invoice creator wizard."""
 
     __tablename__ = "invoice_drafts"
+    # Fetch server-generated timestamps via RETURNING on flush instead of a
+    # separate refresh SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid4
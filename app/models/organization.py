@@ -1,5 +1,6 @@
 """Organization and team management models."""
 
+import hashlib
 import secrets
 from datetime import UTC, date, datetime
 from enum import StrEnum
@@ -24,6 +25,16 @@ from app.core.database import Base
 from app.models.user import PlanType
 
 
+def generate_invitation_token() -> str:
+    """Generate a secure token for an invitation link."""
+    return secrets.token_urlsafe(32)
+
+
+def hash_invitation_token(token: str) -> str:
+    """Hash an invitation token for storage and lookup."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
 class OrganizationRole(StrEnum):
     """Role within an organization."""
 
@@ -37,6 +48,10 @@ class Organization(Base):
 
     __tablename__ = "organizations"
 
+    # Fetch server-generated timestamps via RETURNING on flush instead of a
+    # separate refresh SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid4
     )
@@ -196,10 +211,8 @@ class OrganizationInvitation(Base):
         default=OrganizationRole.MEMBER,
     )
 
-    # Secure token for invitation link
-    token: Mapped[str] = mapped_column(
-        String(64), unique=True, index=True, default=lambda: secrets.token_urlsafe(32)
-    )
+    # Hash of the invitation link token; the token itself is only sent by email
+    token_hash: Mapped[str] = mapped_column(String(64), unique=True, index=True)
 
     # Who created the invitation
     created_by_id: Mapped[UUID] = mapped_column(
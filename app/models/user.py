@@ -20,6 +20,55 @@ class PlanType(StrEnum):
     STEUERBERATER = "steuerberater"
 
 
+# Monthly validations per plan (None = unlimited)
+VALIDATION_LIMITS: dict[PlanType, int | None] = {
+    PlanType.FREE: 5,
+    PlanType.STARTER: 100,
+    PlanType.PRO: None,  # Unlimited
+    PlanType.STEUERBERATER: None,  # Unlimited
+}
+
+# Monthly conversions per plan
+CONVERSION_LIMITS: dict[PlanType, int] = {
+    PlanType.FREE: 0,
+    PlanType.STARTER: 20,
+    PlanType.PRO: 100,
+    PlanType.STEUERBERATER: 500,
+}
+
+# Monthly API calls per plan
+API_CALLS_LIMITS: dict[PlanType, int] = {
+    PlanType.FREE: 0,
+    PlanType.STARTER: 0,
+    PlanType.PRO: 1000,
+    PlanType.STEUERBERATER: 5000,
+}
+
+# Maximum API keys per plan
+MAX_API_KEYS: dict[PlanType, int] = {
+    PlanType.FREE: 0,
+    PlanType.STARTER: 0,
+    PlanType.PRO: 5,
+    PlanType.STEUERBERATER: 20,
+}
+
+# Maximum clients per plan
+MAX_CLIENTS: dict[PlanType, int] = {
+    PlanType.FREE: 0,
+    PlanType.STARTER: 0,
+    PlanType.PRO: 0,
+    PlanType.STEUERBERATER: 100,
+}
+
+# Maximum webhooks per plan
+MAX_WEBHOOKS: dict[PlanType, int] = {
+    PlanType.FREE: 0,
+    PlanType.STARTER: 0,
+    PlanType.PRO: 5,
+    PlanType.STEUERBERATER: 20,
+}
+
+
 class User(Base):
     """User account model."""
 
@@ -81,23 +130,11 @@ class User(Base):
 
     def get_validation_limit(self) -> int | None:
         """Return monthly validation limit based on plan. None = unlimited."""
-        limits = {
-            PlanType.FREE: 5,
-            PlanType.STARTER: 100,
-            PlanType.PRO: None,  # Unlimited
-            PlanType.STEUERBERATER: None,  # Unlimited
-        }
-        return limits[self.plan]
+        return VALIDATION_LIMITS[self.plan]
 
     def get_conversion_limit(self) -> int:
         """Return monthly conversion limit based on plan."""
-        limits = {
-            PlanType.FREE: 0,
-            PlanType.STARTER: 20,
-            PlanType.PRO: 100,
-            PlanType.STEUERBERATER: 500,
-        }
-        return limits[self.plan]
+        return CONVERSION_LIMITS[self.plan]
 
     def can_validate(self) -> bool:
         """Check if user can perform another validation."""
@@ -117,23 +154,11 @@ class User(Base):
 
     def get_api_calls_limit(self) -> int:
         """Return monthly API call limit based on plan."""
-        limits = {
-            PlanType.FREE: 0,
-            PlanType.STARTER: 0,
-            PlanType.PRO: 1000,
-            PlanType.STEUERBERATER: 5000,
-        }
-        return limits[self.plan]
+        return API_CALLS_LIMITS[self.plan]
 
     def get_max_api_keys(self) -> int:
         """Return maximum number of API keys allowed based on plan."""
-        limits = {
-            PlanType.FREE: 0,
-            PlanType.STARTER: 0,
-            PlanType.PRO: 5,
-            PlanType.STEUERBERATER: 20,
-        }
-        return limits[self.plan]
+        return MAX_API_KEYS[self.plan]
 
     # Relationships
     api_keys = relationship("APIKey", back_populates="user", cascade="all, delete-orphan")
@@ -160,13 +185,7 @@ class User(Base):
 
     def get_max_clients(self) -> int:
         """Return maximum number of clients allowed based on plan."""
-        limits = {
-            PlanType.FREE: 0,
-            PlanType.STARTER: 0,
-            PlanType.PRO: 0,
-            PlanType.STEUERBERATER: 100,
-        }
-        return limits[self.plan]
+        return MAX_CLIENTS[self.plan]
 
     def can_use_webhooks(self) -> bool:
         """Check if user's plan allows webhook access."""
@@ -174,13 +193,7 @@ class User(Base):
 
     def get_max_webhooks(self) -> int:
         """Return maximum number of webhooks allowed based on plan."""
-        limits = {
-            PlanType.FREE: 0,
-            PlanType.STARTER: 0,
-            PlanType.PRO: 5,
-            PlanType.STEUERBERATER: 20,
-        }
-        return limits[self.plan]
+        return MAX_WEBHOOKS[self.plan]
 
     def can_use_integrations(self) -> bool:
         """Check if user's plan allows third-party integrations."""
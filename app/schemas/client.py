@@ -3,7 +3,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 
 class ClientCreate(BaseModel):
@@ -53,6 +53,8 @@ class ClientUpdate(BaseModel):
 class ClientResponse(BaseModel):
     """Client information response."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     name: str
     client_number: str | None
@@ -81,6 +83,8 @@ class ClientResponse(BaseModel):
 class ClientListItem(BaseModel):
     """Simplified client info for list views."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     name: str
     client_number: str | None
@@ -98,6 +102,7 @@ class ClientList(BaseModel):
     page: int
     page_size: int
     max_clients: int
+    next_cursor: str | None = Field(None, description="Cursor for the next page, if any")
 
 
 class ClientStats(BaseModel):
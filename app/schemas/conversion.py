@@ -4,7 +4,7 @@ from datetime import date
 from decimal import Decimal
 from enum import StrEnum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class OutputFormat(StrEnum):
@@ -119,6 +119,8 @@ class ConversionRequest(BaseModel):
 class ValidationErrorSchema(BaseModel):
     """Validation error/warning for conversion result."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     severity: str
     code: str
     message_de: str
@@ -130,6 +132,8 @@ class ValidationErrorSchema(BaseModel):
 class ValidationResultSchema(BaseModel):
     """Simplified validation result for conversion response."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     is_valid: bool
     error_count: int = 0
     warning_count: int = 0
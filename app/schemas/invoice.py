@@ -143,6 +143,8 @@ class InvoiceDraftList(BaseModel):
 
     drafts: list[InvoiceDraftListItem]
     total: int
+    page: int
+    page_size: int
 
 
 class GenerateInvoiceResponse(BaseModel):
@@ -44,6 +44,8 @@ class OrganizationListResponse(BaseModel):
 
     organizations: list[OrganizationResponse]
     total: int
+    page: int
+    page_size: int
 
 
 class MemberInvite(BaseModel):
@@ -0,0 +1,40 @@
+"""Bounded thread offloading for CPU-bound conversion steps."""
+
+import os
+from collections.abc import Callable
+from typing import TypeVar
+
+import anyio
+import anyio.to_thread
+
+from app.config import get_settings
+
+T = TypeVar("T")
+
+# Created on first use: a CapacityLimiter needs a running event loop
+_limiter: anyio.CapacityLimiter | None = None
+
+
+def _get_limiter() -> anyio.CapacityLimiter:
+    """Get the per-process limiter for conversion threads."""
+    global _limiter
+    if _limiter is None:
+        threads = get_settings().conversion_threads or max(1, (os.cpu_count() or 2) - 1)
+        _limiter = anyio.CapacityLimiter(threads)
+    return _limiter
+
+
+async def run_cpu_bound(func: Callable[..., T], *args: object) -> T:
+    """Run a CPU-bound conversion step in a worker thread.
+
+    Concurrent steps are capped, so a burst of uploads queues here instead of
+    taking every thread that other endpoints need for their own offloaded work.
+
+    Args:
+        func: Synchronous function to run
+        *args: Positional arguments for func
+
+    Returns:
+        The function's return value
+    """
+    return await anyio.to_thread.run_sync(func, *args, limiter=_get_limiter())
@@ -13,6 +13,7 @@ try:
 except ImportError:
     PDFPLUMBER_AVAILABLE = False
 
+from app.services.converter.concurrency import run_cpu_bound
 from app.services.converter.ocr import OCRService
 
 # Import rate limit error for re-raising
@@ -121,6 +122,9 @@ class InvoiceData:
     confidence: float = 0.0
     warnings: list[str] = field(default_factory=list)
 
+    # Set by text extraction when the PDF has little or no text layer
+    is_scanned: bool = False
+
     def get_tax_breakdowns(self) -> list[TaxBreakdown]:
         """Get tax breakdowns, computing from line items if not set."""
         if self.tax_breakdowns:
@@ -242,7 +246,7 @@ class InvoiceExtractor:
         if self.ai_available:
             try:
                 # Convert PDF pages to images for vision model
-                page_images = self.ocr_service.convert_pdf_to_images(pdf_content)
+                page_images = await run_cpu_bound(self.ocr_service.convert_pdf_to_images, pdf_content)
                 if page_images:
                     logger.info(f"Using AI extraction for {len(page_images)} page(s)")
                     result = await self.ai_extractor.extract_from_pdf_pages(page_images)
@@ -259,8 +263,8 @@ class InvoiceExtractor:
                     raise
                 logger.warning(f"AI extraction failed, falling back to pattern matching: {e}")
 
-        # Fall back to pattern matching
-        return self.extract_from_pdf(pdf_content)
+        # Fall back to pattern matching, off the event loop (may run OCR)
+        return await run_cpu_bound(self.extract_from_pdf, pdf_content)
 
     def extract_from_pdf(self, pdf_content: bytes) -> InvoiceData:
         """
@@ -272,8 +276,9 @@ class InvoiceExtractor:
         Returns:
             Extracted invoice data
         """
-        text = self.ocr_service.extract_text_from_pdf(pdf_content)
+        text, is_scanned = self.ocr_service.extract_text_and_scan_state(pdf_content)
         data = self.extract_from_text(text)
+        data.is_scanned = is_scanned
 
         # Try to extract tables using pdfplumber for better line item detection
         if PDFPLUMBER_AVAILABLE and not data.line_items:
@@ -10,6 +10,18 @@ import fitz  # PyMuPDF
 
 from app.services.converter.extractor import InvoiceData, TaxBreakdown, get_vat_category
 
+XML_DECLARATION = "<?xml version='1.0' encoding='UTF-8'?>\n"
+
+
+def _serialize_xml(root: ET.Element) -> bytes:
+    """Pretty-print an XML tree and serialize it as UTF-8 with XML declaration.
+
+    Serializing to str and encoding once is noticeably faster than writing to a
+    binary stream, where ElementTree encodes every fragment separately.
+    """
+    ET.indent(root, space="    ")
+    return (XML_DECLARATION + ET.tostring(root, encoding="unicode")).encode("utf-8")
+
 
 class XRechnungGenerator:
     """Generate XRechnung (UBL) XML from invoice data."""
@@ -110,18 +122,7 @@ class XRechnungGenerator:
         # Invoice lines
         self._add_invoice_lines(root, data)
 
-        # Pretty-print XML
-        ET.indent(root, space="    ")
-
-        # Generate XML string
-        tree = ET.ElementTree(root)
-        buffer = io.BytesIO()
-        tree.write(
-            buffer,
-            encoding="UTF-8",
-            xml_declaration=True,
-        )
-        return buffer.getvalue()
+        return _serialize_xml(root)
 
     def _add_element(
         self, parent: ET.Element, tag: str, text: str
@@ -658,14 +659,7 @@ class ZUGFeRDGenerator:
         )
         due_amount.text = f"{data.gross_amount or Decimal('0'):.2f}"
 
-        # Pretty-print XML
-        ET.indent(root, space="    ")
-
-        # Generate XML string
-        tree = ET.ElementTree(root)
-        buffer = io.BytesIO()
-        tree.write(buffer, encoding="UTF-8", xml_declaration=True)
-        return buffer.getvalue()
+        return _serialize_xml(root)
 
     def embed_in_pdf(
         self, pdf_content: bytes, xml_content: bytes, original_filename: str = "factur-x.xml"
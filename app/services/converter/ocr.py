@@ -2,6 +2,7 @@
 
 import io
 import logging
+from functools import cached_property
 
 import fitz  # PyMuPDF
 
@@ -21,6 +22,9 @@ class OCRService:
     # DPI for rendering PDF pages as images
     DEFAULT_DPI = 300
 
+    # Text layer size from which a PDF counts as born-digital (no OCR needed)
+    BORN_DIGITAL_MIN_CHARS = 200
+
     # Tesseract language configuration for German
     LANG = "deu+eng"
 
@@ -34,9 +38,9 @@ class OCRService:
         if tesseract_cmd and TESSERACT_AVAILABLE:
             pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
 
-    @property
+    @cached_property
     def is_available(self) -> bool:
-        """Check if OCR is available."""
+        """Check if OCR is available (checked once, as it runs tesseract)."""
         if not TESSERACT_AVAILABLE:
             return False
         try:
@@ -63,23 +67,46 @@ class OCRService:
         Returns:
             Extracted text from all pages
         """
-        doc = fitz.open(stream=pdf_content, filetype="pdf")
-        all_text = []
+        text, _ = self.extract_text_and_scan_state(pdf_content, use_ocr=use_ocr, dpi=dpi)
+        return text
 
-        for page_num in range(len(doc)):
-            page = doc[page_num]
+    def extract_text_and_scan_state(
+        self,
+        pdf_content: bytes,
+        use_ocr: bool = True,
+        dpi: int = DEFAULT_DPI,
+    ) -> tuple[str, bool]:
+        """
+        Extract text from PDF and detect whether it is scanned in one pass.
 
-            # Try to extract text directly first
-            text = page.get_text("text").strip()
+        Scan detection applies the same rule as is_scanned_pdf to the
+        directly extracted text, so the PDF is only opened once.
+
+        Args:
+            pdf_content: PDF file content as bytes
+            use_ocr: Whether to use OCR for scanned pages
+            dpi: DPI for rendering pages as images
+
+        Returns:
+            Tuple of extracted text from all pages and scanned flag
+        """
+        doc = fitz.open(stream=pdf_content, filetype="pdf")
+        total_pages = len(doc)
 
-            # If no text found and OCR is enabled, use OCR
-            if not text and use_ocr and self.is_available:
-                text = self._ocr_page(page, dpi)
+        # Extract the text layer directly first
+        page_texts = [doc[page_num].get_text("text").strip() for page_num in range(total_pages)]
+        pages_without_text = sum(1 for text in page_texts[:3] if len(text) < 50)  # Very little text
 
-            all_text.append(text)
+        # Only OCR empty pages when the document lacks a usable text layer;
+        # blank pages of born-digital PDFs (e.g. empty back sides) are skipped
+        born_digital = sum(len(text) for text in page_texts) >= self.BORN_DIGITAL_MIN_CHARS
+        if use_ocr and not born_digital and self.is_available:
+            for page_num, text in enumerate(page_texts):
+                if not text:
+                    page_texts[page_num] = self._ocr_page(doc[page_num], dpi)
 
         doc.close()
-        return "\n\n".join(all_text)
+        return "\n\n".join(page_texts), pages_without_text > total_pages // 2
 
     def _ocr_page(self, page: fitz.Page, dpi: int = DEFAULT_DPI) -> str:
         """
@@ -1,8 +1,14 @@
 """Main conversion service orchestrating PDF to e-invoice conversion."""
 
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from enum import StrEnum
+from functools import lru_cache
 
+from app.config import get_settings
+from app.services.converter.concurrency import run_cpu_bound
 from app.services.converter.extractor import InvoiceData, InvoiceExtractor
 from app.services.converter.generator import XRechnungGenerator, ZUGFeRDGenerator
 from app.services.converter.ocr import OCRService
@@ -38,6 +44,24 @@ class ConversionResult:
     xml_content: bytes | None = None  # Always contains the XML, even for ZUGFeRD PDFs
 
 
+SCANNED_PDF_WARNING = (
+    "PDF scheint gescannt zu sein. OCR wird verwendet - bitte pruefen Sie die extrahierten Daten."
+)
+
+
+def _ocr_unavailable_result(output_format: OutputFormat) -> ConversionResult:
+    """Failed result for scanned PDFs that cannot be read without OCR."""
+    return ConversionResult(
+        success=False,
+        output_format=output_format,
+        content=b"",
+        filename="",
+        extracted_data=InvoiceData(),
+        warnings=[],
+        error="OCR ist nicht verfuegbar. Installieren Sie Tesseract fuer gescannte PDFs.",
+    )
+
+
 class ConversionService:
     """Service for converting PDFs to e-invoice formats."""
 
@@ -76,27 +100,9 @@ class ConversionService:
         """
         warnings: list[str] = []
 
-        # Check if PDF is scanned
-        if self.ocr_service.is_scanned_pdf(pdf_content):
-            if not self.ocr_service.is_available:
-                return ConversionResult(
-                    success=False,
-                    output_format=output_format,
-                    content=b"",
-                    filename="",
-                    extracted_data=InvoiceData(),
-                    warnings=[],
-                    error="OCR ist nicht verfuegbar. Installieren Sie Tesseract fuer gescannte PDFs.",
-                )
-            warnings.append(
-                "PDF scheint gescannt zu sein. OCR wird verwendet - "
-                "bitte pruefen Sie die extrahierten Daten."
-            )
-
         # Extract invoice data
         try:
             data = self.extractor.extract_from_pdf(pdf_content)
-            warnings.extend(data.warnings)
         except Exception as e:
             return ConversionResult(
                 success=False,
@@ -108,6 +114,13 @@ class ConversionService:
                 error=f"Fehler bei der Datenextraktion: {str(e)}",
             )
 
+        # Scan detection comes from the extraction's text pass
+        if data.is_scanned:
+            if not self.ocr_service.is_available:
+                return _ocr_unavailable_result(output_format)
+            warnings.append(SCANNED_PDF_WARNING)
+        warnings.extend(data.warnings)
+
         # Check extraction quality
         if data.confidence < 0.3:
             warnings.append(
@@ -164,17 +177,21 @@ class ConversionService:
         """
         return self.extractor.extract_from_pdf(pdf_content)
 
-    async def preview_extraction_async(self, pdf_content: bytes) -> InvoiceData:
+    async def preview_extraction_async(self, pdf_content: bytes) -> tuple[InvoiceData, bool]:
         """
         Preview extracted data using AI-enhanced extraction if available.
 
+        Scan detection comes from the text extraction pass. It is skipped
+        when the AI extractor reads the rendered pages instead.
+
         Args:
             pdf_content: PDF file content as bytes
 
         Returns:
-            Extracted invoice data
+            Tuple of extracted invoice data and whether the PDF appears scanned
         """
-        return await self.extractor.extract_from_pdf_async(pdf_content)
+        data = await self.extractor.extract_from_pdf_async(pdf_content)
+        return data, data.is_scanned
 
     async def convert_async(
         self,
@@ -197,28 +214,9 @@ class ConversionService:
         """
         warnings: list[str] = []
 
-        # Check if PDF is scanned
-        if self.ocr_service.is_scanned_pdf(pdf_content):
-            if not self.ocr_service.is_available and not self.extractor.ai_available:
-                return ConversionResult(
-                    success=False,
-                    output_format=output_format,
-                    content=b"",
-                    filename="",
-                    extracted_data=InvoiceData(),
-                    warnings=[],
-                    error="OCR ist nicht verfuegbar. Installieren Sie Tesseract fuer gescannte PDFs.",
-                )
-            if not self.extractor.ai_available:
-                warnings.append(
-                    "PDF scheint gescannt zu sein. OCR wird verwendet - "
-                    "bitte pruefen Sie die extrahierten Daten."
-                )
-
         # Extract invoice data (using AI if available)
         try:
             data = await self.extractor.extract_from_pdf_async(pdf_content)
-            warnings.extend(data.warnings)
         except Exception as e:
             return ConversionResult(
                 success=False,
@@ -230,6 +228,14 @@ class ConversionService:
                 error=f"Fehler bei der Datenextraktion: {str(e)}",
             )
 
+        # Scan detection comes from the extraction's text pass; the AI
+        # extractor reads rendered pages and needs neither OCR nor a warning
+        if data.is_scanned and not self.extractor.ai_available:
+            if not self.ocr_service.is_available:
+                return _ocr_unavailable_result(output_format)
+            warnings.append(SCANNED_PDF_WARNING)
+        warnings.extend(data.warnings)
+
         # Check extraction quality
         if data.confidence < 0.3:
             warnings.append(
@@ -247,7 +253,7 @@ class ConversionService:
                 generator = ZUGFeRDGenerator(profile=zugferd_profile.value)
                 xml_content = generator.generate_xml(data)
                 if embed_in_pdf:
-                    content = generator.generate_pdf(data, source_pdf=pdf_content)
+                    content = await run_cpu_bound(generator.generate_pdf, data, pdf_content)
                     filename = f"zugferd_{data.invoice_number or 'invoice'}.pdf"
                 else:
                     content = xml_content
@@ -283,3 +289,48 @@ class ConversionService:
     def ai_available(self) -> bool:
         """Check if AI extraction is available."""
         return self.extractor.ai_available
+
+
+@lru_cache
+def get_conversion_service() -> ConversionService:
+    """Get the shared conversion service, created on first use rather than at import."""
+    return ConversionService()
+
+
+# Batch conversions run in worker processes: extraction, OCR and PDF
+# generation are CPU-bound and would otherwise block the event loop.
+# Workers are spawned rather than forked, so they do not inherit the
+# server's threads, locks or open database/Redis sockets.
+_process_pool: ProcessPoolExecutor | None = None
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Get or create the shared conversion process pool."""
+    global _process_pool
+    if _process_pool is None:
+        workers = get_settings().conversion_workers or min(os.cpu_count() or 1, 8)
+        _process_pool = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    """Shut down the conversion process pool."""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
+def convert_in_worker(
+    pdf_content: bytes,
+    output_format: OutputFormat,
+    zugferd_profile: ZUGFeRDProfile,
+) -> ConversionResult:
+    """Convert a PDF inside a pool worker, reusing one service per process."""
+    return get_conversion_service().convert(
+        pdf_content=pdf_content,
+        output_format=output_format,
+        zugferd_profile=zugferd_profile,
+    )
@@ -1,6 +1,7 @@
 """Email sending service."""
 
 import logging
+from html import escape
 
 import httpx
 
@@ -961,6 +962,43 @@ https://rechnungschecker.de
             logger.error(f"Failed to send invoice email to {to}: {e}")
             return False
 
+    async def send_invitation_email(
+        self,
+        to: str,
+        inviter: str,
+        organization_name: str,
+        role: str,
+        invite_url: str,
+    ) -> bool:
+        """
+        Send an invitation to join an organization.
+
+        Inviter and organization names are user input and are HTML-escaped.
+
+        Args:
+            to: Recipient email address
+            inviter: Name or email of the inviting user
+            organization_name: Name of the organization
+            role: Role the invitee will get
+            invite_url: Link to accept the invitation
+
+        Returns:
+            True if email was sent successfully
+        """
+        subject = f"Einladung zu {organization_name} - RechnungsChecker"
+
+        html_content = f"""
+        <h2>Sie wurden eingeladen!</h2>
+        <p>{escape(inviter)} hat Sie eingeladen,
+        dem Team <strong>{escape(organization_name)}</strong> bei RechnungsChecker beizutreten.</p>
+        <p>Ihre Rolle: <strong>{escape(role)}</strong></p>
+        <p><a href="{escape(invite_url)}" style="background-color: #2563eb; color: white; padding: 10px 20px;
+        text-decoration: none; border-radius: 5px;">Einladung annehmen</a></p>
+        <p>Dieser Link ist 7 Tage gueltig.</p>
+        """
+
+        return await self.send_email(to, subject, html_content)
+
 
 # Singleton instance
 email_service = EmailService()
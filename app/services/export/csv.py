@@ -2,6 +2,7 @@
 
 import csv
 import io
+from collections.abc import AsyncIterator
 from datetime import date, datetime
 from uuid import UUID
 
@@ -13,6 +14,9 @@ from app.models.client import Client
 from app.models.validation import FileType, ValidationLog
 from app.schemas.export import ExportFormat, ValidationStatus
 
+# Rows fetched from the database and written per streamed CSV chunk
+EXPORT_BATCH_SIZE = 1000
+
 
 class ExportService:
     """Service for exporting data to CSV format."""
@@ -70,6 +74,14 @@ class ExportService:
         """Get CSV delimiter based on format."""
         return ";" if format == ExportFormat.CSV_DATEV else ","
 
+    @staticmethod
+    def _drain(output: io.StringIO) -> str:
+        """Return the buffered CSV text and reset the buffer for the next chunk."""
+        chunk = output.getvalue()
+        output.seek(0)
+        output.truncate(0)
+        return chunk
+
     @staticmethod
     def _format_bool(value: bool) -> str:
         """Format boolean as German Ja/Nein."""
@@ -107,8 +119,8 @@ class ExportService:
         date_to: date | None = None,
         status: ValidationStatus = ValidationStatus.ALL,
         format: ExportFormat = ExportFormat.CSV_DATEV,
-    ) -> str:
-        """Export validations as CSV.
+    ) -> AsyncIterator[str]:
+        """Export validations as CSV, streamed in chunks of EXPORT_BATCH_SIZE rows.
 
         Args:
             user_id: User ID to export validations for
@@ -118,8 +130,8 @@ class ExportService:
             status: Validation status filter
             format: Export format (DATEV or Excel)
 
-        Returns:
-            CSV string with UTF-8 BOM
+        Yields:
+            CSV text chunks, the first one starting with the UTF-8 BOM
         """
         # Build query
         query = (
@@ -148,9 +160,6 @@ class ExportService:
         elif status == ValidationStatus.INVALID:
             query = query.where(ValidationLog.is_valid == False)  # noqa: E712
 
-        result = await self.db.execute(query)
-        validations = result.scalars().all()
-
         # Generate CSV
         output = io.StringIO()
         delimiter = self._get_delimiter(format)
@@ -159,35 +168,37 @@ class ExportService:
         # Write BOM and headers
         output.write(self.UTF8_BOM)
         writer.writerow(self.VALIDATION_HEADERS)
-
-        # Write data rows
-        for v in validations:
-            client_number = ""
-            client_name = ""
-            if v.client:
-                client_number = self._safe_str(v.client.client_number)
-                client_name = v.client.name
-
-            row = [
-                str(v.id),
-                client_number,
-                client_name,
-                self._safe_str(v.file_name),
-                self._format_file_type(v.file_type),
-                self._format_bool(v.is_valid),
-                v.error_count,
-                v.warning_count,
-                v.info_count,
-                self._safe_str(v.xrechnung_version),
-                self._safe_str(v.zugferd_profile),
-                v.processing_time_ms,
-                v.validator_version,
-                self._safe_str(v.notes),
-                self._format_datetime(v.created_at),
-            ]
-            writer.writerow(row)
-
-        return output.getvalue()
+        yield self._drain(output)
+
+        # Write data rows batch by batch as they arrive from the database
+        result = await self.db.stream_scalars(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        async for validations in result.partitions():
+            for v in validations:
+                client_number = ""
+                client_name = ""
+                if v.client:
+                    client_number = self._safe_str(v.client.client_number)
+                    client_name = v.client.name
+
+                row = [
+                    str(v.id),
+                    client_number,
+                    client_name,
+                    self._safe_str(v.file_name),
+                    self._format_file_type(v.file_type),
+                    self._format_bool(v.is_valid),
+                    v.error_count,
+                    v.warning_count,
+                    v.info_count,
+                    self._safe_str(v.xrechnung_version),
+                    self._safe_str(v.zugferd_profile),
+                    v.processing_time_ms,
+                    v.validator_version,
+                    self._safe_str(v.notes),
+                    self._format_datetime(v.created_at),
+                ]
+                writer.writerow(row)
+            yield self._drain(output)
 
     async def export_clients(
         self,
@@ -196,7 +207,7 @@ class ExportService:
         date_from: date | None = None,
         date_to: date | None = None,
         format: ExportFormat = ExportFormat.CSV_DATEV,
-    ) -> str:
+    ) -> AsyncIterator[str]:
         """Export clients as CSV with validation statistics.
 
         Args:
@@ -206,8 +217,8 @@ class ExportService:
             date_to: Optional date filter for validation stats
             format: Export format (DATEV or Excel)
 
-        Returns:
-            CSV string with UTF-8 BOM
+        Yields:
+            CSV text chunks, the first one starting with the UTF-8 BOM
         """
         # Build query for clients
         query = select(Client).where(Client.user_id == user_id).order_by(Client.name)
@@ -269,7 +280,7 @@ class ExportService:
         writer.writerow(self.CLIENT_HEADERS)
 
         # Write data rows
-        for c in clients:
+        for index, c in enumerate(clients, start=1):
             stats = client_stats.get(c.id, {"total": 0, "valid": 0, "invalid": 0})
 
             row = [
@@ -293,5 +304,7 @@ class ExportService:
                 self._format_datetime(c.created_at),
             ]
             writer.writerow(row)
+            if index % EXPORT_BATCH_SIZE == 0:
+                yield self._drain(output)
 
-        return output.getvalue()
+        yield self._drain(output)
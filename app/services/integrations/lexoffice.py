@@ -1,16 +1,16 @@
 """Lexoffice API integration service."""
 
-import json
+import asyncio
 import logging
 from uuid import UUID
 
-import httpx
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.encryption import encryption_service
+from app.core.http_client import get_http_client
 from app.models.integration import IntegrationSettings, IntegrationType
 from app.schemas.integration import LexofficeInvoiceList
+from app.services.integrations.service import IntegrationService
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +23,9 @@ class LexofficeService:
 
     TIMEOUT_SECONDS = 30
 
+    # Lexoffice allows about two requests per second per API key
+    MAX_CONCURRENT_REQUESTS = 2
+
     def __init__(self, db: AsyncSession | None = None):
         """Initialize Lexoffice service.
 
@@ -66,7 +69,7 @@ class LexofficeService:
         if not integration:
             return None
 
-        return json.loads(encryption_service.decrypt(integration.encrypted_config))
+        return IntegrationService.get_config(integration)
 
     async def list_invoices(
         self,
@@ -107,13 +110,13 @@ class LexofficeService:
         if status:
             params["voucherStatus"] = status
 
-        async with httpx.AsyncClient(timeout=self.TIMEOUT_SECONDS) as client:
-            response = await client.get(
-                f"{LEXOFFICE_API_BASE}/voucherlist",
-                headers=headers,
-                params=params,
-            )
-            response.raise_for_status()
+        response = await get_http_client().get(
+            f"{LEXOFFICE_API_BASE}/voucherlist",
+            headers=headers,
+            params=params,
+            timeout=self.TIMEOUT_SECONDS,
+        )
+        response.raise_for_status()
 
         return LexofficeInvoiceList(**response.json())
 
@@ -140,13 +143,52 @@ class LexofficeService:
             "Accept": "application/json",
         }
 
-        async with httpx.AsyncClient(timeout=self.TIMEOUT_SECONDS) as client:
-            response = await client.get(
-                f"{LEXOFFICE_API_BASE}/invoices/{invoice_id}",
-                headers=headers,
-            )
-            response.raise_for_status()
+        return await self._fetch_invoice(headers, invoice_id)
+
+    async def get_invoices(
+        self, user_id: UUID, invoice_ids: list[str]
+    ) -> list[dict | BaseException]:
+        """Fetch several invoices from Lexoffice concurrently.
+
+        The config is loaded once and at most MAX_CONCURRENT_REQUESTS are
+        in flight at a time.
+
+        Args:
+            user_id: User ID
+            invoice_ids: Lexoffice invoice IDs
+
+        Returns:
+            Invoice data dict or the raised exception per ID, in input order
+
+        Raises:
+            ValueError: If Lexoffice not configured
+        """
+        config = await self.get_user_config(user_id)
+        if not config:
+            raise ValueError("Lexoffice-Integration nicht konfiguriert")
+
+        headers = {
+            "Authorization": f"Bearer {config['api_key']}",
+            "Accept": "application/json",
+        }
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+
+        async def fetch(invoice_id: str) -> dict:
+            async with semaphore:
+                return await self._fetch_invoice(headers, invoice_id)
 
+        return await asyncio.gather(
+            *(fetch(invoice_id) for invoice_id in invoice_ids), return_exceptions=True
+        )
+
+    async def _fetch_invoice(self, headers: dict[str, str], invoice_id: str) -> dict:
+        """Request a single invoice."""
+        response = await get_http_client().get(
+            f"{LEXOFFICE_API_BASE}/invoices/{invoice_id}",
+            headers=headers,
+            timeout=self.TIMEOUT_SECONDS,
+        )
+        response.raise_for_status()
         return response.json()
 
     async def get_invoice_document(
@@ -179,26 +221,29 @@ class LexofficeService:
             "Accept": "application/pdf",
         }
 
-        async with httpx.AsyncClient(timeout=self.TIMEOUT_SECONDS) as client:
-            # Get document file ID first
-            response = await client.get(
-                f"{LEXOFFICE_API_BASE}/invoices/{invoice_id}/document",
-                headers=headers,
-            )
-            response.raise_for_status()
+        client = get_http_client()
 
-            document_info = response.json()
-            document_file_id = document_info.get("documentFileId")
+        # Get document file ID first
+        response = await client.get(
+            f"{LEXOFFICE_API_BASE}/invoices/{invoice_id}/document",
+            headers=headers,
+            timeout=self.TIMEOUT_SECONDS,
+        )
+        response.raise_for_status()
 
-            if not document_file_id:
-                raise ValueError("Kein Dokument fuer diese Rechnung verfuegbar")
+        document_info = response.json()
+        document_file_id = document_info.get("documentFileId")
 
-            # Download the document
-            response = await client.get(
-                f"{LEXOFFICE_API_BASE}/files/{document_file_id}",
-                headers=headers,
-            )
-            response.raise_for_status()
+        if not document_file_id:
+            raise ValueError("Kein Dokument fuer diese Rechnung verfuegbar")
+
+        # Download the document
+        response = await client.get(
+            f"{LEXOFFICE_API_BASE}/files/{document_file_id}",
+            headers=headers,
+            timeout=self.TIMEOUT_SECONDS,
+        )
+        response.raise_for_status()
 
         return response.content
 
@@ -217,12 +262,12 @@ class LexofficeService:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.get(
-                    f"{LEXOFFICE_API_BASE}/profile",
-                    headers=headers,
-                )
-                return response.status_code == 200
+            response = await get_http_client().get(
+                f"{LEXOFFICE_API_BASE}/profile",
+                headers=headers,
+                timeout=10,
+            )
+            return response.status_code == 200
         except Exception as e:
             logger.error(f"Lexoffice connection test failed: {e}")
             return False
@@ -1,18 +1,21 @@
 """Unified notification service for Slack and Teams."""
 
-import json
+import asyncio
 import logging
 from uuid import UUID
 
-import httpx
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.encryption import encryption_service
+from app.core.http_client import get_http_client
 from app.models.integration import IntegrationSettings, IntegrationType
+from app.services.integrations.service import IntegrationService
 
 logger = logging.getLogger(__name__)
 
+# Integration to notify, its webhook URL and the message payload
+NotificationTarget = tuple[IntegrationSettings, str, dict]
+
 
 class NotificationService:
     """Unified notification service for Slack and Teams."""
@@ -210,7 +213,7 @@ class NotificationService:
             "potentialAction": [],
         }
 
-    async def send_validation_notification(
+    async def get_validation_targets(
         self,
         user_id: UUID,
         validation_id: UUID,
@@ -219,8 +222,8 @@ class NotificationService:
         error_count: int,
         warning_count: int,
         info_count: int,
-    ) -> list[tuple[IntegrationType, bool]]:
-        """Send notifications to all enabled integrations.
+    ) -> list[NotificationTarget]:
+        """Load the integrations to notify and build their messages.
 
         Args:
             user_id: User ID
@@ -232,7 +235,7 @@ class NotificationService:
             info_count: Number of info messages
 
         Returns:
-            List of (integration_type, success) tuples
+            List of (integration, webhook_url, payload) tuples
         """
         if self.db is None:
             raise ValueError("Database session required")
@@ -242,70 +245,152 @@ class NotificationService:
             [IntegrationType.SLACK, IntegrationType.TEAMS],
         )
 
-        results = []
-
+        targets = []
         for integration in integrations:
             if not self._should_notify(integration, is_valid, warning_count):
                 continue
 
-            config = json.loads(
-                encryption_service.decrypt(integration.encrypted_config)
-            )
+            config = IntegrationService.get_config(integration)
             webhook_url = config.get("webhook_url")
 
             if not webhook_url:
                 continue
 
-            try:
-                if integration.integration_type == IntegrationType.SLACK:
-                    payload = self._build_slack_message(
-                        file_name,
-                        is_valid,
-                        error_count,
-                        warning_count,
-                        info_count,
-                        validation_id,
-                    )
-                else:  # Teams
-                    payload = self._build_teams_adaptive_card(
-                        file_name,
-                        is_valid,
-                        error_count,
-                        warning_count,
-                        info_count,
-                        validation_id,
-                    )
-
-                async with httpx.AsyncClient(timeout=self.TIMEOUT_SECONDS) as client:
-                    response = await client.post(webhook_url, json=payload)
-                    success = response.status_code in (200, 201, 204)
-
-                # Update statistics
-                integration.record_request(success)
-
-                results.append((integration.integration_type, success))
-
-                if success:
-                    logger.info(
-                        f"Notification sent: user={user_id}, "
-                        f"type={integration.integration_type.value}"
-                    )
-                else:
-                    logger.warning(
-                        f"Notification failed: user={user_id}, "
-                        f"type={integration.integration_type.value}, "
-                        f"status={response.status_code}"
-                    )
-
-            except Exception as e:
-                integration.record_request(success=False)
-                results.append((integration.integration_type, False))
-                logger.error(
-                    f"Notification error: user={user_id}, "
-                    f"type={integration.integration_type.value}, error={e}"
+            if integration.integration_type == IntegrationType.SLACK:
+                payload = self._build_slack_message(
+                    file_name,
+                    is_valid,
+                    error_count,
+                    warning_count,
+                    info_count,
+                    validation_id,
+                )
+            else:  # Teams
+                payload = self._build_teams_adaptive_card(
+                    file_name,
+                    is_valid,
+                    error_count,
+                    warning_count,
+                    info_count,
+                    validation_id,
                 )
+            targets.append((integration, webhook_url, payload))
+
+        return targets
+
+    async def post_notifications(
+        self,
+        user_id: UUID,
+        targets: list[NotificationTarget],
+    ) -> list[tuple[IntegrationType, bool]]:
+        """Post notifications to all targets concurrently.
+
+        Does not touch the database session, so the caller can end its
+        transaction first and commit the updated statistics afterwards.
+
+        Args:
+            user_id: User ID (for logging)
+            targets: Targets from get_validation_targets
+
+        Returns:
+            List of (integration_type, success) tuples
+        """
+        outcomes = await asyncio.gather(
+            *(
+                self._post_notification(user_id, integration, webhook_url, payload)
+                for integration, webhook_url, payload in targets
+            )
+        )
+
+        return [
+            (integration.integration_type, success)
+            for (integration, _, _), success in zip(targets, outcomes, strict=True)
+        ]
+
+    async def send_validation_notification(
+        self,
+        user_id: UUID,
+        validation_id: UUID,
+        file_name: str,
+        is_valid: bool,
+        error_count: int,
+        warning_count: int,
+        info_count: int,
+    ) -> list[tuple[IntegrationType, bool]]:
+        """Send notifications to all enabled integrations concurrently.
+
+        The caller commits the updated request statistics afterwards.
+
+        Args:
+            user_id: User ID
+            validation_id: Validation ID
+            file_name: Name of validated file
+            is_valid: Whether validation passed
+            error_count: Number of errors
+            warning_count: Number of warnings
+            info_count: Number of info messages
+
+        Returns:
+            List of (integration_type, success) tuples
+        """
+        targets = await self.get_validation_targets(
+            user_id,
+            validation_id,
+            file_name,
+            is_valid,
+            error_count,
+            warning_count,
+            info_count,
+        )
+        return await self.post_notifications(user_id, targets)
+
+    async def _post_notification(
+        self,
+        user_id: UUID,
+        integration: IntegrationSettings,
+        webhook_url: str,
+        payload: dict,
+    ) -> bool:
+        """Post one notification and record the outcome on the integration.
+
+        Args:
+            user_id: User ID (for logging)
+            integration: Integration the webhook belongs to
+            webhook_url: Slack or Teams webhook URL
+            payload: Message payload
+
+        Returns:
+            True if the webhook accepted the message
+        """
+        try:
+            response = await get_http_client().post(
+                webhook_url, json=payload, timeout=self.TIMEOUT_SECONDS
+            )
+        except Exception as e:
+            integration.record_request(success=False)
+            logger.error(
+                f"Notification error: user={user_id}, "
+                f"type={integration.integration_type.value}, error={e}"
+            )
+            return False
 
-        return results
+        success = response.status_code in (200, 201, 204)
+
+        # Update statistics
+        integration.record_request(success)
+
+        if success:
+            logger.info(
+                f"Notification sent: user={user_id}, "
+                f"type={integration.integration_type.value}"
+            )
+        else:
+            logger.warning(
+                f"Notification failed: user={user_id}, "
+                f"type={integration.integration_type.value}, "
+                f"status={response.status_code}"
+            )
+        return success
 
     async def test_webhook(
         self,
@@ -342,9 +427,10 @@ class NotificationService:
                     ],
                 }
 
-            async with httpx.AsyncClient(timeout=self.TIMEOUT_SECONDS) as client:
-                response = await client.post(webhook_url, json=payload)
-                return response.status_code in (200, 201, 204)
+            response = await get_http_client().post(
+                webhook_url, json=payload, timeout=self.TIMEOUT_SECONDS
+            )
+            return response.status_code in (200, 201, 204)
 
         except Exception as e:
             logger.error(f"Webhook test failed: {e}")
@@ -2,9 +2,10 @@
 
 import json
 import logging
+from functools import lru_cache
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.encryption import encryption_service
@@ -13,6 +14,15 @@ from app.models.integration import IntegrationSettings, IntegrationType
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=512)
+def _decrypt_config(encrypted_config: str) -> dict:
+    """Decrypt and parse a stored config, cached by its ciphertext.
+
+    Saving a config encrypts it again, so a changed row never hits a stale entry.
+    """
+    return json.loads(encryption_service.decrypt(encrypted_config))
+
+
 class IntegrationService:
     """Service for managing integration settings."""
 
@@ -156,15 +166,33 @@ class IntegrationService:
         Returns:
             True if deleted, False if not found
         """
-        integration = await self.get_integration(user_id, integration_type)
-        if integration:
-            await self.db.delete(integration)
-            await self.db.flush()
-            logger.info(
-                f"Integration deleted: user={user_id}, type={integration_type.value}"
+        result = await self.db.execute(
+            delete(IntegrationSettings)
+            .where(
+                IntegrationSettings.user_id == user_id,
+                IntegrationSettings.integration_type == integration_type,
             )
-            return True
-        return False
+            .returning(IntegrationSettings.id)
+        )
+        if result.scalar_one_or_none() is None:
+            return False
+
+        logger.info(
+            f"Integration deleted: user={user_id}, type={integration_type.value}"
+        )
+        return True
+
+    @staticmethod
+    def get_config(integration: IntegrationSettings) -> dict:
+        """Get the decrypted config of an integration.
+
+        Args:
+            integration: The integration settings
+
+        Returns:
+            Config dict (a copy, safe to modify)
+        """
+        return dict(_decrypt_config(integration.encrypted_config))
 
     @staticmethod
     def get_config_hint(integration: IntegrationSettings) -> str | None:
@@ -177,9 +205,7 @@ class IntegrationService:
             Masked config hint or None
         """
         try:
-            config = json.loads(
-                encryption_service.decrypt(integration.encrypted_config)
-            )
+            config = IntegrationService.get_config(integration)
             if "api_key" in config:
                 key = config["api_key"]
                 if len(key) > 12:
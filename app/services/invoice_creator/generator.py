@@ -4,8 +4,7 @@ import logging
 from datetime import date
 from decimal import Decimal
 from uuid import uuid4
-from xml.dom import minidom
-from xml.etree.ElementTree import Element, SubElement, tostring
+from xml.etree.ElementTree import Element, SubElement, indent, tostring
 
 from app.schemas.invoice import InvoiceData, LineItem, PartyInfo
 
@@ -18,6 +17,8 @@ NAMESPACES = {
     "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
 }
 
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8"?>\n'
+
 # Tax category codes
 TAX_CATEGORIES = {
     "S": "Standard rate",
@@ -205,16 +206,10 @@ class XRechnungGenerator:
         for i, item in enumerate(data.line_items, 1):
             self._add_invoice_line(root, i, item, data.currency)
 
-        # Convert to string with proper formatting
-        xml_string = tostring(root, encoding="unicode")
-        dom = minidom.parseString(xml_string)
-        formatted = dom.toprettyxml(indent="  ", encoding="UTF-8")
-
-        # Remove extra blank lines and fix declaration
-        lines = formatted.decode("utf-8").split("\n")
-        cleaned = "\n".join(line for line in lines if line.strip())
-
-        return cleaned
+        # Indent in place and serialize once; the XML declaration is
+        # prepended instead of round-tripping through a minidom document
+        indent(root, space="  ")
+        return XML_DECLARATION + tostring(root, encoding="unicode")
 
     def _add_text_element(
         self, parent: Element, tag: str, text: str | None
@@ -659,6 +659,8 @@ export interface Organization {
 export interface OrganizationList {
   organizations: Organization[]
   total: number
+  page: number
+  page_size: number
 }
 
 export interface OrganizationCreateRequest {
@@ -791,6 +793,8 @@ export interface InvoiceDraftListItem {
 export interface InvoiceDraftList {
   drafts: InvoiceDraftListItem[]
   total: number
+  page: number
+  page_size: number
 }
 
 export interface InvoiceDraftCreateRequest {
@@ -1,10 +1,14 @@
 """Tests for client management (Mandantenverwaltung) endpoints."""
 
+import asyncio
+import time
 import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from httpx import AsyncClient
 
+from app.api.v1 import clients as clients_api
 from app.models.user import User
 
 
@@ -52,6 +56,139 @@ class TestClientEndpoints:
         )
         assert response.status_code == 200
 
+    @pytest.mark.asyncio
+    async def test_list_clients_returns_items(
+        self, async_client: AsyncClient, test_steuerberater_user: tuple[User, str]
+    ) -> None:
+        """Test listing clients returns created clients ordered by name."""
+        user, token = test_steuerberater_user
+        headers = {"Authorization": f"Bearer {token}"}
+
+        for name in ("Beta GmbH", "Alpha AG"):
+            response = await async_client.post(
+                "/api/v1/clients/", json={"name": name, "client_number": name[:4]}, headers=headers
+            )
+            assert response.status_code == 201
+
+        response = await async_client.get("/api/v1/clients/", headers=headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 2
+        assert [item["name"] for item in data["items"]] == ["Alpha AG", "Beta GmbH"]
+        assert data["items"][0]["client_number"] == "Alph"
+        assert data["items"][0]["is_active"] is True
+        assert data["items"][0]["validation_count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_list_clients_cursor_pagination(
+        self, async_client: AsyncClient, test_steuerberater_user: tuple[User, str]
+    ) -> None:
+        """Test walking the client list with next_cursor."""
+        user, token = test_steuerberater_user
+        headers = {"Authorization": f"Bearer {token}"}
+
+        for name in ("Client C", "Client A", "Client B"):
+            response = await async_client.post("/api/v1/clients/", json={"name": name}, headers=headers)
+            assert response.status_code == 201
+
+        response = await async_client.get("/api/v1/clients/", params={"page_size": 2}, headers=headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["name"] for item in data["items"]] == ["Client A", "Client B"]
+        assert data["next_cursor"]
+
+        response = await async_client.get(
+            "/api/v1/clients/",
+            params={"page_size": 2, "cursor": data["next_cursor"]},
+            headers=headers,
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["name"] for item in data["items"]] == ["Client C"]
+        assert data["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("age, refreshed", [(1, False), (60, True)])
+    async def test_list_clients_first_page_served_from_cache(
+        self,
+        async_client: AsyncClient,
+        test_steuerberater_user: tuple[User, str],
+        age: int,
+        refreshed: bool,
+    ) -> None:
+        """Test the first page is served from cache and revalidated once stale."""
+        user, token = test_steuerberater_user
+        cached = {
+            "items": [
+                {
+                    "id": str(uuid.uuid4()),
+                    "name": "Cached GmbH",
+                    "client_number": None,
+                    "is_active": True,
+                    "validation_count": 3,
+                    "last_validation_at": None,
+                    "created_at": "2026-01-01T00:00:00",
+                }
+            ],
+            "total": 1,
+            "next_cursor": None,
+            "cached_at": time.time() - age,
+        }
+
+        with (
+            patch.object(clients_api, "cache_get", AsyncMock(return_value=cached)),
+            patch.object(clients_api, "_schedule_client_list_refresh") as schedule_refresh,
+        ):
+            response = await async_client.get(
+                "/api/v1/clients/",
+                headers={"Authorization": f"Bearer {token}"},
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["name"] for item in data["items"]] == ["Cached GmbH"]
+        assert data["max_clients"] == user.get_max_clients()
+        assert schedule_refresh.called is refreshed
+
+    @pytest.mark.asyncio
+    async def test_client_list_refresh_runs_once_per_key(self) -> None:
+        """Test stale hits on a key that is already refreshing start no new query."""
+        user_id = uuid.uuid4()
+        release = asyncio.Event()
+
+        async def fetch_page(*args: object) -> tuple[list, int, None]:
+            await release.wait()
+            return [], 0, None
+
+        fetch = AsyncMock(side_effect=fetch_page)
+        with (
+            patch.object(clients_api, "async_session_maker", MagicMock()),
+            patch.object(clients_api, "_fetch_client_page", fetch),
+            patch.object(clients_api, "_cache_client_list", AsyncMock()) as cache_list,
+        ):
+            for cache_key in ("first", "first", "first", "second"):
+                clients_api._schedule_client_list_refresh(user_id, cache_key, 50, False, None)
+            tasks = list(clients_api._refresh_tasks.values())
+            release.set()
+            await asyncio.gather(*tasks)
+
+        assert fetch.await_count == 2
+        assert cache_list.await_count == 2
+        assert clients_api._refresh_tasks == {}
+
+    @pytest.mark.asyncio
+    async def test_list_clients_invalid_cursor(
+        self, async_client: AsyncClient, test_steuerberater_user: tuple[User, str]
+    ) -> None:
+        """Test listing clients with a malformed cursor fails."""
+        user, token = test_steuerberater_user
+        response = await async_client.get(
+            "/api/v1/clients/",
+            params={"cursor": "not-a-cursor"},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        assert response.status_code == 400
+
     @pytest.mark.asyncio
     async def test_create_client_unauthorized(self, async_client: AsyncClient) -> None:
         """Test creating client without authentication fails."""
@@ -119,6 +256,28 @@ class TestClientEndpoints:
         )
         assert response.status_code == 422
 
+    @pytest.mark.asyncio
+    async def test_get_client(
+        self, async_client: AsyncClient, test_steuerberater_user: tuple[User, str]
+    ) -> None:
+        """Test getting a client returns its details."""
+        user, token = test_steuerberater_user
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = await async_client.post(
+            "/api/v1/clients/", json={"name": "Detail GmbH", "vat_id": "DE123456789"}, headers=headers
+        )
+        assert response.status_code == 201
+        client_id = response.json()["id"]
+
+        response = await async_client.get(f"/api/v1/clients/{client_id}", headers=headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["id"] == client_id
+        assert data["name"] == "Detail GmbH"
+        assert data["vat_id"] == "DE123456789"
+        assert data["validation_count"] == 0
+
     @pytest.mark.asyncio
     async def test_update_client_unauthorized(self, async_client: AsyncClient) -> None:
         """Test updating client without authentication fails."""
@@ -136,6 +295,54 @@ class TestClientEndpoints:
         response = await async_client.delete(f"/api/v1/clients/{client_id}")
         assert response.status_code == 401
 
+    @pytest.mark.asyncio
+    async def test_update_client(
+        self, async_client: AsyncClient, test_steuerberater_user: tuple[User, str]
+    ) -> None:
+        """Test updating a client returns the updated fields."""
+        user, token = test_steuerberater_user
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = await async_client.post(
+            "/api/v1/clients/", json={"name": "Alt GmbH", "city": "Berlin"}, headers=headers
+        )
+        assert response.status_code == 201
+        client_id = response.json()["id"]
+
+        response = await async_client.patch(
+            f"/api/v1/clients/{client_id}", json={"name": "Neu GmbH"}, headers=headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["name"] == "Neu GmbH"
+        assert data["city"] == "Berlin"
+
+        response = await async_client.patch(
+            f"/api/v1/clients/{uuid.uuid4()}", json={"name": "Neu GmbH"}, headers=headers
+        )
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_delete_client(
+        self, async_client: AsyncClient, test_steuerberater_user: tuple[User, str]
+    ) -> None:
+        """Test deleting a client removes it and a second delete returns 404."""
+        user, token = test_steuerberater_user
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = await async_client.post("/api/v1/clients/", json={"name": "Zu loeschen GmbH"}, headers=headers)
+        assert response.status_code == 201
+        client_id = response.json()["id"]
+
+        response = await async_client.delete(f"/api/v1/clients/{client_id}", headers=headers)
+        assert response.status_code == 204
+
+        response = await async_client.get(f"/api/v1/clients/{client_id}", headers=headers)
+        assert response.status_code == 404
+
+        response = await async_client.delete(f"/api/v1/clients/{client_id}", headers=headers)
+        assert response.status_code == 404
+
 
 class TestClientStats:
     """Tests for client statistics endpoint."""
@@ -158,6 +365,31 @@ class TestClientStats:
         )
         assert response.status_code == 200
 
+    @pytest.mark.asyncio
+    async def test_get_stats_counts_clients(
+        self, async_client: AsyncClient, test_steuerberater_user: tuple[User, str]
+    ) -> None:
+        """Test client stats reflect total and active clients."""
+        user, token = test_steuerberater_user
+        headers = {"Authorization": f"Bearer {token}"}
+
+        for name in ("Mandant A", "Mandant B"):
+            response = await async_client.post("/api/v1/clients/", json={"name": name}, headers=headers)
+            assert response.status_code == 201
+        client_id = response.json()["id"]
+
+        response = await async_client.patch(
+            f"/api/v1/clients/{client_id}", json={"is_active": False}, headers=headers
+        )
+        assert response.status_code == 200
+
+        response = await async_client.get("/api/v1/clients/stats", headers=headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_clients"] == 2
+        assert data["active_clients"] == 1
+        assert data["total_validations"] == 0
+
 
 class TestClientAccessControl:
     """Tests for client management access control."""
@@ -174,6 +406,20 @@ class TestClientAccessControl:
         response = await async_client.get("/api/v1/clients/")
         assert response.status_code == 401
 
+    @pytest.mark.asyncio
+    async def test_client_access_forbidden_for_pro_plan(
+        self, async_client: AsyncClient, test_pro_user: tuple[User, str]
+    ) -> None:
+        """Test that a Pro user is rejected before the request body is validated."""
+        user, token = test_pro_user
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = await async_client.get("/api/v1/clients/", headers=headers)
+        assert response.status_code == 403
+
+        response = await async_client.post("/api/v1/clients/", json={}, headers=headers)
+        assert response.status_code == 403
+
 
 class TestClientSchemas:
     """Tests for client request/response schemas."""
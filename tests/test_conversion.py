@@ -1,13 +1,32 @@
 """Tests for PDF to e-invoice conversion."""
 
+import uuid
 from datetime import date
 from decimal import Decimal
+from unittest.mock import AsyncMock, patch
 
 import pytest
-
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.conversion_cache import (
+    CachedConversion,
+    delete_user_conversions,
+    get_conversion,
+    store_conversion,
+)
+from app.core.exceptions import UsageLimitError
+from app.core.limits import release_user_conversions, reserve_user_conversion
+from app.models.user import User
 from app.services.converter.extractor import Address, InvoiceData, InvoiceExtractor
 from app.services.converter.generator import XRechnungGenerator, ZUGFeRDGenerator
-from app.services.converter.service import ConversionService, OutputFormat
+from app.services.converter.service import (
+    ConversionService,
+    OutputFormat,
+    ZUGFeRDProfile,
+    convert_in_worker,
+    get_process_pool,
+)
 
 
 class TestInvoiceExtractor:
@@ -193,6 +212,22 @@ class TestXRechnungGenerator:
         assert b"DE89370400440532013000" in xml_content
         assert b"COBADEFFXXX" in xml_content
 
+    def test_generate_encodes_utf8_with_declaration(self) -> None:
+        """Test the XML is UTF-8 encoded with declaration and well-formed."""
+        from xml.etree import ElementTree as ET
+
+        generator = XRechnungGenerator()
+        data = InvoiceData(
+            invoice_number="2024-001",
+            seller=Address(name="Müller & Söhne GmbH", city="Köln"),
+        )
+
+        xml_content = generator.generate(data)
+
+        assert xml_content.startswith(b"<?xml version='1.0' encoding='UTF-8'?>\n")
+        assert "Müller &amp; Söhne GmbH".encode() in xml_content
+        assert ET.fromstring(xml_content).tag.endswith("}Invoice")
+
 
 class TestZUGFeRDGenerator:
     """Tests for ZUGFeRD generation."""
@@ -269,6 +304,41 @@ class TestZUGFeRDGenerator:
 class TestConversionService:
     """Tests for the main conversion service."""
 
+    def test_get_conversion_service_is_shared(self) -> None:
+        """Test the endpoint dependency returns one service per process."""
+        from app.services.converter.service import get_conversion_service
+
+        assert get_conversion_service() is get_conversion_service()
+        assert isinstance(get_conversion_service(), ConversionService)
+
+    @pytest.mark.asyncio
+    async def test_run_cpu_bound_caps_concurrent_threads(self) -> None:
+        """Test CPU-bound conversion steps never exceed the thread limit."""
+        import asyncio
+        import threading
+        import time
+
+        import anyio
+
+        from app.services.converter import concurrency
+
+        lock = threading.Lock()
+        running = peak = 0
+
+        def work() -> None:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+
+        with patch.object(concurrency, "_limiter", anyio.CapacityLimiter(2)):
+            await asyncio.gather(*(concurrency.run_cpu_bound(work) for _ in range(6)))
+
+        assert peak == 2
+
     def test_convert_to_xrechnung(self) -> None:
         """Test PDF to XRechnung conversion."""
         service = ConversionService()
@@ -338,6 +408,36 @@ class TestConversionService:
         assert result.filename.endswith(".pdf")
         assert result.content.startswith(b"%PDF")
 
+    def test_convert_in_process_pool(self) -> None:
+        """Test conversion results survive the round trip through the pool."""
+        import fitz
+        doc = fitz.open()
+        page = doc.new_page()
+        page.insert_text(
+            (72, 100),
+            "Rechnung Nr.: POOL-2024-001\n"
+            "Datum: 15.01.2024\n"
+            "Gesamt: 1.190,00 EUR",
+            fontsize=11,
+        )
+
+        import io
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        doc.close()
+
+        future = get_process_pool().submit(
+            convert_in_worker,
+            buffer.getvalue(),
+            OutputFormat.XRECHNUNG,
+            ZUGFeRDProfile.EN16931,
+        )
+        result = future.result(timeout=60)
+
+        assert result.success
+        assert result.extracted_data.invoice_number == "POOL-2024-001"
+        assert result.xml_content == result.content
+
     def test_preview_extraction(self) -> None:
         """Test preview extraction without conversion."""
         service = ConversionService()
@@ -365,6 +465,80 @@ class TestConversionService:
         assert data.invoice_number == "PREVIEW-001"
         assert data.gross_amount == Decimal("500.00")
 
+    def test_preview_extraction_detects_scanned_pdf(self) -> None:
+        """Test scan detection is reported by the extraction pass."""
+        service = ConversionService()
+
+        import fitz
+        doc = fitz.open()
+        doc.new_page()
+
+        import io
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        doc.close()
+        pdf_content = buffer.getvalue()
+
+        data = service.preview_extraction(pdf_content)
+
+        assert data.is_scanned is True
+        assert data.is_scanned == service.ocr_service.is_scanned_pdf(pdf_content)
+
+    @pytest.mark.asyncio
+    async def test_convert_scanned_pdf_without_ocr_parses_pdf_once(self) -> None:
+        """Test scanned PDFs fail without OCR, using the scan state from extraction."""
+        import io
+
+        import fitz
+
+        from app.services.converter.extractor import InvoiceExtractor
+        from app.services.converter.ocr import OCRService
+
+        doc = fitz.open()
+        doc.new_page()
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        doc.close()
+
+        service = ConversionService()
+        with (
+            patch.object(OCRService, "is_available", False),
+            patch.object(InvoiceExtractor, "ai_available", False),
+            patch.object(OCRService, "is_scanned_pdf") as scan_mock,
+        ):
+            result = await service.convert_async(buffer.getvalue())
+            sync_result = service.convert(buffer.getvalue())
+
+        assert result.success is False
+        assert "OCR ist nicht verfuegbar" in result.error
+        assert sync_result.error == result.error
+        scan_mock.assert_not_called()
+
+    def test_born_digital_pdf_skips_ocr_for_blank_pages(self) -> None:
+        """Test blank pages are only OCR'd when the PDF has no usable text layer."""
+        import fitz
+
+        from app.services.converter.ocr import OCRService
+
+        doc = fitz.open()
+        page = doc.new_page()
+        page.insert_text((72, 100), "Rechnung Nr.: DIGITAL-001\n" * 12, fontsize=11)
+        doc.new_page()  # Empty back side
+
+        import io
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        doc.close()
+
+        ocr_service = OCRService()
+        ocr_service.is_available = True
+        with patch.object(OCRService, "_ocr_page", return_value="OCR") as ocr_mock:
+            text, is_scanned = ocr_service.extract_text_and_scan_state(buffer.getvalue())
+
+        ocr_mock.assert_not_called()
+        assert "DIGITAL-001" in text
+        assert is_scanned is False
+
     def test_ocr_availability(self) -> None:
         """Test OCR availability check."""
         service = ConversionService()
@@ -374,6 +548,79 @@ class TestConversionService:
         is_available = service.ocr_available
         assert isinstance(is_available, bool)
 
+    def test_invoice_data_to_schema_flattens_addresses(self) -> None:
+        """Test seller/buyer addresses are flattened into the response schema."""
+        from app.api.v1.convert import _invoice_data_to_schema
+
+        data = InvoiceData(
+            invoice_number="RE-2024-001",
+            seller=Address(name="Muster GmbH", street="Hauptstr. 1", postal_code="10115", city="Berlin"),
+            seller_vat_id="DE123456789",
+            gross_amount=Decimal("1190.00"),
+            warnings=["Niedrige Extraktionsqualitaet"],
+        )
+
+        schema = _invoice_data_to_schema(data)
+
+        assert schema.invoice_number == "RE-2024-001"
+        assert schema.seller_name == "Muster GmbH"
+        assert schema.seller_postal_code == "10115"
+        assert schema.seller_vat_id == "DE123456789"
+        assert schema.buyer_name is None
+        assert schema.gross_amount == Decimal("1190.00")
+        assert schema.warnings == ["Niedrige Extraktionsqualitaet"]
+        assert schema.model_dump(mode="json")["seller_city"] == "Berlin"
+
+    def test_validation_result_from_response(self) -> None:
+        """Test validator responses convert into the conversion result schema."""
+        from app.schemas.conversion import ValidationResultSchema
+        from app.schemas.validation import ValidationError, ValidationResponse, ValidationSeverity
+
+        response = ValidationResponse(
+            id=uuid.uuid4(),
+            is_valid=False,
+            file_type="xrechnung",
+            file_hash="0" * 64,
+            error_count=1,
+            errors=[
+                ValidationError(
+                    severity=ValidationSeverity.ERROR,
+                    code="BR-DE-01",
+                    message_de="Zahlungsanweisungen fehlen",
+                )
+            ],
+            validator_version="fallback",
+            processing_time_ms=5,
+        )
+
+        result = ValidationResultSchema.model_validate(response)
+
+        assert result.is_valid is False
+        assert result.errors[0].severity == "error"
+        assert result.errors[0].code == "BR-DE-01"
+        assert result.warnings == []
+        assert result.processing_time_ms == 5
+
+    def test_apply_overrides(self) -> None:
+        """Test user overrides replace extracted values and create addresses."""
+        from app.api.v1.convert import _apply_overrides
+        from app.schemas.conversion import ConversionRequest
+
+        data = InvoiceData(invoice_number="OCR-001", net_amount=Decimal("100.00"))
+        request = ConversionRequest(
+            invoice_number="RE-001",
+            buyer_name="Kunde AG",
+            buyer_city="Hamburg",
+            net_amount=Decimal("0"),
+        )
+
+        result = _apply_overrides(data, request)
+
+        assert result.invoice_number == "RE-001"
+        assert result.net_amount == Decimal("0")
+        assert result.buyer == Address(name="Kunde AG", city="Hamburg")
+        assert result.seller is None
+
 
 class TestAmountParsing:
     """Tests for German number format parsing."""
@@ -411,3 +658,307 @@ class TestDateParsing:
         for text, expected in test_cases:
             data = extractor.extract_from_text(text)
             assert data.invoice_date == expected, f"Failed for: {text}"
+
+
+class TestConversionCache:
+    """Tests for the converted file store."""
+
+    @pytest.mark.asyncio
+    async def test_store_and_get_conversion(self) -> None:
+        """Test a stored conversion can be read back unchanged."""
+        conversion_id = str(uuid.uuid4())
+        conversion = CachedConversion(
+            content=b"%PDF-1.7 binary \x00\xff",
+            filename="zugferd_RE-001.pdf",
+            content_type="application/pdf",
+            xml_content=b"<rsm:CrossIndustryInvoice/>",
+            invoice_number="RE-001",
+            invoice_date="2024-01-15",
+            gross_amount="1190.00",
+        )
+
+        await store_conversion(conversion_id, conversion)
+
+        assert await get_conversion(conversion_id) == conversion
+
+    @pytest.mark.asyncio
+    async def test_get_unknown_conversion(self) -> None:
+        """Test an unknown conversion ID returns None."""
+        assert await get_conversion(str(uuid.uuid4())) is None
+
+    @pytest.mark.asyncio
+    async def test_delete_user_conversions(self) -> None:
+        """Test a user's conversions are removed while others are kept."""
+        user_id, other_user_id = str(uuid.uuid4()), str(uuid.uuid4())
+        owned_id, other_id = str(uuid.uuid4()), str(uuid.uuid4())
+        for conversion_id, owner in ((owned_id, user_id), (other_id, other_user_id)):
+            await store_conversion(
+                conversion_id,
+                CachedConversion(
+                    content=b"<Invoice/>",
+                    filename="xrechnung.xml",
+                    content_type="application/xml",
+                    user_id=owner,
+                ),
+            )
+
+        await delete_user_conversions(user_id)
+
+        assert await get_conversion(owned_id) is None
+        assert (await get_conversion(other_id)).user_id == other_user_id
+
+    @pytest.mark.asyncio
+    async def test_local_fallback_evicts_oldest(self) -> None:
+        """Test the in-process fallback store stays within its size bound."""
+        from app.core import conversion_cache
+
+        with (
+            patch.object(conversion_cache, "get_binary_redis", AsyncMock(side_effect=ConnectionError)),
+            patch.object(conversion_cache, "MAX_LOCAL_CONVERSIONS", 2),
+            patch.dict(conversion_cache._local_conversions, clear=True),
+        ):
+            for conversion_id in ("first", "second", "third"):
+                await store_conversion(
+                    conversion_id,
+                    CachedConversion(content=b"x", filename=f"{conversion_id}.xml", content_type="application/xml"),
+                )
+
+            assert await get_conversion("first") is None
+            assert (await get_conversion("third")).filename == "third.xml"
+            assert len(conversion_cache._local_conversions) == 2
+
+
+class TestConversionEndpoints:
+    """Tests for the conversion API endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_preview_rejects_oversized_upload(self, async_client: AsyncClient) -> None:
+        """Test uploads over 10 MB are rejected with 413."""
+        content = b"%PDF-1.4\n" + b"0" * (10 * 1024 * 1024)
+
+        response = await async_client.post(
+            "/api/v1/convert/preview",
+            files={"file": ("large.pdf", content, "application/pdf")},
+        )
+
+        assert response.status_code == 413
+
+    @pytest.mark.asyncio
+    async def test_oversized_request_rejected_before_body_is_parsed(self, async_client: AsyncClient) -> None:
+        """Test requests whose Content-Length exceeds the route limit get 413 before auth or parsing."""
+        content = b"%PDF-1.4\n" + b"0" * (11 * 1024 * 1024)
+
+        response = await async_client.post(
+            "/api/v1/convert/",
+            files={"file": ("large.pdf", content, "application/pdf")},
+        )
+        assert response.status_code == 413
+
+        # The batch endpoint allows several files per request
+        response = await async_client.post(
+            "/api/v1/convert/batch",
+            files=[("files", ("large.pdf", content, "application/pdf"))],
+        )
+        assert response.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_read_capped_without_known_size(self) -> None:
+        """Test uploads without a recorded size are still capped while reading."""
+        import io
+
+        from fastapi import HTTPException, UploadFile
+
+        from app.api.v1.convert import _read_capped
+
+        small = UploadFile(file=io.BytesIO(b"%PDF-1.4 klein"), filename="klein.pdf")
+        assert await _read_capped(small, limit=64) == b"%PDF-1.4 klein"
+
+        large = UploadFile(file=io.BytesIO(b"0" * 65), filename="gross.pdf")
+        with pytest.raises(HTTPException) as exc_info:
+            await _read_capped(large, limit=64)
+        assert exc_info.value.status_code == 413
+
+    @pytest.mark.asyncio
+    async def test_preview_rejects_mislabeled_upload(self, async_client: AsyncClient) -> None:
+        """Test files named .pdf without a PDF header are rejected with 400."""
+        response = await async_client.post(
+            "/api/v1/convert/preview",
+            files={"file": ("rechnung.pdf", b"<html>keine Rechnung</html>", "application/pdf")},
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Datei ist kein gueltiges PDF"
+
+    @pytest.mark.asyncio
+    async def test_send_email_uses_stored_invoice_summary(
+        self, async_client: AsyncClient, test_user: tuple
+    ) -> None:
+        """Test the email uses the invoice details stored with the conversion."""
+        _, token = test_user
+        conversion_id = str(uuid.uuid4())
+        await store_conversion(
+            conversion_id,
+            CachedConversion(
+                content=b"<Invoice/>",
+                filename="xrechnung_RE-MAIL-001.xml",
+                content_type="application/xml",
+                xml_content=b"<Invoice/>",
+                invoice_number="RE-MAIL-001",
+                invoice_date="2024-01-15",
+                gross_amount="595.00",
+            ),
+        )
+
+        with patch(
+            "app.services.email.service.email_service.send_invoice_email",
+            new=AsyncMock(return_value=True),
+        ) as send_mock:
+            response = await async_client.post(
+                f"/api/v1/convert/{conversion_id}/send-email",
+                json={"recipient_email": "kunde@example.com"},
+                headers={"Authorization": f"Bearer {token}"},
+            )
+
+        assert response.status_code == 200
+        kwargs = send_mock.await_args.kwargs
+        assert kwargs["invoice_number"] == "RE-MAIL-001"
+        assert kwargs["invoice_date"] == "2024-01-15"
+        assert kwargs["gross_amount"] == "595.00"
+        assert kwargs["currency"] == "EUR"
+
+    @pytest.mark.asyncio
+    async def test_send_email_counts_failed_recipients(
+        self, async_client: AsyncClient, test_user: tuple
+    ) -> None:
+        """Test a failing recipient does not prevent the other email."""
+        _, token = test_user
+        conversion_id = str(uuid.uuid4())
+        await store_conversion(
+            conversion_id,
+            CachedConversion(content=b"<Invoice/>", filename="xrechnung.xml", content_type="application/xml"),
+        )
+
+        async def send(to: str, **kwargs: object) -> bool:
+            if to == "kunde@example.com":
+                raise ConnectionError("SMTP unavailable")
+            return True
+
+        with patch(
+            "app.services.email.service.email_service.send_invoice_email",
+            new=AsyncMock(side_effect=send),
+        ) as send_mock:
+            response = await async_client.post(
+                f"/api/v1/convert/{conversion_id}/send-email",
+                json={"recipient_email": "kunde@example.com", "send_copy_to_self": True},
+                headers={"Authorization": f"Bearer {token}"},
+            )
+
+        assert response.status_code == 200
+        assert response.json()["emails_sent"] == 1
+        assert send_mock.await_count == 2
+
+
+class TestConversionLimits:
+    """Tests for conversion usage accounting."""
+
+    @pytest.mark.asyncio
+    async def test_reserve_counts_until_limit(
+        self, db_session: AsyncSession, test_pro_user: tuple
+    ) -> None:
+        """Test reservations count conversions and stop at the plan limit."""
+        user, _ = test_pro_user
+        user.conversions_this_month = user.get_conversion_limit() - 1
+        await db_session.commit()
+
+        await reserve_user_conversion(db_session, user)
+        assert user.conversions_this_month == user.get_conversion_limit()
+
+        with pytest.raises(UsageLimitError):
+            await reserve_user_conversion(db_session, user)
+
+        await release_user_conversions(db_session, user, 2)
+        await db_session.refresh(user)
+        assert user.conversions_this_month == user.get_conversion_limit() - 2
+
+    @pytest.mark.asyncio
+    async def test_free_plan_cannot_convert(
+        self, async_client: AsyncClient, db_session: AsyncSession, test_user: tuple
+    ) -> None:
+        """Test a plan without conversions gets 429 and nothing is counted."""
+        user, token = test_user
+
+        response = await async_client.post(
+            "/api/v1/convert/",
+            files={"file": ("rechnung.pdf", b"%PDF-1.4\n", "application/pdf")},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        assert response.status_code == 429
+        await db_session.refresh(user)
+        assert user.conversions_this_month == 0
+
+    @pytest.mark.asyncio
+    async def test_identical_upload_reuses_conversion(
+        self, async_client: AsyncClient, db_session: AsyncSession, test_pro_user: tuple
+    ) -> None:
+        """Test re-uploading the same PDF returns the earlier conversion uncounted."""
+        user, token = test_pro_user
+
+        import fitz
+        doc = fitz.open()
+        page = doc.new_page()
+        page.insert_text(
+            (72, 100),
+            "Rechnung Nr.: DEDUP-001\n"
+            "Datum: 15.01.2024\n"
+            "Netto: 100,00 EUR\n"
+            "MwSt 19%: 19,00 EUR\n"
+            "Gesamt: 119,00 EUR",
+            fontsize=11,
+        )
+
+        import io
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        doc.close()
+
+        fake_cache: dict[str, object] = {}
+
+        async def fake_get(key: str) -> object:
+            return fake_cache.get(key)
+
+        async def fake_set(key: str, value: object, ttl_seconds: int = 300) -> bool:
+            fake_cache[key] = value
+            return True
+
+        with (
+            patch("app.api.v1.convert.cache_get", new=fake_get),
+            patch("app.api.v1.convert.cache_set", new=fake_set),
+        ):
+            responses = [
+                await async_client.post(
+                    "/api/v1/convert/",
+                    files={"file": ("rechnung.pdf", buffer.getvalue(), "application/pdf")},
+                    headers={"Authorization": f"Bearer {token}"},
+                )
+                for _ in range(2)
+            ]
+
+        assert [response.status_code for response in responses] == [200, 200]
+        assert responses[0].json()["conversion_id"] == responses[1].json()["conversion_id"]
+        await db_session.refresh(user)
+        assert user.conversions_this_month == 1
+
+    def test_dedup_key_covers_overrides(self) -> None:
+        """Test overrides and options produce distinct dedup keys."""
+        from app.api.v1.convert import _dedup_key
+        from app.schemas.conversion import ConversionRequest
+
+        user = User(id=uuid.uuid4())
+        content = b"%PDF-1.7 rechnung"
+        plain = _dedup_key(user, "single", content, ConversionRequest())
+
+        assert plain == _dedup_key(user, "single", content, ConversionRequest())
+        assert plain != _dedup_key(user, "single", content, ConversionRequest(leitweg_id="04011000-1234512345-06"))
+        assert plain != _dedup_key(user, "batch", content, ConversionRequest())
+        assert plain != _dedup_key(User(id=uuid.uuid4()), "single", content, ConversionRequest())
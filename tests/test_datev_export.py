@@ -343,6 +343,21 @@ class TestDATEVExportEndpoint:
         # Check column headers are semicolon separated
         assert ";" in lines[1]
 
+    @pytest.mark.asyncio
+    async def test_export_uncompressed_has_content_length(
+        self, async_client: AsyncClient, test_steuerberater_user: tuple[User, str]
+    ) -> None:
+        """Test the buffered DATEV export sends Content-Length when not compressed."""
+        user, token = test_steuerberater_user
+        response = await async_client.get(
+            "/api/v1/export/datev/buchungsstapel",
+            params={"validation_ids": str(uuid.uuid4())},
+            headers={"Authorization": f"Bearer {token}", "Accept-Encoding": "identity"},
+        )
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert int(response.headers["content-length"]) == len(response.content)
+
     @pytest.mark.asyncio
     async def test_export_filename(
         self, async_client: AsyncClient, test_steuerberater_user: tuple[User, str]
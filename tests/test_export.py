@@ -6,7 +6,9 @@ from datetime import date
 import pytest
 from httpx import AsyncClient
 
+from app.models.client import Client
 from app.models.user import User
+from app.models.validation import FileType, ValidationLog
 from app.schemas.export import ExportFormat, ValidationStatus
 
 
@@ -140,6 +142,29 @@ class TestExportValidationsEndpoint:
         )
         assert response.status_code == 422
 
+    @pytest.mark.asyncio
+    async def test_export_validations_gzip_negotiation(
+        self, async_client: AsyncClient, test_steuerberater_user: tuple[User, str]
+    ) -> None:
+        """Test the export is gzip-compressed only when the client accepts it."""
+        user, token = test_steuerberater_user
+        response = await async_client.get(
+            "/api/v1/export/validations",
+            headers={"Authorization": f"Bearer {token}", "Accept-Encoding": "gzip"},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert response.content.decode("utf-8-sig").startswith("Validierungs-ID;")
+
+        response = await async_client.get(
+            "/api/v1/export/validations",
+            headers={"Authorization": f"Bearer {token}", "Accept-Encoding": "identity"},
+        )
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert response.content.decode("utf-8-sig").startswith("Validierungs-ID;")
+
 
 class TestExportClientsEndpoint:
     """Tests for clients export endpoint."""
@@ -208,6 +233,51 @@ class TestExportClientsEndpoint:
         assert response.status_code == 200
 
 
+class TestExportService:
+    """Tests for the CSV export service."""
+
+    @pytest.mark.asyncio
+    async def test_export_validations_streams_rows_in_batches(
+        self, db_session, test_steuerberater_user: tuple[User, str], monkeypatch
+    ) -> None:
+        """Test validations are streamed as header chunk plus one chunk per row batch."""
+        from app.services.export import csv as csv_export
+        from app.services.export.csv import ExportService
+
+        monkeypatch.setattr(csv_export, "EXPORT_BATCH_SIZE", 2)
+        user, _ = test_steuerberater_user
+        client = Client(user_id=user.id, name="Muster GmbH", client_number="M-001")
+        db_session.add(client)
+        await db_session.flush()
+        for i in range(3):
+            db_session.add(
+                ValidationLog(
+                    user_id=user.id,
+                    client_id=client.id,
+                    file_name=f"rechnung_{i}.xml",
+                    file_type=FileType.XRECHNUNG,
+                    file_hash=f"{i}" * 64,
+                    file_size_bytes=1000,
+                    is_valid=True,
+                    error_count=0,
+                    warning_count=0,
+                    info_count=0,
+                    processing_time_ms=100,
+                    validator_version="1.0.0",
+                )
+            )
+        await db_session.commit()
+
+        service = ExportService(db_session)
+        chunks = [chunk async for chunk in service.export_validations(user_id=user.id)]
+
+        assert len(chunks) == 3
+        assert chunks[0].startswith(ExportService.UTF8_BOM + "Validierungs-ID;")
+        content = "".join(chunks)
+        assert content.count("Muster GmbH") == 3
+        assert "rechnung_2.xml" in content
+
+
 class TestExportAccessControl:
     """Tests for export access control."""
 
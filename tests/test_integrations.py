@@ -1,9 +1,15 @@
 """Tests for third-party integration endpoints."""
 
+import json
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.encryption import encryption_service
+from app.models.integration import IntegrationSettings, IntegrationType
 from app.models.user import User
+from app.services.integrations.service import IntegrationService
 
 
 class TestIntegrationListEndpoint:
@@ -40,6 +46,39 @@ class TestIntegrationListEndpoint:
         )
         assert response.status_code == 200
 
+    @pytest.mark.asyncio
+    @pytest.mark.filterwarnings("error:Pydantic serializer warnings")
+    async def test_list_integrations_returns_stored_settings(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        test_pro_user: tuple[User, str],
+    ) -> None:
+        """Test stored integrations are listed with a masked config hint."""
+        user, token = test_pro_user
+        db_session.add(
+            IntegrationSettings(
+                user_id=user.id,
+                integration_type=IntegrationType.LEXOFFICE,
+                encrypted_config=encryption_service.encrypt(
+                    json.dumps({"api_key": "abcd-1234-5678-wxyz"})
+                ),
+            )
+        )
+        await db_session.flush()
+
+        response = await async_client.get(
+            "/api/v1/integrations/",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        assert response.status_code == 200
+        [item] = response.json()["items"]
+        assert item["integration_type"] == "lexoffice"
+        assert item["is_enabled"] is True
+        assert item["total_requests"] == 0
+        assert item["config_hint"] == "api_key: abcd...wxyz"
+
 
 class TestIntegrationCreateEndpoint:
     """Tests for creating integrations."""
@@ -135,6 +174,43 @@ class TestIntegrationCreateEndpoint:
         # 400 (webhook test failed) is expected since we don't have a real webhook
         assert response.status_code in [400, 201]
 
+    @pytest.mark.asyncio
+    @pytest.mark.filterwarnings("error:Pydantic serializer warnings")
+    async def test_create_and_update_integration_response(
+        self, async_client: AsyncClient, test_pro_user: tuple[User, str]
+    ) -> None:
+        """Test create and update return the persisted row without a reload."""
+        from unittest.mock import AsyncMock, patch
+
+        from app.services.integrations.notifications import notification_service
+
+        _, token = test_pro_user
+        headers = {"Authorization": f"Bearer {token}"}
+
+        with patch.object(notification_service, "test_webhook", AsyncMock(return_value=True)):
+            response = await async_client.post(
+                "/api/v1/integrations/slack",
+                json={"config": {"webhook_url": "https://hooks.slack.com/services/T00/B00/XXX"}},
+                headers=headers,
+            )
+
+        assert response.status_code == 201
+        created = response.json()
+        assert created["created_at"] is not None
+        assert created["updated_at"] is not None
+        assert created["config_hint"] == "webhook_url: ...hooks.slack.com/..."
+
+        response = await async_client.patch(
+            "/api/v1/integrations/slack",
+            json={"notify_on_valid": False},
+            headers=headers,
+        )
+
+        assert response.status_code == 200
+        assert response.json()["id"] == created["id"]
+        assert response.json()["notify_on_valid"] is False
+        assert response.json()["updated_at"] is not None
+
 
 class TestIntegrationUpdateEndpoint:
     """Tests for updating integrations."""
@@ -207,6 +283,36 @@ class TestIntegrationDeleteEndpoint:
         # 404 (not found) since integration doesn't exist
         assert response.status_code == 404
 
+    @pytest.mark.asyncio
+    @pytest.mark.filterwarnings("error:Pydantic serializer warnings")
+    async def test_delete_existing_integration(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        test_pro_user: tuple[User, str],
+    ) -> None:
+        """Test deleting a stored integration removes only that type."""
+        user, token = test_pro_user
+        headers = {"Authorization": f"Bearer {token}"}
+        for integration_type in (IntegrationType.LEXOFFICE, IntegrationType.SLACK):
+            db_session.add(
+                IntegrationSettings(
+                    user_id=user.id,
+                    integration_type=integration_type,
+                    encrypted_config=encryption_service.encrypt("{}"),
+                )
+            )
+        await db_session.flush()
+
+        response = await async_client.delete("/api/v1/integrations/lexoffice", headers=headers)
+        assert response.status_code == 204
+
+        response = await async_client.delete("/api/v1/integrations/lexoffice", headers=headers)
+        assert response.status_code == 404
+
+        response = await async_client.get("/api/v1/integrations/", headers=headers)
+        assert [i["integration_type"] for i in response.json()["items"]] == ["slack"]
+
 
 class TestIntegrationTestEndpoint:
     """Tests for testing integrations."""
@@ -295,6 +401,148 @@ class TestLexofficeEndpoints:
         )
         assert response.status_code == 422
 
+    @pytest.mark.asyncio
+    async def test_validate_lexoffice_invoices_not_configured(
+        self, async_client: AsyncClient, test_pro_user: tuple[User, str]
+    ) -> None:
+        """Test every requested invoice reports the missing integration."""
+        user, token = test_pro_user
+        response = await async_client.post(
+            "/api/v1/integrations/lexoffice/validate",
+            json={"invoice_ids": ["inv-1", "inv-2"]},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        assert response.status_code == 200
+        results = response.json()
+        assert [r["invoice_id"] for r in results] == ["inv-1", "inv-2"]
+        assert all(r["error_message"] == "Lexoffice-Integration nicht konfiguriert" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_get_invoices_fetches_concurrently_in_order(self) -> None:
+        """Test invoices are fetched with bounded concurrency, keeping input order."""
+        import asyncio
+        import uuid
+        from unittest.mock import AsyncMock, patch
+
+        from app.services.integrations.lexoffice import LexofficeService
+
+        running = peak = 0
+
+        async def fetch(headers: dict, invoice_id: str) -> dict:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            if invoice_id == "bad":
+                raise ValueError("nicht gefunden")
+            return {"voucherNumber": f"RE-{invoice_id}"}
+
+        service = LexofficeService()
+        with (
+            patch.object(service, "get_user_config", AsyncMock(return_value={"api_key": "key"})),
+            patch.object(service, "_fetch_invoice", side_effect=fetch),
+        ):
+            results = await service.get_invoices(uuid.uuid4(), ["1", "bad", "3", "4"])
+
+        assert results[0] == {"voucherNumber": "RE-1"}
+        assert isinstance(results[1], ValueError)
+        assert results[3] == {"voucherNumber": "RE-4"}
+        assert peak == LexofficeService.MAX_CONCURRENT_REQUESTS
+
+    def test_get_config_decrypts_once_per_ciphertext(self) -> None:
+        """Test stored configs are decrypted once and returned as copies."""
+        from unittest.mock import patch
+
+        integration = IntegrationSettings(
+            encrypted_config=encryption_service.encrypt(json.dumps({"api_key": "key"}))
+        )
+
+        with patch.object(
+            encryption_service, "decrypt", wraps=encryption_service.decrypt
+        ) as decrypt:
+            config = IntegrationService.get_config(integration)
+            config["api_key"] = "changed"
+            assert IntegrationService.get_config(integration) == {"api_key": "key"}
+
+        assert decrypt.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_http_client_is_shared_until_closed(self) -> None:
+        """Test outbound calls reuse one pooled client that is rebuilt after close."""
+        from app.core.http_client import close_http_client, get_http_client
+
+        client = get_http_client()
+        assert get_http_client() is client
+
+        await close_http_client()
+        assert client.is_closed
+        assert get_http_client() is not client
+        await close_http_client()
+
+
+class TestNotificationService:
+    """Tests for Slack/Teams notification delivery."""
+
+    @pytest.mark.asyncio
+    async def test_send_validation_notification_posts_concurrently(
+        self, db_session: AsyncSession, test_pro_user: tuple[User, str]
+    ) -> None:
+        """Test enabled webhooks are called together and their statistics recorded."""
+        import asyncio
+        import uuid
+        from unittest.mock import MagicMock, patch
+
+        import httpx
+
+        from app.services.integrations.notifications import notification_service
+
+        user, _ = test_pro_user
+        for integration_type, url in (
+            (IntegrationType.SLACK, "https://hooks.slack.com/x"),
+            (IntegrationType.TEAMS, "https://teams.example.com/x"),
+        ):
+            db_session.add(
+                IntegrationSettings(
+                    user_id=user.id,
+                    integration_type=integration_type,
+                    encrypted_config=encryption_service.encrypt(
+                        json.dumps({"webhook_url": url})
+                    ),
+                )
+            )
+        await db_session.flush()
+
+        running = peak = 0
+
+        async def post(url: str, **kwargs: object) -> httpx.Response:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return httpx.Response(500 if "teams" in url else 200)
+
+        client = MagicMock(post=post)
+        with patch(
+            "app.services.integrations.notifications.get_http_client", return_value=client
+        ):
+            results = await notification_service.with_db(db_session).send_validation_notification(
+                user_id=user.id,
+                validation_id=uuid.uuid4(),
+                file_name="rechnung.xml",
+                is_valid=False,
+                error_count=2,
+                warning_count=0,
+                info_count=0,
+            )
+
+        assert peak == 2
+        assert sorted(results) == [(IntegrationType.SLACK, True), (IntegrationType.TEAMS, False)]
+        integrations = await IntegrationService(db_session).list_integrations(user.id)
+        stats = {i.integration_type: (i.successful_requests, i.failed_requests) for i in integrations}
+        assert stats == {IntegrationType.SLACK: (1, 0), IntegrationType.TEAMS: (0, 1)}
+
 
 class TestIntegrationSchemas:
     """Tests for integration schemas."""
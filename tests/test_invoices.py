@@ -0,0 +1,234 @@
+"""Tests for invoice creator draft endpoints."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.invoice_draft import InvoiceDraft
+from app.models.user import User
+
+
+class TestInvoiceDraftEndpoints:
+    """Tests for invoice draft CRUD endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_draft_roundtrip(
+        self, async_client: AsyncClient, test_user: tuple[User, str]
+    ) -> None:
+        """Test invoice data saved on a draft is returned by get and list."""
+        _, token = test_user
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = await async_client.post(
+            "/api/v1/invoices/drafts/", json={"name": "Testrechnung"}, headers=headers
+        )
+        assert response.status_code == 201
+        draft = response.json()
+        assert draft["invoice_data"]["currency"] == "EUR"
+        assert draft["invoice_data"]["line_items"] == []
+
+        response = await async_client.patch(
+            f"/api/v1/invoices/drafts/{draft['id']}",
+            json={
+                "current_step": 2,
+                "invoice_data": {
+                    "invoice_number": "RE-2024-001",
+                    "seller": {"name": "Muster GmbH", "address": {"city": "Berlin"}},
+                },
+            },
+            headers=headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["invoice_data"]["seller"]["address"]["city"] == "Berlin"
+
+        response = await async_client.get(
+            f"/api/v1/invoices/drafts/{draft['id']}", headers=headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["current_step"] == 2
+        assert data["invoice_data"]["invoice_number"] == "RE-2024-001"
+        assert data["invoice_data"]["seller"]["name"] == "Muster GmbH"
+
+        response = await async_client.get("/api/v1/invoices/drafts/", headers=headers)
+        assert response.status_code == 200
+        drafts = response.json()["drafts"]
+        assert [d["id"] for d in drafts] == [draft["id"]]
+        assert drafts[0]["name"] == "Testrechnung"
+
+    @pytest.mark.asyncio
+    async def test_list_drafts_paginates(
+        self, async_client: AsyncClient, test_user: tuple[User, str]
+    ) -> None:
+        """Test drafts are listed page by page with the overall total."""
+        _, token = test_user
+        headers = {"Authorization": f"Bearer {token}"}
+        for i in range(3):
+            response = await async_client.post(
+                "/api/v1/invoices/drafts/", json={"name": f"Entwurf {i}"}, headers=headers
+            )
+            assert response.status_code == 201
+
+        first = await async_client.get(
+            "/api/v1/invoices/drafts/", params={"page_size": 2}, headers=headers
+        )
+        second = await async_client.get(
+            "/api/v1/invoices/drafts/", params={"page": 2, "page_size": 2}, headers=headers
+        )
+
+        assert first.status_code == 200
+        assert first.json()["total"] == 3
+        assert len(first.json()["drafts"]) == 2
+        assert second.json()["page"] == 2
+        assert len(second.json()["drafts"]) == 1
+        ids = {d["id"] for d in first.json()["drafts"] + second.json()["drafts"]}
+        assert len(ids) == 3
+
+        response = await async_client.get(
+            "/api/v1/invoices/drafts/", params={"page": 3, "page_size": 2}, headers=headers
+        )
+        assert response.status_code == 200
+        assert response.json()["drafts"] == []
+        assert response.json()["total"] == 3
+
+    @pytest.mark.asyncio
+    async def test_list_drafts_empty(
+        self, async_client: AsyncClient, test_user: tuple[User, str]
+    ) -> None:
+        """Test a user without drafts gets an empty first page."""
+        _, token = test_user
+        response = await async_client.get(
+            "/api/v1/invoices/drafts/", headers={"Authorization": f"Bearer {token}"}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"drafts": [], "total": 0, "page": 1, "page_size": 50}
+
+    @pytest.mark.asyncio
+    async def test_delete_draft(
+        self,
+        async_client: AsyncClient,
+        test_user: tuple[User, str],
+        test_pro_user: tuple[User, str],
+    ) -> None:
+        """Test a draft can only be deleted once and only by its owner."""
+        _, token = test_user
+        _, other_token = test_pro_user
+        headers = {"Authorization": f"Bearer {token}"}
+        response = await async_client.post(
+            "/api/v1/invoices/drafts/", json={"name": "Entwurf"}, headers=headers
+        )
+        url = f"/api/v1/invoices/drafts/{response.json()['id']}"
+
+        response = await async_client.delete(
+            url, headers={"Authorization": f"Bearer {other_token}"}
+        )
+        assert response.status_code == 404
+
+        response = await async_client.delete(url, headers=headers)
+        assert response.status_code == 200
+
+        response = await async_client.delete(url, headers=headers)
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_preview_invoice(
+        self, async_client: AsyncClient, test_user: tuple[User, str]
+    ) -> None:
+        """Test the draft preview returns the generated XML."""
+        _, token = test_user
+        headers = {"Authorization": f"Bearer {token}"}
+        response = await async_client.post(
+            "/api/v1/invoices/drafts/", json={"name": "Vorschau"}, headers=headers
+        )
+        draft_id = response.json()["id"]
+        await async_client.patch(
+            f"/api/v1/invoices/drafts/{draft_id}",
+            json={"invoice_data": {"invoice_number": "RE-2024-042"}},
+            headers=headers,
+        )
+
+        response = await async_client.get(
+            f"/api/v1/invoices/drafts/{draft_id}/preview", headers=headers
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/xml")
+        assert "RE-2024-042" in response.text
+
+    @pytest.mark.asyncio
+    async def test_draft_and_preview_revalidate_with_etag(
+        self, async_client: AsyncClient, test_user: tuple[User, str]
+    ) -> None:
+        """Test unchanged drafts answer a matching If-None-Match with 304."""
+        _, token = test_user
+        headers = {"Authorization": f"Bearer {token}"}
+        response = await async_client.post(
+            "/api/v1/invoices/drafts/", json={"name": "Entwurf"}, headers=headers
+        )
+        url = f"/api/v1/invoices/drafts/{response.json()['id']}"
+
+        for path in (url, f"{url}/preview"):
+            response = await async_client.get(path, headers=headers)
+            assert response.status_code == 200
+            etag = response.headers["etag"]
+            assert etag.startswith('W/"')
+            assert response.headers["cache-control"] == "private, no-cache"
+
+            response = await async_client.get(
+                path, headers={**headers, "If-None-Match": etag}
+            )
+            assert response.status_code == 304
+            assert response.content == b""
+            assert response.headers["etag"] == etag
+
+            response = await async_client.get(
+                path, headers={**headers, "If-None-Match": 'W/"veraltet"'}
+            )
+            assert response.status_code == 200
+
+
+class TestInvoiceDraftModel:
+    """Tests for the invoice draft model."""
+
+    @pytest.mark.asyncio
+    async def test_flush_loads_server_timestamps(
+        self, db_session: AsyncSession, test_user: tuple[User, str]
+    ) -> None:
+        """Test timestamps are returned by the flush, so no refresh is needed."""
+        user, _ = test_user
+        draft = InvoiceDraft(user_id=user.id, invoice_data={})
+        db_session.add(draft)
+        await db_session.flush()
+
+        assert not inspect(draft).expired_attributes
+        assert draft.created_at is not None
+
+        draft.current_step = 2
+        await db_session.flush()
+
+        assert not inspect(draft).expired_attributes
+        assert draft.updated_at is not None
+
+
+class TestXRechnungGenerator:
+    """Tests for the invoice creator XML generator."""
+
+    def test_generate_keeps_note_text_intact(self) -> None:
+        """Test the XML has a declaration and multi-line notes are not altered."""
+        from xml.etree.ElementTree import fromstring
+
+        from app.schemas.invoice import InvoiceData
+        from app.services.invoice_creator import xrechnung_generator
+
+        note = "Zeile 1\n\nZeile 3"
+        xml = xrechnung_generator.generate(
+            InvoiceData(invoice_number="RE-2024-007", note=note)
+        )
+
+        assert xml.startswith('<?xml version="1.0" encoding="UTF-8"?>\n<Invoice ')
+        root = fromstring(xml.encode("utf-8"))
+        ns = {"cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2"}
+        assert root.findtext("cbc:ID", namespaces=ns) == "RE-2024-007"
+        assert root.findtext("cbc:Note", namespaces=ns) == note
@@ -0,0 +1,228 @@
+"""Tests for organization/team endpoints."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.organization import (
+    Organization,
+    OrganizationInvitation,
+    OrganizationMember,
+    OrganizationRole,
+    hash_invitation_token,
+)
+from app.models.user import User
+from app.services.email import email_service
+
+
+class TestOrganizationEndpoints:
+    """Tests for organization and member endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_list_organizations_unauthorized(self, async_client: AsyncClient) -> None:
+        """Test listing organizations without authentication fails."""
+        response = await async_client.get("/api/v1/organizations/")
+        assert response.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_organization_responses(
+        self, async_client: AsyncClient, test_user: tuple[User, str]
+    ) -> None:
+        """Test a created organization is returned by create, list, get and members."""
+        user, token = test_user
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = await async_client.post(
+            "/api/v1/organizations/",
+            json={"name": "Muster Kanzlei", "description": "Team"},
+            headers=headers,
+        )
+        assert response.status_code == 201
+        org = response.json()
+        assert org["slug"].startswith("muster-kanzlei-")
+        assert org["owner_id"] == str(user.id)
+        assert org["member_count"] == 1
+
+        response = await async_client.get("/api/v1/organizations/", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["total"] == 1
+        assert response.json()["organizations"][0] == org
+
+        response = await async_client.get(f"/api/v1/organizations/{org['id']}", headers=headers)
+        assert response.status_code == 200
+        assert response.json() == org
+
+        response = await async_client.get(
+            f"/api/v1/organizations/{org['id']}/members", headers=headers
+        )
+        assert response.status_code == 200
+        [member] = response.json()["members"]
+        assert member["user_id"] == str(user.id)
+        assert member["email"] == user.email
+        assert member["role"] == "owner"
+        assert member["joined_at"] is not None
+
+    @pytest.mark.asyncio
+    async def test_organization_permissions(
+        self,
+        async_client: AsyncClient,
+        test_user: tuple[User, str],
+        test_pro_user: tuple[User, str],
+    ) -> None:
+        """Test owners can update, other users get 403 and unknown ids 404."""
+        _, token = test_user
+        _, other_token = test_pro_user
+        headers = {"Authorization": f"Bearer {token}"}
+        response = await async_client.post(
+            "/api/v1/organizations/", json={"name": "Muster Kanzlei"}, headers=headers
+        )
+        url = f"/api/v1/organizations/{response.json()['id']}"
+
+        response = await async_client.patch(url, json={"name": "Neuer Name"}, headers=headers)
+        assert response.status_code == 200
+        assert response.json()["name"] == "Neuer Name"
+        assert response.json()["member_count"] == 1
+
+        response = await async_client.get(
+            url, headers={"Authorization": f"Bearer {other_token}"}
+        )
+        assert response.status_code == 403
+
+        response = await async_client.get(
+            "/api/v1/organizations/00000000-0000-0000-0000-000000000000", headers=headers
+        )
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_invite_and_accept_member(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user: tuple[User, str],
+        test_pro_user: tuple[User, str],
+    ) -> None:
+        """Test duplicate invitations and memberships are rejected."""
+        _, token = test_user
+        invitee, invitee_token = test_pro_user
+        headers = {"Authorization": f"Bearer {token}"}
+        response = await async_client.post(
+            "/api/v1/organizations/", json={"name": "Muster Kanzlei"}, headers=headers
+        )
+        members_url = f"/api/v1/organizations/{response.json()['id']}/members"
+
+        with patch.object(email_service, "send_invitation_email", AsyncMock(return_value=True)) as send:
+            response = await async_client.post(
+                members_url, json={"email": invitee.email}, headers=headers
+            )
+        assert response.status_code == 201
+        assert response.json()["is_valid"] is True
+        send.assert_awaited_once()
+        assert send.await_args.kwargs["to"] == invitee.email
+        invite_token = send.await_args.kwargs["invite_url"].rsplit("/", 1)[-1]
+
+        response = await async_client.post(
+            members_url, json={"email": invitee.email}, headers=headers
+        )
+        assert response.status_code == 400
+        assert "Einladung" in response.json()["detail"]
+
+        token_hash = await db_session.scalar(
+            select(OrganizationInvitation.token_hash).where(
+                OrganizationInvitation.email == invitee.email
+            )
+        )
+        assert token_hash == hash_invitation_token(invite_token)
+        assert token_hash != invite_token
+
+        response = await async_client.get(
+            f"/api/v1/organizations/invitations/{invite_token}"
+        )
+        assert response.status_code == 200
+        response = await async_client.post(
+            f"/api/v1/organizations/invitations/{invite_token}/accept",
+            headers={"Authorization": f"Bearer {invitee_token}"},
+        )
+        assert response.status_code == 200
+
+        response = await async_client.post(
+            members_url, json={"email": invitee.email}, headers=headers
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Benutzer ist bereits Mitglied"
+
+        response = await async_client.get(members_url, headers=headers)
+        assert response.json()["total"] == 2
+
+        response = await async_client.get("/api/v1/organizations/", headers=headers)
+        assert response.json()["organizations"][0]["member_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_list_organizations_paginates(
+        self, async_client: AsyncClient, test_user: tuple[User, str]
+    ) -> None:
+        """Test organizations are listed by name, page by page, with the total."""
+        _, token = test_user
+        headers = {"Authorization": f"Bearer {token}"}
+        for name in ("Gamma GmbH", "Alpha GmbH", "Beta GmbH"):
+            response = await async_client.post(
+                "/api/v1/organizations/", json={"name": name}, headers=headers
+            )
+            assert response.status_code == 201
+
+        pages = [
+            (
+                await async_client.get(
+                    "/api/v1/organizations/",
+                    params={"page": page, "page_size": 2},
+                    headers=headers,
+                )
+            ).json()
+            for page in (1, 2, 3)
+        ]
+
+        assert [p["total"] for p in pages] == [3, 3, 3]
+        assert [o["name"] for o in pages[0]["organizations"]] == ["Alpha GmbH", "Beta GmbH"]
+        assert [o["name"] for o in pages[1]["organizations"]] == ["Gamma GmbH"]
+        assert pages[2]["organizations"] == []
+
+    @pytest.mark.asyncio
+    async def test_invitation_email_escapes_user_input(self) -> None:
+        """Test inviter and organization names cannot inject HTML."""
+        with patch.object(email_service, "send_email", AsyncMock(return_value=True)) as send:
+            await email_service.send_invitation_email(
+                to="neu@example.com",
+                inviter="<script>alert(1)</script>",
+                organization_name="Muster & Partner <b>",
+                role="Member",
+                invite_url="https://example.com/einladung/abc",
+            )
+
+        html_content = send.await_args.args[2]
+        assert "<script>" not in html_content
+        assert "&lt;script&gt;" in html_content
+        assert "Muster &amp; Partner &lt;b&gt;" in html_content
+
+
+class TestOrganizationModel:
+    """Tests for the organization model."""
+
+    @pytest.mark.asyncio
+    async def test_flush_loads_server_timestamps(
+        self, db_session: AsyncSession, test_user: tuple[User, str]
+    ) -> None:
+        """Test timestamps are returned by the flush, so no refresh is needed."""
+        user, _ = test_user
+        org = Organization(name="Muster Kanzlei", slug="muster-kanzlei", owner_id=user.id)
+        member = OrganizationMember(
+            organization=org, user_id=user.id, role=OrganizationRole.OWNER
+        )
+        db_session.add_all([org, member])
+        await db_session.flush()
+
+        assert not inspect(org).expired_attributes
+        assert org.created_at is not None
+        assert org.updated_at is not None
+        assert member.organization_id == org.id
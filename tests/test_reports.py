@@ -76,6 +76,41 @@ class TestReportPDFEndpoint:
         # German error message expected
         assert "nicht gefunden" in data["detail"] or "abgelaufen" in data["detail"]
 
+    @pytest.mark.asyncio
+    async def test_download_pdf_cached_report(
+        self, async_client: AsyncClient
+    ) -> None:
+        """Test downloading the PDF of a cached validation result."""
+        from datetime import datetime
+
+        from app.core.cache import cache_validation_result
+        from app.schemas.validation import ValidationResponse
+
+        result = ValidationResponse(
+            id=uuid.uuid4(),
+            is_valid=True,
+            file_type="xrechnung",
+            file_hash="abc123def456",
+            error_count=0,
+            warning_count=0,
+            info_count=0,
+            errors=[],
+            warnings=[],
+            infos=[],
+            validator_version="1.5.0",
+            processing_time_ms=150,
+            validated_at=datetime.now(UTC),
+        )
+        cache_validation_result(result)
+
+        response = await async_client.get(f"/api/v1/reports/{result.id}/pdf")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/pdf"
+        assert response.headers["content-length"] == str(len(response.content))
+        assert f"validierungsbericht-{result.id}.pdf" in response.headers["content-disposition"]
+        assert response.content.startswith(b"%PDF")
+
 
 class TestReportEndpointAuthentication:
     """Tests for report endpoint authentication behavior."""